@@ -1,4 +1,19 @@
 import molecule
+import hashlib
+import sys
+from array import array
+
+try: #numpy is only needed for the numpy rendering engine, and makes structure_hash faster
+	import numpy as np
+except ImportError:
+	np = None
+
+if np is not None: #the C structs as numpy dtypes, aligned the same way the compiler lays the structs out
+	atom_dtype = np.dtype([("element", "S3"), ("code", "u1"), ("x", "f8"), ("y", "f8"), ("z", "f8")], align=True)
+	bond_dtype = np.dtype([("a1", "u4"), ("a2", "u4"), ("epairs", "u1"), ("atoms", np.uintp),
+		("x1", "f8"), ("x2", "f8"), ("y1", "f8"), ("y2", "f8"), ("z", "f8"), ("len", "f8"), ("dx", "f8"), ("dy", "f8")], align=True)
+	if atom_dtype.itemsize != molecule.ATOM_SIZE or bond_dtype.itemsize != molecule.BOND_SIZE:
+		atom_dtype = bond_dtype = None #the views are not used if the layout does not match
 
 header = """<svg version="1.1" width="1000" height="1000" xmlns="http://www.w3.org/2000/svg">"""
 footer = """</svg>"""
@@ -6,6 +21,43 @@ footer = """</svg>"""
 offsetx = 500
 offsety = 500
 
+class ElementStyles():
+	#the radius, colour and gradient of each element used to render atoms, built once from the Elements table
+	#version is bumped by the owner every time the Elements table changes so renders can be cached against it
+	def __init__(self, radius=None, element_name=None, gradients="", version=0):
+		self.radius = radius if radius is not None else {} #element code -> radius
+		self.element_name = element_name if element_name is not None else {} #element code -> element name (the gradient id)
+		self.gradients = gradients #radial gradient definitions for every element
+		self.version = version
+		self.header = header + gradients #the svg header is built once, not appended to on every render
+
+		#(radius, colour) of every element code, so the style of an atom is one list index instead of two dict lookups
+		self.table = [(float(self.radius.get(symbol, 25)), self.element_name.get(symbol, "000000"))
+			for symbol in map(molecule.element_symbol, range(molecule.ELEMENT_CODES))]
+		self.fills = [f'" r="{r}" fill="#{color}"/>\n' for r, color in self.table] #the end of a circle of each code, for the numpy engine
+
+	def lookup(self, element, code): #the (radius, colour) of an atom, elements outside the periodic table have code 0
+		if 0 < code < len(self.table):
+			return self.table[code]
+		return float(self.radius.get(element, 25)), self.element_name.get(element, "000000")
+
+class RenderOptions():
+	#how Molecule.svg lays out and trims a molecule, the defaults render every atom and bond at the fixed scale and offset
+	def __init__(self, width=1000, height=1000, fit=False, padding=20, cull=False, min_size=0, occlusion=False, precision=2, compact=False):
+		self.width = width #size of the svg canvas in pixels
+		self.height = height
+		self.fit = fit #scale and centre the molecule to fill the canvas instead of the fixed x100 scale and offset
+		self.padding = padding #pixels kept clear around the molecule when it is fit
+		self.cull = cull #leave out atoms and bonds that are entirely off the canvas
+		self.min_size = min_size #leave out atoms with a radius and bonds with a width smaller than this many pixels
+		self.occlusion = occlusion #leave out atoms entirely hidden behind atoms drawn in front of them
+		self.precision = precision #decimal places of every coordinate
+		self.compact = compact #draw each atom as a <use> of one circle per element and drop trailing zeros from numbers
+
+	def header(self, styles): #the svg header for this canvas size with the element gradients
+		fill = ' fill="green"' if self.compact else '' #compact bonds inherit their colour instead of repeating it
+		return f'<svg version="1.1" width="{self.width}" height="{self.height}" xmlns="http://www.w3.org/2000/svg"{fill}>' + styles.gradients
+
 class Atom():
 	def __init__(self, atom): #atom is the C struct atom
 		self.atom = atom
@@ -14,22 +66,13 @@ class Atom():
 	def __str__(self): #return the atom as a string
 		return f"Atom: element={self.atom.element}, x={self.atom.x}, y={self.atom.y}, z={self.atom.z}"
     
-	def svg(self): #return the atom as an svg circle
-		self.atom.x *= 100
-		self.atom.x += offsetx
-		self.atom.y *= 100
-		self.atom.y += offsety
-		try:
-			self.atom.z = radius[self.atom.element]
-		except KeyError:
-			self.atom.z = 25
-   
-		try:
-			self.atom.color = element_name[self.atom.element]
-		except KeyError:
-			self.atom.color = "000000"
+	def svg(self, styles): #return the atom as an svg circle, styles is an ElementStyles
+		#the screen position is computed without writing it back to the C struct, so a molecule can be rendered any number of times
+		x = (self.atom.x * 100) + offsetx
+		y = (self.atom.y * 100) + offsety
+		r, color = styles.lookup(self.atom.element, self.atom.code)
 		
-		return f'  <circle cx="{self.atom.x:.2f}" cy="{self.atom.y:.2f}" r="{self.atom.z}" fill="#{self.atom.color}"/>\n'
+		return f'  <circle cx="{x:.2f}" cy="{y:.2f}" r="{r}" fill="#{color}"/>\n'
 
 class Bond():
 	def __init__(self, bond): #bond is the C struct bond
@@ -63,7 +106,17 @@ class Molecule(molecule.molecule):
 
 		return "".join([str(d) for d in display]) #return the list as a string
 	
-	def svg(self):
+	def svg(self, styles=None, engine="python", options=None): #styles is the ElementStyles to render with, elements default to black when it is None
+		#engine "numpy" renders the same svg from coordinates pulled out in bulk, which is much faster for large molecules
+		#options is a RenderOptions for fitting, culling and level of detail, None renders everything at the fixed scale
+		if styles is None:
+			styles = ElementStyles()
+		if options is not None:
+			return _svg_options(self.drawing_order(engine), styles, options)
+		if engine == "numpy":
+			return _svg_numpy(self, styles)
+		if engine != "python":
+			raise ValueError(f"unknown rendering engine '{engine}'")
 		a1 = []
 		b1 = []
 		svgList = []
@@ -76,31 +129,389 @@ class Molecule(molecule.molecule):
 
 		while a1 and b1: #sort the lists
 			if a1[0].z < b1[0].z:
-				svgList.append(a1[0].svg())
+				svgList.append(a1[0].svg(styles))
 				a1.pop(0) #remove the first element from the list
 			else:
 				svgList.append(b1[0].svg())
 				b1.pop(0)
 
-		svgList.extend([a.svg() for a in a1]) #add the remaining elements to the list
+		svgList.extend([a.svg(styles) for a in a1]) #add the remaining elements to the list
 		svgList.extend([b.svg() for b in b1])
 
-		return header + "".join(svgList) + footer #return the list as a string with the header and footer
-
-	def parse(self, fileObj): #parses the file
-		lines = fileObj.readlines() #reads the file
-		num_atoms, num_bonds = map(int, lines[3].split()[:2]) #gets the number of atoms and bonds
-
-		for i in range(num_atoms): #appends the atoms to the molecule
-			x = float(lines[i+4].split()[0]) #first number in the current line is the x coordinate
-			y = float(lines[i+4].split()[1])
-			z = float(lines[i+4].split()[2])
-			element = lines[i+4].split()[3]
-			self.append_atom(element, x, y, z)
-
-		for i in range(num_bonds): #appends the bonds to the molecule
-			a1 = int(lines[i+4+num_atoms].split()[0])
-			a2 = int(lines[i+4+num_atoms].split()[1])
-			epairs = int(lines[i+4+num_atoms].split()[2])
-			self.append_bond(a1-1, a2-1, epairs) 
-		#return molecule
+		return styles.header + "".join(svgList) + footer #return the list as a string with the header and footer
+
+	def drawing_order(self, engine="python"): #the atoms and bonds in the order Molecule.svg draws them
+		#atoms are ("atom", x, y, element, code) and bonds are ("bond", x1, y1, x2, y2, dx, dy), in Angstroms
+		if engine == "numpy":
+			_require_views()
+			atoms = self.atoms_array()[self.atom_order()]
+			bonds = self.bonds_array()[self.bond_order()]
+			az = np.maximum.accumulate(atoms["z"]) if len(atoms) else atoms["z"]
+			bz = np.maximum.accumulate(bonds["z"]) if len(bonds) else bonds["z"]
+			order = np.argsort(np.concatenate((bz, az)), kind="stable")
+			items = [("bond",) + b for b in zip(*(bonds[f].tolist() for f in ("x1", "y1", "x2", "y2", "dx", "dy")))]
+			items += [("atom", x, y, e.decode(), c) for x, y, e, c in zip(*(atoms[f].tolist() for f in ("x", "y", "element", "code")))]
+			return [items[i] for i in order.tolist()]
+		if engine != "python":
+			raise ValueError(f"unknown rendering engine '{engine}'")
+
+		items = []
+		a, b = 0, 0
+		while a < self.atom_no or b < self.bond_no: #the same merge as Molecule.svg
+			if b == self.bond_no or (a < self.atom_no and self.get_atom(a).z < self.get_bond(b).z):
+				atom = self.get_atom(a)
+				items.append(("atom", atom.x, atom.y, atom.element, atom.code))
+				a += 1
+			else:
+				bond = self.get_bond(b)
+				items.append(("bond", bond.x1, bond.y1, bond.x2, bond.y2, bond.dx, bond.dy))
+				b += 1
+		return items
+
+	def atoms_array(self): #the atoms as a numpy structured array, a view of the C array with no copy
+		#it keeps the molecule alive, and while it (or any view of the molecule) exists, growing the molecule raises BufferError
+		_require_views()
+		return np.frombuffer(self.atoms_view(), dtype=atom_dtype)
+
+	def bonds_array(self): #the bonds as a numpy structured array, a view of the C array with no copy
+		_require_views()
+		return np.frombuffer(self.bonds_view(), dtype=bond_dtype)
+
+	def atom_order(self): #atom_ptrs as indices, atom_ptrs[i] is atoms_array()[atom_order()[i]]
+		_require_views()
+		atoms, bonds = self.address()
+		return (np.frombuffer(self.atom_ptrs_view(), dtype=np.uintp) - atoms) // molecule.ATOM_SIZE
+
+	def bond_order(self): #bond_ptrs as indices into bonds_array()
+		_require_views()
+		atoms, bonds = self.address()
+		return (np.frombuffer(self.bond_ptrs_view(), dtype=np.uintp) - bonds) // molecule.BOND_SIZE
+
+	def frames(self, steps, axis="y", styles=None, engine="python"): #yields steps svgs turning the molecule a full turn around axis
+		#the molecule is rotated in place between frames, so it is only loaded once for the whole turntable
+		angle = 360 / steps
+		rotation = {"x": (angle, 0, 0), "y": (0, angle, 0), "z": (0, 0, angle)}[axis]
+		for i in range(steps):
+			self.sort()
+			yield self.svg(styles, engine)
+			self.rotate(*rotation)
+
+	def parse(self, fileObj, perceive=True): #parses the first record of an sdf/mol file, one line at a time
+		#a record with atoms but no bonds, e.g. a coordinate dump, gets its bonds from the covalent radii of its atoms unless perceive is False
+		if not isinstance(fileObj, _LineReader):
+			fileObj = _LineReader(fileObj)
+		record = _parse_record(fileObj)
+		if record is None:
+			raise ParseError("file is empty", fileObj.lineno)
+		self.load(*record[1:]) #fills the molecule in one C call
+		if perceive and self.bond_no == 0:
+			self.perceive_bonds()
+		return self #return molecule
+
+	def structure_hash(self): #the structure_hash of the molecule, kept until the molecule is changed
+		if getattr(self, "hash", None) is None:
+			coords, elements, bonds = self.pack() #raw bytes of the C arrays
+			self.hash = structure_hash(memoryview(coords).cast('d'), elements, memoryview(bonds).cast('I'))
+		return self.hash
+
+	def bounds(self): #(min x, min y, min z, max x, max y, max z) of the atoms, None if there are none
+		if self.atom_no == 0:
+			return None
+		coords = memoryview(self.pack()[0]).cast('d')
+		if np is not None:
+			xyz = np.frombuffer(coords, dtype=np.float64).reshape(-1, 3)
+			return tuple(xyz.min(axis=0).tolist() + xyz.max(axis=0).tolist())
+		return tuple(min(coords[i::3]) for i in range(3)) + tuple(max(coords[i::3]) for i in range(3))
+
+	def element_counts(self): #{element: number of atoms of it}
+		elements = self.pack()[1]
+		if np is not None:
+			names, counts = np.unique(np.frombuffer(elements, dtype="S3"), return_counts=True)
+			return {name.decode(): int(count) for name, count in zip(names.tolist(), counts.tolist())}
+		counts = {}
+		for i in range(0, len(elements), 3):
+			name = elements[i:i+3].rstrip(b"\0").decode()
+			counts[name] = counts.get(name, 0) + 1
+		return counts
+
+	def rotate(self, xdeg, ydeg, zdeg): #moving the atoms changes the hash of the molecule
+		self.hash = None
+		super().rotate(xdeg, ydeg, zdeg)
+
+	def xform(self, xform_matrix):
+		self.hash = None
+		super().xform(xform_matrix)
+
+	def append_atom(self, element, x, y, z): #so does every new atom or bond
+		self.hash = None
+		super().append_atom(element, x, y, z)
+
+	def append_bond(self, a1, a2, epairs):
+		self.hash = None
+		super().append_bond(a1, a2, epairs)
+
+	def load(self, coords, elements, bonds):
+		self.hash = None
+		super().load(coords, elements, bonds)
+
+	def perceive_bonds(self, tolerance=0.45, radii=None):
+		self.hash = None
+		return super().perceive_bonds(tolerance, radii)
+
+def _require_views(): #the numpy views need numpy and a struct layout numpy can describe
+	if np is None:
+		raise ImportError("numpy views of a molecule need numpy installed")
+	if atom_dtype is None:
+		raise RuntimeError("the atom and bond structs are not laid out the way numpy expects")
+
+def _svg_numpy(mol, styles): #vectorized version of Molecule.svg, the output is byte for byte the same
+	#reads the C arrays through zero copy views instead of a SWIG getter per value
+	atoms = mol.atoms_array()[mol.atom_order()] #atoms in atom_ptrs order, the same math as Atom.svg
+	ax = atoms["x"] * 100 + offsetx
+	ay = atoms["y"] * 100 + offsety
+	codes = atoms["code"]
+	fills = [styles.fills[code] for code in codes.tolist()] #the style of each atom is an index into the table of its code
+	for i in np.flatnonzero(codes == 0).tolist(): #elements outside the periodic table are looked up by name
+		r, color = styles.lookup(atoms["element"][i].decode(), 0)
+		fills[i] = f'" r="{r}" fill="#{color}"/>\n'
+	atomSVG = [f'  <circle cx="{x:.2f}" cy="{y:.2f}{fill}' for x, y, fill in zip(ax.tolist(), ay.tolist(), fills)]
+
+	#bonds in bond_ptrs order, the corners use the coordinates compute_coords already stored, the same math as Bond.svg
+	bonds = mol.bonds_array()[mol.bond_order()]
+	x1 = bonds["x1"] * 100 + offsetx
+	y1 = bonds["y1"] * 100 + offsety
+	x2 = bonds["x2"] * 100 + offsetx
+	y2 = bonds["y2"] * 100 + offsety
+	dx = bonds["dx"] * 10
+	dy = bonds["dy"] * 10
+	corners = np.column_stack((x1 - dy, y1 + dx, x1 + dy, y1 - dx, x2 + dy, y2 - dx, x2 - dy, y2 + dx))
+	bondSVG = ['  <polygon points="%.2f,%.2f %.2f,%.2f %.2f,%.2f %.2f,%.2f" fill="green"/>\n' % tuple(c) for c in corners.tolist()]
+
+	#merge by z with one stable argsort, bonds go first on ties like the merge in Molecule.svg
+	#the running maximum makes this match that merge even when the molecule has not been sorted
+	az = np.maximum.accumulate(atoms["z"]) if len(atoms) else atoms["z"]
+	bz = np.maximum.accumulate(bonds["z"]) if len(bonds) else bonds["z"]
+	order = np.argsort(np.concatenate((bz, az)), kind="stable")
+	svgList = bondSVG + atomSVG
+	return styles.header + "".join([svgList[i] for i in order.tolist()]) + footer
+
+def structure_hash(coords, elements, bonds): #sha256 of a molecule packed the way Molecule.load takes it
+	#the same for any order the atoms and bonds are listed in: atoms are sorted by element and coordinates,
+	#which are rounded to the 4 decimal places sdf files store, and bonds are kept as the sorted positions of their atoms
+	#both paths hash the same bytes, numpy only makes it faster
+	atom_no = len(elements) // 3
+	elements = bytes(elements)
+	if np is not None:
+		xyz = np.rint(np.asarray(coords, dtype=np.float64).reshape(atom_no, 3) * 10000).astype("<i8")
+		names = np.frombuffer(elements, dtype="S3")
+		order = np.lexsort((xyz[:, 2], xyz[:, 1], xyz[:, 0], names))
+		rank = np.empty(atom_no, dtype=np.int64) #the position of each atom in the sorted order
+		rank[order] = np.arange(atom_no)
+		pairs = np.asarray(bonds, dtype=np.uint32).reshape(-1, 3)
+		a1, a2 = rank[pairs[:, 0]], rank[pairs[:, 1]]
+		bondArray = np.stack((np.minimum(a1, a2), np.maximum(a1, a2), pairs[:, 2])).T.astype("<u4")
+		bondArray = bondArray[np.lexsort((bondArray[:, 2], bondArray[:, 1], bondArray[:, 0]))]
+		parts = (names[order].tobytes(), xyz[order].tobytes(), bondArray.tobytes())
+	else:
+		xyz = [round(value * 10000) for value in coords]
+		atoms = [(elements[i*3:i*3+3], xyz[i*3], xyz[i*3+1], xyz[i*3+2]) for i in range(atom_no)]
+		order = sorted(range(atom_no), key=atoms.__getitem__)
+		rank = [0] * atom_no
+		for position, i in enumerate(order):
+			rank[i] = position
+		bondList = sorted((min(rank[bonds[i]], rank[bonds[i+1]]), max(rank[bonds[i]], rank[bonds[i+1]]), bonds[i+2]) for i in range(0, len(bonds), 3))
+		xyzArray = array('q', (value for i in order for value in atoms[i][1:]))
+		bondArray = array('I', (value for bond in bondList for value in bond))
+		if sys.byteorder == "big": #hashed little-endian like the numpy path
+			xyzArray.byteswap()
+			bondArray.byteswap()
+		parts = (b"".join(atoms[i][0] for i in order), xyzArray.tobytes(), bondArray.tobytes())
+
+	digest = hashlib.sha256()
+	for part in parts:
+		digest.update(len(part).to_bytes(8, "little")) #so the boundaries between the parts are hashed too
+		digest.update(part)
+	return digest.hexdigest()
+
+def _svg_options(items, styles, options): #renders items from Molecule.drawing_order with a RenderOptions
+	p = options.precision
+	scale, ox, oy = 100, offsetx, offsety
+	atoms = [item for item in items if item[0] == "atom"]
+	if options.fit and atoms: #scale the bounding box of the atoms to the canvas, keeping its aspect ratio
+		xs = [item[1] for item in atoms]
+		ys = [item[2] for item in atoms]
+		margin = 2 * max(styles.lookup(item[3], item[4])[0] for item in atoms) / 100 #room for the largest atom, radii scale by scale/100
+		width = max(max(xs) - min(xs) + margin, 1e-9)
+		height = max(max(ys) - min(ys) + margin, 1e-9)
+		scale = min((options.width - 2 * options.padding) / width, (options.height - 2 * options.padding) / height)
+		ox = options.width / 2 - (max(xs) + min(xs)) / 2 * scale
+		oy = options.height / 2 - (max(ys) + min(ys)) / 2 * scale
+	zoom = scale / 100 #radii and bond widths scale with the molecule, so they are unchanged at the fixed scale
+
+	def offscreen(left, top, right, bottom):
+		return options.cull and (right < 0 or bottom < 0 or left > options.width or top > options.height)
+
+	num = _compact_number if options.compact else lambda value, p: f"{value:.{p}f}"
+	symbols = {} #(radius, colour) -> id of a circle in <defs>, shared by every atom drawn the same, for compact output
+	covered = set() if options.occlusion else None #grid cells entirely inside an atom drawn in front
+	if atoms: #cells small enough that the smallest atom covers a few whole cells
+		cell = max(min(styles.lookup(item[3], item[4])[0] for item in atoms) * zoom / 1.5, 0.5)
+	svgList = []
+	for item in reversed(items): #front to back, so everything in front of an atom is known when it is reached
+		if item[0] == "atom":
+			x = item[1] * scale + ox
+			y = item[2] * scale + oy
+			radius, color = styles.lookup(item[3], item[4])
+			r = round(radius * zoom, p)
+			if r < options.min_size or offscreen(x - r, y - r, x + r, y + r):
+				continue
+			if covered is not None:
+				cells = []
+				inside = []
+				for i in range(int((x - r) // cell), int((x + r) // cell) + 1):
+					for j in range(int((y - r) // cell), int((y + r) // cell) + 1):
+						nx = max(i * cell - x, 0, x - (i + 1) * cell) #nearest point of the cell to the centre
+						ny = max(j * cell - y, 0, y - (j + 1) * cell)
+						if nx * nx + ny * ny < r * r: #the cell overlaps the circle
+							cells.append((i, j))
+						fx = max(abs(i * cell - x), abs((i + 1) * cell - x)) #farthest corner of the cell
+						fy = max(abs(j * cell - y), abs((j + 1) * cell - y))
+						if fx * fx + fy * fy <= r * r: #the cell is entirely inside the circle
+							inside.append((i, j))
+				if covered.issuperset(cells):
+					continue
+				covered.update(inside)
+			if options.compact:
+				id = symbols.setdefault((r, color), f"a{len(symbols)}")
+				svgList.append(f'<use href="#{id}" x="{num(x, p)}" y="{num(y, p)}"/>\n')
+			else:
+				svgList.append(f'  <circle cx="{x:.{p}f}" cy="{y:.{p}f}" r="{r}" fill="#{color}"/>\n')
+		else:
+			x1, y1 = item[1] * scale + ox, item[2] * scale + oy
+			x2, y2 = item[3] * scale + ox, item[4] * scale + oy
+			dx, dy = item[5] * 10 * zoom, item[6] * 10 * zoom
+			if 2 * 10 * zoom < options.min_size:
+				continue
+			corners = (x1 - dy, y1 + dx, x1 + dy, y1 - dx, x2 + dy, y2 - dx, x2 - dy, y2 + dx)
+			if offscreen(min(corners[0::2]), min(corners[1::2]), max(corners[0::2]), max(corners[1::2])):
+				continue
+			points = " ".join(f"{num(corners[i], p)},{num(corners[i + 1], p)}" for i in range(0, 8, 2))
+			if options.compact:
+				svgList.append(f'<polygon points="{points}"/>\n')
+			else:
+				svgList.append(f'  <polygon points="{points}" fill="green"/>\n')
+
+	svgList.reverse()
+	if symbols: #one circle per element, every atom of that element uses it
+		svgList.insert(0, "<defs>" + "".join(f'<circle id="{id}" r="{r}" fill="#{color}"/>' for (r, color), id in symbols.items()) + "</defs>\n")
+	return options.header(styles) + "".join(svgList) + footer
+
+def _compact_number(value, p): #value to p decimal places without trailing zeros, 12.50 is 12.5 and 12.00 is 12
+	text = f"{value:.{p}f}"
+	if "." in text:
+		text = text.rstrip("0").rstrip(".")
+	return "0" if text == "-0" else text
+
+class ParseError(Exception):
+	def __init__(self, message, lineno): #lineno is the line of the file the error was found on
+		super().__init__(f"line {lineno}: {message}")
+		self.lineno = lineno
+
+class _LineReader():
+	def __init__(self, fileObj): #wraps a file object and counts the lines read from it
+		self.fileObj = fileObj
+		self.lineno = 0
+
+	def readline(self):
+		line = self.fileObj.readline()
+		if line:
+			self.lineno += 1
+		return line
+
+	def expect(self, what): #reads the next line, end of file is an error
+		line = self.readline()
+		if not line:
+			raise ParseError(f"unexpected end of file, expected {what}", self.lineno + 1)
+		return line
+
+def _parse_counts(line, lineno): #gets the number of atoms and bonds from the counts line
+	if "V2000" in line:
+		try:
+			return int(line[0:3]), int(line[3:6]) #fixed width columns, these run together past 99 atoms
+		except ValueError:
+			pass
+	try:
+		num_atoms, num_bonds = map(int, line.split()[:2])
+	except ValueError:
+		raise ParseError("invalid counts line", lineno) from None
+	return num_atoms, num_bonds
+
+def _parse_bond(line, fixed, lineno): #gets the two atom numbers and the epairs of a bond line
+	if fixed:
+		try:
+			return int(line[0:3]), int(line[3:6]), int(line[6:9]) #fixed width columns, these run together past 99 atoms
+		except ValueError:
+			pass
+	fields = line.split()
+	try:
+		return int(fields[0]), int(fields[1]), int(fields[2])
+	except (ValueError, IndexError):
+		raise ParseError("invalid bond line", lineno) from None
+
+def _parse_record(reader): #reads one record, returns (name, coords, elements, bonds) packed for Molecule.load or None at the end of the file
+	name = reader.readline()
+	if not name:
+		return None
+	header = [name, reader.readline(), reader.readline()]
+	counts = reader.readline()
+	if not counts:
+		if not "".join(header).strip(): #only blank lines were left at the end of the file
+			return None
+		raise ParseError("unexpected end of file, expected counts line", reader.lineno + 1)
+
+	num_atoms, num_bonds = _parse_counts(counts, reader.lineno)
+	fixed = "V2000" in counts #V2000 bond lines are fixed width, anything else is split on whitespace
+	coords = array('d')
+	elements = bytearray()
+	bonds = array('I')
+
+	for i in range(num_atoms): #packs the atoms
+		fields = reader.expect("atom line").split() #split each line once
+		try:
+			coords.extend((float(fields[0]), float(fields[1]), float(fields[2])))
+			element = fields[3]
+		except (ValueError, IndexError):
+			raise ParseError("invalid atom line", reader.lineno) from None
+		if len(element) > 2:
+			raise ParseError(f"invalid element '{element}'", reader.lineno)
+		elements += element.encode().ljust(3, b"\0")
+
+	for i in range(num_bonds): #packs the bonds
+		a1, a2, epairs = _parse_bond(reader.expect("bond line"), fixed, reader.lineno)
+		if not (0 < a1 <= num_atoms and 0 < a2 <= num_atoms):
+			raise ParseError("bond refers to an atom that does not exist", reader.lineno)
+		bonds.extend((a1-1, a2-1, epairs))
+
+	return name.strip(), coords, elements, bonds
+
+def _skip_record(reader): #skips the properties block up to the end of the record
+	while True:
+		line = reader.readline()
+		if not line or line.startswith("$$$$"):
+			return
+
+def read_sdf(fileObj, perceive=True): #yields each molecule in a multi-record sdf file without reading the whole file
+	#records without bonds get them from covalent radii as in Molecule.parse
+	reader = _LineReader(fileObj)
+	while True:
+		record = _parse_record(reader)
+		if record is None:
+			return
+		name, coords, elements, bonds = record
+		mol = Molecule(len(elements) // 3, len(bonds) // 3) #allocates the exact size once
+		mol.load(coords, elements, bonds)
+		if perceive and mol.bond_no == 0:
+			mol.perceive_bonds()
+		mol.name = name
+		yield mol
+		_skip_record(reader)
@@ -1,91 +1,387 @@
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
 
-import sys      # to get command line argument for port
-import urllib   # code to parse for data
+import argparse
+import cProfile
+import os
+import threading
+import time
+import traceback
+import urllib.parse   # code to parse for data
+import html
 import cgi
-import io
+import gzip
+import hashlib
+import itertools
+import json
+import math
+import metrics
 import molsql
 import MolDisplay
 import sqlite3
+import zlib
+from collections import OrderedDict
 
 # list of files that we allow the web-server to serve to clients
 # (we don't want to serve any file that the client requests)
+TABLE_PAGE = 100 #molecules per page of the molecule table
+MAX_UPLOAD = 512 * 1024 * 1024 #largest upload accepted, in bytes
+UPLOAD_BATCH = 100 #molecules written per transaction while an upload streams in
+COMPRESS_MIN = 1024 #smaller responses are sent uncompressed
+render_options = MolDisplay.RenderOptions(compact=True) #svgs are served as one <defs> circle per element and <use> per atom
+
+ENDPOINTS = ['/upload', '/display.html', '/add', '/remove', '/table.html', '/metrics'] #requests to anything else are counted as "static" or "other"
+profile_dir = None #set by --profile, every request is then profiled into a .prof file in this directory
+
 public_files = [ '/mol_icon.png', '/index.html', '/style.css', '/add.js', '/add.html', '/remove.js', '/remove.html', '/upload.js', '/upload.html', '/display.js', '/display.html', '/table.html',]
 
-db = molsql.Database(reset=True)
-db.create_tables()
-cursor = db.conn.cursor()
+class SVGCache():
+    #least recently used cache of rendered svgs, keyed by (molecule, rotation, elements version)
+    #the molecule is ("hash", structure_hash), so every name of a deduplicated molecule shares its renders, or the name for molecules stored without one
+    #entries are dropped oldest first once the cached svgs take more than max_bytes
+    #safe to share between the server's threads
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict() #key -> (svg bytes, etag, gzipped svg bytes)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key) #mark as most recently used
+            return entry
+
+    def put(self, key, svg):
+        #the svg is compressed once here, so a cached render is never compressed again per request
+        entry = (svg, '"' + hashlib.sha1(svg).hexdigest() + '"', gzip.compress(svg, mtime=0))
+        size = len(entry[0]) + len(entry[2])
+        with self.lock:
+            self.pop(key)
+            if size > self.max_bytes: #too big to ever cache
+                return entry
+            self.entries[key] = entry
+            self.size += size
+            while self.size > self.max_bytes:
+                _, old = self.entries.popitem(last=False)
+                self.size -= len(old[0]) + len(old[2])
+        return entry
+
+    def pop(self, key): #callers hold the lock
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0]) + len(entry[2])
+
+    def invalidate(self, molname): #drops every cached render keyed by the molecule's name, renders keyed by hash never go stale
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == molname]:
+                self.pop(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+class TableCache():
+    #the html table of molecules, one entry per page, kept in memory until the set of molecules changes
+    #least recently used pages are dropped once more than max_pages are cached, as (offset, limit) come from the client
+    def __init__(self, max_pages=64):
+        self.max_pages = max_pages
+        self.pages = OrderedDict() #(offset, limit) -> table html bytes
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def get(self, db, offset, limit):
+        with self.lock:
+            page = self.pages.get((offset, limit))
+            if page is not None:
+                self.pages.move_to_end((offset, limit))
+            version = self.version
+        if page is None:
+            page = molecule_table(db, offset, limit)
+            with self.lock:
+                if version == self.version: #a molecule may have been added while the page was built
+                    self.pages[(offset, limit)] = page
+                    while len(self.pages) > self.max_pages:
+                        self.pages.popitem(last=False)
+        return page
+
+    def clear(self):
+        with self.lock:
+            self.pages.clear()
+            self.version += 1
+
+def molecule_table(db, offset, limit):
+    #builds one page of the molecule table from a single query
+    rows = ["<table>", "<tr><th>Molecule Name</th><th>Number of Atoms</th><th>Number of Bonds</th></tr>"]
+    for name, numAtoms, numBonds in db.molecule_table(limit, offset):
+        name = html.escape(name, quote=True)
+        rows.append(f"<tr><td>{name}</td><td>{numAtoms}</td><td>{numBonds}</td>"
+                    f"<td><button id = '{name}' onclick = 'sendPostRequest(this.id)'>View as an SVG</button></td></tr>")
+    rows.append("</table>")
+
+    total = db.count_molecules()
+    if offset > 0: #links to the neighbouring pages
+        rows.append(f"""<button onclick = "$('#table').load('table.html?offset={max(offset - limit, 0)}&limit={limit}')">Previous</button>""")
+    if offset + limit < total:
+        rows.append(f"""<button onclick = "$('#table').load('table.html?offset={offset + limit}&limit={limit}')">Next</button>""")
+    return "".join(rows).encode('utf-8')
+
+def accepted_encoding(accept_encoding):
+    #picks gzip or deflate from an Accept-Encoding header, None if the client accepts neither
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    for coding in ("gzip", "deflate"):
+        if accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return None
+
+class UploadTooLarge(Exception):
+    pass
+
+class InvalidBody(Exception):
+    #a Content-Length or chunk size that is not a number
+    pass
+
+class BodyReader():
+    #reads a request body a line at a time, from a Content-Length or a chunked request
+    #never reads past the end of the body, and raises UploadTooLarge once more than limit bytes have been read
+    #or InvalidBody if the body's length can't be read
+    def __init__(self, rfile, headers, limit, max_line=65536):
+        self.rfile = rfile
+        self.limit = limit
+        self.max_line = max_line #longer lines are returned in pieces so one line can't use unbounded memory
+        self.total = 0
+        self.chunked = headers.get("Transfer-Encoding", "").lower() == "chunked"
+        try:
+            self.remaining = 0 if self.chunked else int(headers.get("Content-Length", 0))
+        except ValueError:
+            raise InvalidBody("invalid Content-Length") from None
+        if self.remaining < 0:
+            raise InvalidBody("invalid Content-Length")
+        if self.remaining > limit:
+            raise UploadTooLarge()
+
+    def next_chunk(self): #reads the size of the next chunk, False at the end of the body
+        try:
+            size = int(self.rfile.readline(1024).split(b";")[0], 16)
+        except ValueError:
+            raise InvalidBody("invalid chunk size") from None
+        if size < 0:
+            raise InvalidBody("invalid chunk size")
+        if size == 0:
+            while self.rfile.readline(1024) not in (b"\r\n", b"\n", b""): #skips the trailer
+                pass
+            self.chunked = False
+            return False
+        self.remaining = size
+        return True
+
+    def readline(self):
+        parts = []
+        length = 0
+        while length < self.max_line:
+            if self.remaining == 0 and not (self.chunked and self.next_chunk()):
+                break
+            part = self.rfile.readline(min(self.remaining, self.max_line - length))
+            if not part: #the client went away
+                self.remaining = 0
+                self.chunked = False
+                break
+            self.remaining -= len(part)
+            self.total += len(part)
+            if self.total > self.limit:
+                raise UploadTooLarge()
+            if self.chunked and self.remaining == 0:
+                self.rfile.readline(1024) #the line break that ends the chunk
+            parts.append(part)
+            length += len(part)
+            if part.endswith(b"\n"):
+                break
+        return b"".join(parts)
+
+class UploadFile():
+    #the uploaded sdf file as lines of text, for MolDisplay.read_sdf
+    #taken from the first file field of a multipart/form-data body, or the whole body for any other content type
+    def __init__(self, body, content_type):
+        self.body = body
+        self.delimiter = None
+        self.open = True
+        ctype, params = cgi.parse_header(content_type)
+        if ctype != "multipart/form-data":
+            return
+
+        self.delimiter = b"--" + params.get("boundary", "").encode()
+        self.open = False
+        while not self.open: #skips the parts before the file
+            line = body.readline()
+            if not line:
+                return
+            if line.rstrip(b"\r\n") == self.delimiter:
+                headers = []
+                line = body.readline()
+                while line.strip(): #the part's headers end with a blank line
+                    headers.append(line)
+                    line = body.readline()
+                self.open = any(b"filename=" in header for header in headers)
+
+    def readline(self):
+        if not self.open:
+            return ""
+        line = self.body.readline()
+        if not line or (self.delimiter is not None and line.rstrip(b"\r\n") in (self.delimiter, self.delimiter + b"--")):
+            self.open = False #the end of the file part
+            return ""
+        return line.decode("utf-8", errors="replace")
+
+def upload_molecules(upload, molname):
+    #yields (name, molecule) for each record in an upload, the first is called molname and the rest molname-2, molname-3...
+    for number, mol in enumerate(MolDisplay.read_sdf(upload), 1):
+        if not molname:
+            yield mol.name, mol
+        else:
+            yield (molname if number == 1 else f"{molname}-{number}"), mol
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    #handles each connection on one of a fixed number of worker threads instead of a new thread per request
+    def __init__(self, address, handler, workers):
+        super().__init__(address, handler)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+
+pool = molsql.DatabasePool(reset=True) #one sqlite connection per worker thread
+
+svg_cache = SVGCache()
+table_cache = TableCache()
+styles = pool.get().element_styles() #rebuilt, with a new version, whenever /add or /remove change the Elements table
 
 class MyHandler( BaseHTTPRequestHandler ):
-        # used to GET a file from the list ov public_files, above
     def do_GET(self):
-        if self.path in public_files:
-            if self.path == "/display.html": #get the table of molecules in the database
-                molecule = MolDisplay.Molecule()
-                names = db.__getMolNames__()
-                name_list = [name[0] for name in names]
-                
-                html_table = ""
-                html_table += "<table>"
-                html_table += "<tr><th>Molecule Name</th><th>Number of Atoms</th><th>Number of Bonds</th></tr>"
-
-                for name in name_list:
-                    numAtoms = db.getNumAtoms(name) #get the number of atoms and bonds for each molecule
-                    numBonds = db.getNumBonds(name)
-                    html_table += "<tr>"
-                    html_table += f"<td>{name}</td><td>{numAtoms}</td><td>{numBonds}</td>"
-                    html_table += f"<td><button id = '{name}' onclick = 'sendPostRequest(this.id)'>View as an SVG</button></td>"
-                    html_table += "</tr>"
-
-                html_table += "</table>"
-                with open('table.html', 'w') as f:
-                    f.write(html_table) #write the table to a file
+        self.instrumented(self.handle_GET)
 
-            self.send_response(200)
-            if self.path.endswith('.html'):
-                self.send_header('Content-type', 'text/html')
-            elif self.path.endswith('.css'):
-                self.send_header('Content-type', 'text/css')
-            elif self.path.endswith('.js'):
-                self.send_header('Content-type', 'application/javascript')
-            elif self.path.endswith('.png'):
-                self.send_header('Content-type', 'image/png')
+    def do_POST(self):
+        self.instrumented(self.handle_POST)
+
+    def instrumented(self, handle):
+        #counts and times the request under its endpoint, and profiles it when the server was started with --profile
+        #an unexpected error is logged and answered with a 500 instead of leaving the client without a response
+        endpoint = urllib.parse.urlsplit(self.path).path
+        if endpoint not in ENDPOINTS:
+            endpoint = "static" if endpoint in public_files else "other"
+        self.status = None
+        profiler = cProfile.Profile() if profile_dir else None
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                profiler.runcall(handle)
             else:
-                self.send_header('Content-type', 'text/plain')
-            self.end_headers()
+                handle()
+        except Exception:
+            metrics.count("errors_total", endpoint=endpoint)
+            self.log_error("%s", traceback.format_exc())
+            if self.status is None:
+                self.send_text(500, "500: internal server error")
+        finally:
+            metrics.observe("request_seconds", time.perf_counter() - start, endpoint=endpoint)
+            metrics.count("requests_total", endpoint=endpoint, status=self.status)
+            if profiler is not None:
+                name = endpoint.strip("/").replace("/", "_").replace(".", "_") or "root"
+                profiler.dump_stats(os.path.join(profile_dir, f"{time.time():.6f}-{name}.prof"))
+
+    def send_response(self, code, message=None): #remembers the status for the metrics
+        self.status = code
+        super().send_response(code, message)
+
+        # used to GET a file from the list ov public_files, above
+    def handle_GET(self):
+        db = pool.get()
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/metrics": #counters and latency histograms of every endpoint and stage
+            page = metrics.render() + f"svg_cache_bytes {svg_cache.size}\nsvg_cache_entries {len(svg_cache.entries)}\n"
+            self.send_body(page.encode("utf-8"), "text/plain; version=0.0.4")
+        elif url.path in public_files:
+            if url.path == "/table.html": #the table of molecules in the database, served from memory
+                query = urllib.parse.parse_qs(url.query)
+                try:
+                    offset = max(int(query.get("offset", ["0"])[0]), 0)
+                    limit = min(max(int(query.get("limit", [str(TABLE_PAGE)])[0]), 1), TABLE_PAGE * 10)
+                except ValueError:
+                    offset, limit = 0, TABLE_PAGE
+                page = table_cache.get(db, offset, limit)
+                self.send_body(page, 'text/html')
+                return
+
+            if url.path.endswith('.html'):
+                content_type = 'text/html'
+            elif url.path.endswith('.css'):
+                content_type = 'text/css'
+            elif url.path.endswith('.js'):
+                content_type = 'application/javascript'
+            elif url.path.endswith('.png'):
+                content_type = 'image/png'
+            else:
+                content_type = 'text/plain'
 
-            if self.path.endswith('.html') or self.path.endswith('.css') or self.path.endswith('.js'): #send the file to the client
-                fp = open(self.path[1:])
-                page = fp.read()
-                fp.close()
-                self.wfile.write(bytes(page, 'utf-8'))
-                
-            elif self.path.endswith('.png'): #send the image to the client
+            if url.path.endswith('.png'): #send the image to the client
                 with open("mol_icon.png", "rb") as f:
-                    imgData = f.read()
-                self.wfile.write(imgData)
+                    self.send_body(f.read(), content_type, compress=False)
+            else: #send the file to the client
+                with open(url.path[1:], "rb") as fp:
+                    self.send_body(fp.read(), content_type)
 
         else:
-                self.send_response( 404 ) #if the file is not in the list of public files, send a 404 error
-                self.end_headers()
-                self.wfile.write( bytes( "404: not found", "utf-8" ) )
+                self.send_text( 404, "404: not found" ) #if the file is not in the list of public files, send a 404 error
 
 
-    def do_POST(self):
+    def handle_POST(self):
+        db = pool.get()
         if self.path == "/upload":
-            length = int(self.headers["Content-Length"]) #find length of the uploaded file
-            data = self.rfile.read(length) #save the file
-            data = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')
-
-            for i in range(4):
-                data.readline()
-
+            molname = self.headers.get('molname') #get the name of the molecule inputted
+            self.close_connection = True #anything left of the body after an error is not read
+            imported = 0
             try:
-                molname = self.headers.get('molname') #get the name of the molecule inputted
-                db.add_molecule(molname, data) #add the molecule to the database
-                self.send_response(200) #send a 200 response
-            except:
-                pass
+                body = BodyReader(self.rfile, self.headers, MAX_UPLOAD)
+                molecules = upload_molecules(UploadFile(body, self.headers.get("Content-Type", "")), molname)
+                while True: #parses the upload as it arrives and writes it a batch at a time, in bounded memory
+                    with metrics.timer("stage_seconds", stage="parse"): #includes reading the body off the socket
+                        batch = list(itertools.islice(molecules, UPLOAD_BATCH))
+                    if not batch:
+                        break
+                    with pool.write_lock:
+                        db.add_molecules(batch, batch_size=len(batch)) #add the molecules to the database
+                    imported += len(batch)
+                    for name, mol in batch:
+                        svg_cache.invalidate(name) #a re-uploaded molecule must not be served from an old render
+                    table_cache.clear()
+
+                if imported == 0:
+                    self.send_upload_response(400, {"imported": 0, "error": "Invalid file: there are no molecules in it"})
+                else:
+                    self.send_upload_response(200, {"imported": imported})
+            except MolDisplay.ParseError as e: #tell the client which line of the file is invalid
+                self.send_upload_response(400, {"imported": imported, "error": f"Invalid file: {e}"})
+            except InvalidBody as e:
+                self.send_upload_response(400, {"imported": imported, "error": f"Invalid request: {e}"})
+            except UploadTooLarge:
+                self.send_upload_response(413, {"imported": imported, "error": f"Upload is larger than {MAX_UPLOAD} bytes"})
+            except sqlite3.IntegrityError:
+                self.send_upload_response(409, {"imported": imported, "error": "A molecule with that name already exists"})
 
         elif self.path == "/add":
             cgi.parse_header(self.headers["Content-Type"])
@@ -99,10 +395,16 @@ class MyHandler( BaseHTTPRequestHandler ):
             element = (form.getvalue("lnum"), form.getvalue("lcode"), form.getvalue("lname"), form.getvalue("colour1"), form.getvalue("colour2"), form.getvalue("colour3"), form.getvalue("radius"))
 
             try:
-                db.__setitem__("Elements", element) #add the element to the database
-                self.send_response(200)
-            except:
-                pass
+                with pool.write_lock:
+                    db.__setitem__("Elements", element) #add the element to the database
+                    self.elements_changed(db)
+            except sqlite3.Error as e: #a missing field, or an element that is already in the table
+                db.conn.rollback()
+                self.send_text(400, f"Invalid element: {e}")
+                return
+            self.send_response(200)
+            self.send_header("Content-length", 0)
+            self.end_headers()
 
         elif self.path == "/remove":
             cgi.parse_header(self.headers["Content-Type"])
@@ -112,37 +414,117 @@ class MyHandler( BaseHTTPRequestHandler ):
                 environ={'REQUEST_METHOD':'POST'}
             )
 
-            elementCode = form["removeel"].value
-
             try:
-                db.__removeitem__("Elements", elementCode)
-                self.send_response(200)
-            except:
-                pass
+                elementCode = form["removeel"].value
+                with pool.write_lock:
+                    db.__removeitem__("Elements", elementCode)
+                    self.elements_changed(db)
+            except KeyError:
+                self.send_text(400, "Invalid request: no element to remove")
+                return
+            except sqlite3.Error as e:
+                db.conn.rollback()
+                self.send_text(400, f"Invalid element: {e}")
+                return
+            self.send_response(200)
+            self.send_header("Content-length", 0)
+            self.end_headers()
 
         elif self.path == "/display.html":
-            MolDisplay.radius = db.radius() #get the radius of the atoms
-            MolDisplay.element_name = db.element_name()
-            MolDisplay.header += db.radial_gradients() 
-
             molname = self.headers.get('molname')
-            molecule = db.load_mol(molname) #load the molecule from the database using the selected name
-            molecule.sort()
-            with open(f"{molname}.svg", "w") as f: #write the molecule to a file as an svg
-                f.write(molecule.svg())
-
-            with open(f"{molname}.svg", "r") as f: 
-                svgData = f.read().encode('utf-8')
-            
-            self.wfile.write(svgData) #send the svg to the client
-            
-            self.send_response(200)
-            self.send_header("Content-type", "image/svg+xml")
-            self.end_headers()
+            try: #degrees to rotate around each axis, applied x then y then z
+                rotation = tuple(float(self.headers.get(axis, 0)) % 360 for axis in ('xrot', 'yrot', 'zrot'))
+            except ValueError:
+                rotation = None
+            if rotation is None or not all(map(math.isfinite, rotation)): #inf % 360 is nan, which would render nan coordinates
+                self.send_text(400, "Invalid rotation")
+                return
+            renderStyles = styles
+            try: #the metadata only, the atoms are read on a cache miss
+                handle = db.molecule(molname)
+            except KeyError: #not in the database, rendered as an empty molecule like before
+                handle = molsql.MoleculeHandle(db, molname, 0, 0, None, None, None)
+            key = (molname if handle.hash is None else ("hash", handle.hash), rotation, renderStyles.version)
+
+            entry = svg_cache.get(key)
+            metrics.count("svg_cache_total", result="miss" if entry is None else "hit")
+            if entry is None: #render the molecule and keep it in memory
+                molecule = handle.load() #load the molecule from the database using the selected name
+                if rotation != (0, 0, 0):
+                    with metrics.timer("stage_seconds", stage="rotate"):
+                        molecule.rotate(*rotation) #one composed matrix applied in C
+                with metrics.timer("stage_seconds", stage="sort"):
+                    molecule.sort()
+                with metrics.timer("stage_seconds", stage="render"):
+                    svg = molecule.svg(renderStyles, options=render_options).encode('utf-8')
+                with metrics.timer("stage_seconds", stage="compress"):
+                    entry = svg_cache.put(key, svg)
+            svgData, etag, gzipped = entry
+
+            self.send_body(svgData, "image/svg+xml", etag, gzipped) #send the svg to the client
         else:
-            self.send_response( 404 )
+            self.send_text( 404, "404: not found" )
+
+    def send_body(self, body, content_type, etag=None, gzipped=None, compress=True):
+        #sends a 200 with body, gzip or deflate compressed when the client accepts it, or a 304 if the client has it
+        #gzipped is body already compressed with gzip, etags differ per encoding as each is a different response
+        encoding = accepted_encoding(self.headers.get("Accept-Encoding")) if compress and len(body) >= COMPRESS_MIN else None
+        if encoding == "gzip":
+            body = gzipped if gzipped is not None else gzip.compress(body, mtime=0)
+        elif encoding == "deflate":
+            body = zlib.compress(body)
+        if etag is not None and encoding is not None:
+            etag = etag[:-1] + "-" + encoding + '"'
+
+        if etag is not None and self.headers.get('If-None-Match') == etag: #the client already has this response
+            self.send_response(304)
+            self.send_header("ETag", etag)
             self.end_headers()
-            self.wfile.write( bytes( "404: not found", "utf-8" ) )
+            return
+
+        self.send_response(200)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-length", len(body))
+        if compress:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_text(self, code, text): #sends a short plain text response, e.g. an error message
+        body = text.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-type", "text/plain")
+        self.send_header("Content-length", len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_upload_response(self, code, result): #result says how many molecules were imported, and why the rest were not
+        body = json.dumps(result).encode('utf-8')
+        self.send_response(code)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-length", len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def elements_changed(self, db): #rebuild the element styles, renders made with the old Elements table are out of date
+        global styles
+        styles = db.element_styles(styles.version + 1) #callers hold the write lock, so versions are never reused
+        svg_cache.clear()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Molecule display server")
+    parser.add_argument("port", type=int)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--workers", type=int, default=8, help="number of requests handled at the same time")
+    parser.add_argument("--profile", metavar="DIR", help="profile every request with cProfile into a .prof file in DIR")
+    args = parser.parse_args()
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+        profile_dir = args.profile
 
-httpd = HTTPServer( ( 'localhost', int(sys.argv[1]) ), MyHandler ) #start the server
-httpd.serve_forever() #run the server forever
+    httpd = PooledHTTPServer( ( args.host, args.port ), MyHandler, args.workers ) #start the server
+    httpd.serve_forever() #run the server forever
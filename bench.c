@@ -0,0 +1,147 @@
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+#include "mol.h"
+
+//appends 1,000,000 atoms and bonds one at a time, growing from an empty molecule and with molreserve
+//then times molsort against a plain qsort on the frames of a turntable animation, and bond perception on molecules without bonds
+//build and run with "make bench && ./bench"
+
+#define COUNT 1000000
+#define FRAMES 360
+
+static double seconds( void ){
+	struct timespec ts;
+	clock_gettime(CLOCK_MONOTONIC, &ts);
+	return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static double append( molecule *mol ){
+//time appending COUNT atoms and COUNT bonds
+	atom a;
+	bond b;
+	char element[3] = "C";
+	double x, y, z;
+	double start = seconds();
+
+	for(size_t i = 0; i < COUNT; i++){
+		x = i; y = -1.0 * i; z = (double)(COUNT - i); //decreasing z so sorting reverses atom_ptrs
+		atomset(&a, element, &x, &y, &z);
+		molappend_atom(mol, &a);
+	}
+	for(size_t i = 0; i < COUNT; i++){
+		unsigned int a1 = i, a2 = (i + 1) % COUNT;
+		unsigned char epairs = 1;
+		atom *atoms = mol->atoms;
+		bondset(&b, &a1, &a2, &atoms, &epairs);
+		molappend_bond(mol, &b);
+	}
+	return seconds() - start;
+}
+
+static int check( molecule *mol ){
+//sort, grow the molecule again and check atom_ptrs is still sorted and every bond still points at the atoms
+	atom a;
+	char element[3] = "O";
+	double x = 0, y = 0, z = -1.0;
+
+	molsort(mol);
+	atomset(&a, element, &x, &y, &z);
+	molappend_atom(mol, &a); //forces a realloc if the molecule is full
+
+	for(size_t i = 1; i < mol->atom_no - 1; i++){
+		if((mol->atom_ptrs)[i-1]->z > (mol->atom_ptrs)[i]->z){
+			return -1;
+		}
+	}
+	for(size_t i = 0; i < mol->bond_no; i++){
+		if((mol->bonds)[i].atoms != mol->atoms){
+			return -1;
+		}
+	}
+	return 0;
+}
+
+static int zCompare( const void *a, const void *b ){
+//the comparator molsort used to use, z only with no tie-break
+	double az = (*(atom **)a)->z, bz = (*(atom **)b)->z;
+	return (az > bz) - (az < bz);
+}
+
+static void frames( size_t atom_no, double degrees ){
+//sort FRAMES frames of a molecule turning degrees around the y-axis per frame, with molsort and with qsort
+	molecule *mol = molmalloc(atom_no, 0);
+	atom a;
+	char element[3] = "C";
+	xform_matrix turn;
+	double x, y, z, sorted = 0, qsorted = 0;
+
+	srand(1);
+	for(size_t i = 0; i < atom_no; i++){
+		x = rand() / (double)RAND_MAX * 100; y = rand() / (double)RAND_MAX * 100; z = rand() / (double)RAND_MAX * 100;
+		atomset(&a, element, &x, &y, &z);
+		molappend_atom(mol, &a);
+	}
+	atom **copy = malloc(atom_no * sizeof(atom *));
+	xyzrotation(turn, 0, degrees, 0);
+	molsort(mol);
+
+	for(int i = 0; i < FRAMES; i++){
+		mol_xform(mol, turn);
+		memcpy(copy, mol->atom_ptrs, atom_no * sizeof(atom *));
+
+		double start = seconds();
+		qsort(copy, atom_no, sizeof(atom *), zCompare);
+		qsorted += seconds() - start;
+
+		start = seconds();
+		molsort(mol);
+		sorted += seconds() - start;
+	}
+	printf("%d frames of %zu atoms turning %g degrees: molsort %.3fs, qsort %.3fs\n", FRAMES, atom_no, degrees, sorted, qsorted);
+	free(copy);
+	molfree(mol);
+}
+
+static void perceive( size_t atom_no ){
+//time molperceive on atom_no carbons spread as densely as the atoms of a protein
+	molecule *mol = molmalloc(atom_no, 0);
+	atom a;
+	char element[3] = "C";
+	double side = cbrt(atom_no / 0.1), x, y, z; //0.1 atoms per cubic Angstrom
+
+	srand(1);
+	for(size_t i = 0; i < atom_no; i++){
+		x = rand() / (double)RAND_MAX * side; y = rand() / (double)RAND_MAX * side; z = rand() / (double)RAND_MAX * side;
+		atomset(&a, element, &x, &y, &z);
+		molappend_atom(mol, &a);
+	}
+	double start = seconds();
+	int result = molperceive(mol, NULL, 0.45);
+	printf("perceive bonds of %zu atoms: %zu bonds in %.3fs%s\n", atom_no, mol->bond_no, seconds() - start, result < 0 ? " (out of memory)" : "");
+	molfree(mol);
+}
+
+int main(){
+	molecule *mol = molmalloc(0, 0);
+	double grown = append(mol);
+	printf("append %d atoms and bonds, growing:   %.3fs\n", COUNT, grown);
+	printf("sorted order survives growth: %s\n", check(mol) == 0 ? "yes" : "NO");
+	molfree(mol);
+
+	mol = molmalloc(0, 0);
+	molreserve(mol, COUNT, COUNT);
+	double reserved = append(mol);
+	printf("append %d atoms and bonds, reserved:  %.3fs\n", COUNT, reserved);
+	molfree(mol);
+
+	frames(1000, 1);
+	frames(1000, 10);
+	frames(100000, 0.1);
+	frames(100000, 1);
+
+	perceive(100000);
+	perceive(1000000);
+
+	return 0;
+}
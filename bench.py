@@ -0,0 +1,219 @@
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+import MolDisplay
+import molsql
+
+# benchmark suite for every stage a molecule goes through, from parsing an sdf file to rendering it
+# e.g. "python3 bench.py --atoms 10 1000 100000 --json run.json", then "python3 bench.py --compare run.json"
+# after a change times the same stages again and flags the ones that got slower
+# "python3 bench.py --render" instead compares the size and time of each set of render options
+
+def synthetic(atom_no, seed=1):
+    #a globular molecule of atom_no atoms about as dense as a protein, bonded along a chain
+    rng = random.Random(seed)
+    radius = (atom_no / 0.1 * 3 / (4 * math.pi)) ** (1 / 3) #0.1 atoms per cubic Angstrom
+    coords = array('d')
+    for i in range(atom_no):
+        while True:
+            x, y, z = (rng.uniform(-radius, radius) for j in range(3))
+            if x * x + y * y + z * z <= radius * radius:
+                break
+        coords.extend((x, y, z))
+    elements = b"".join(rng.choice((b"C\0\0", b"C\0\0", b"N\0\0", b"O\0\0", b"H\0\0")) for i in range(atom_no))
+    bonds = array('I')
+    for i in range(atom_no - 1):
+        bonds.extend((i, i + 1, 1))
+    mol = MolDisplay.Molecule(atom_no, max(atom_no - 1, 0))
+    mol.load(coords, elements, bonds)
+    mol.sort()
+    return mol
+
+def sdf_text(mol, name, shift=0.0):
+    #mol written as an sdf record, in V2000 fixed columns while the counts fit in them
+    #every x is moved by shift Angstroms, so copies with different shifts are different molecules to the database
+    coords, elements, bonds = mol.pack()
+    coords = array('d', coords)
+    bonds = array('I', bonds)
+    fixed = mol.atom_no <= 999 and mol.bond_no <= 999
+    lines = [name, "  bench", "", f"{mol.atom_no:3}{mol.bond_no:3}  0  0  0  0  0  0  0  0999 V2000" if fixed else f"{mol.atom_no} {mol.bond_no}"]
+    for i in range(mol.atom_no):
+        element = elements[i * 3:i * 3 + 3].rstrip(b"\0").decode()
+        lines.append(f"{coords[i * 3] + shift:10.4f}{coords[i * 3 + 1]:10.4f}{coords[i * 3 + 2]:10.4f} {element:3} 0  0  0  0  0  0  0  0  0  0  0  0")
+    for i in range(mol.bond_no):
+        a1, a2, epairs = bonds[i * 3] + 1, bonds[i * 3 + 1] + 1, bonds[i * 3 + 2]
+        lines.append(f"{a1:3}{a2:3}{epairs:3}  0  0  0  0" if fixed else f"{a1} {a2} {epairs}")
+    lines += ["M  END", "$$$$", ""]
+    return "\n".join(lines)
+
+def rss():
+    #resident memory of this process in bytes, None where it can't be read
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def measure(setup, run, repeat):
+    #times run(setup()) repeat times, then runs it once more under tracemalloc for the peak python memory
+    #setup is not timed, returns (seconds of each run, peak bytes allocated by python, resident bytes after the run)
+    runs = []
+    for i in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        runs.append(time.perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    run(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return runs, peak, rss()
+
+def stages(atom_no, python_svg_max):
+    #the stages of one molecule size as (name, setup, run), in pipeline order
+    #runs in the current directory, which holds the benchmark's own molecules.db
+    mol = synthetic(atom_no)
+    text = sdf_text(mol, "bench")
+    styles = MolDisplay.ElementStyles({"C": 40, "N": 40, "O": 40, "H": 25}, {"C": "808080", "N": "0000ff", "O": "ff0000", "H": "ffffff"})
+    db = molsql.Database(reset=True)
+    db.create_tables()
+    db.add_molecule("bench-0", io.StringIO(text)) #the molecule load_mol and the later stages load
+    names = iter(range(1, sys.maxsize)) #add_molecule needs a new name every run
+    #and new coordinates, or it only stores an alias of bench-0 instead of inserting the atoms and bonds
+
+    def added():
+        n = next(names)
+        return f"bench-{n}", io.StringIO(sdf_text(mol, "bench", n))
+
+    def loaded():
+        return db.load_mol("bench-0")
+
+    def turned():
+        mol = loaded()
+        mol.sort()
+        mol.rotate(0, 10, 0)
+        return mol
+
+    def sorted_mol():
+        mol = loaded()
+        mol.sort()
+        return mol
+
+    result = [
+        ("parse", lambda: io.StringIO(text), lambda fp: MolDisplay.Molecule().parse(fp)),
+        ("add_molecule", added, lambda args: db.add_molecule(*args)),
+        ("load_mol", lambda: None, lambda arg: loaded()),
+        ("metadata", lambda: None, lambda arg: db.molecule("bench-0")),
+        ("load_atoms", lambda: None, lambda arg: db.load_atoms("bench-0", 0, 1000)), #the first 1000 atoms, a fragment of the larger molecules
+        ("sort", loaded, lambda mol: mol.sort()),
+        ("xform", sorted_mol, lambda mol: mol.rotate(0, 10, 0)),
+        ("resort", turned, lambda mol: mol.sort()),
+    ]
+    if atom_no <= python_svg_max: #the python engine merges with list.pop(0), which is quadratic
+        result.append(("svg", sorted_mol, lambda mol: mol.svg(styles)))
+    if MolDisplay.np is not None:
+        result.append(("svg numpy", sorted_mol, lambda mol: mol.svg(styles, "numpy")))
+        result.append(("svg compact", sorted_mol, lambda mol: mol.svg(styles, "numpy", MolDisplay.RenderOptions(compact=True))))
+    return result, mol.bond_no
+
+def run_suite(sizes, repeat, python_svg_max, only=None):
+    #runs every stage for every size in a temporary directory, returns a list of result dicts
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        os.chdir(workdir) #so molecules.db is the benchmark's own, never the server's
+        try:
+            for atom_no in sizes:
+                suite, bond_no = stages(atom_no, python_svg_max)
+                for name, setup, run in suite:
+                    if only and name not in only:
+                        continue
+                    runs, peak, resident = measure(setup, run, repeat)
+                    results.append({"stage": name, "atoms": atom_no, "bonds": bond_no, "seconds": min(runs), "runs": runs,
+                                    "python_peak_bytes": peak, "rss_bytes": resident})
+                    print(f"{atom_no:>8} atoms  {name:14} {min(runs) * 1000:12.3f}ms  peak {peak / 1e6:9.2f}MB  rss {(resident or 0) / 1e6:9.1f}MB", flush=True)
+        finally:
+            os.chdir(cwd)
+    return results
+
+def environment():
+    #what a result was measured on, so runs from different machines are not compared by mistake
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+            "numpy": MolDisplay.np is not None, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def compare(old, new, threshold):
+    #prints the change of every stage measured in both runs, returns the number that got more than threshold times slower
+    before = {(result["stage"], result["atoms"]): result["seconds"] for result in old["results"]}
+    slower = 0
+    for result in new["results"]:
+        key = (result["stage"], result["atoms"])
+        if key not in before:
+            continue
+        ratio = result["seconds"] / before[key] if before[key] else float("inf")
+        flag = "  SLOWER" if ratio > threshold else ""
+        slower += bool(flag)
+        print(f"{result['atoms']:>8} atoms  {result['stage']:14} {before[key] * 1000:12.3f}ms -> {result['seconds'] * 1000:12.3f}ms  x{ratio:6.2f}{flag}")
+    return slower
+
+def render(mol, styles, engine, repeat):
+    #renders mol with each set of render options, returns (name, seconds, bytes, atoms and bonds drawn)
+    cases = [
+        ("default", None),
+        ("fit", MolDisplay.RenderOptions(fit=True)),
+        ("fit precision=1", MolDisplay.RenderOptions(fit=True, precision=1)),
+        ("fit min_size=2", MolDisplay.RenderOptions(fit=True, min_size=2)),
+        ("fit occlusion", MolDisplay.RenderOptions(fit=True, occlusion=True, precision=1)),
+        ("zoomed in cull", MolDisplay.RenderOptions(cull=True)),
+        ("compact", MolDisplay.RenderOptions(compact=True)),
+        ("fit compact precision=1", MolDisplay.RenderOptions(fit=True, compact=True, precision=1)),
+    ]
+    results = []
+    for name, options in cases:
+        runs, peak, resident = measure(lambda: None, lambda arg: mol.svg(styles, engine, options), repeat)
+        svg = mol.svg(styles, engine, options)
+        results.append((name, min(runs), len(svg.encode()), svg.count("\n")))
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks for parsing, storing, loading, sorting, transforming and rendering molecules")
+    parser.add_argument("--atoms", type=int, nargs="+", default=[10, 1000, 100000], help="sizes of the synthetic molecules, up to 1000000")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each stage, the best is reported")
+    parser.add_argument("--stages", nargs="+", help="only run these stages")
+    parser.add_argument("--python-svg-max", type=int, default=100000, help="largest molecule rendered by the python engine")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="compare with the results in this file")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio past which --compare calls a stage slower")
+    parser.add_argument("--render", action="store_true", help="compare render options instead of timing the stages")
+    parser.add_argument("--engine", default="python", choices=["python", "numpy"], help="engine used by --render")
+    args = parser.parse_args()
+
+    if args.render:
+        styles = MolDisplay.ElementStyles({"C": 40, "N": 40, "O": 40, "H": 25}, {"C": "808080", "N": "0000ff", "O": "ff0000", "H": "ffffff"})
+        for atom_no in args.atoms:
+            mol = synthetic(atom_no)
+            print(f"{atom_no} atoms, {args.engine} engine")
+            for name, seconds, size, drawn in render(mol, styles, args.engine, args.repeat):
+                print(f"  {name:26} {seconds * 1000:10.1f}ms {size / 1024:10.1f}KB {drawn:8} elements")
+        sys.exit(0)
+
+    run = {"environment": environment(), "repeat": args.repeat, "results": run_suite(args.atoms, args.repeat, args.python_svg_max, args.stages)}
+    if args.json:
+        with open(args.json, "w") as fp:
+            json.dump(run, fp, indent=1)
+    if args.compare:
+        with open(args.compare) as fp:
+            old = json.load(fp)
+        if compare(old, run, args.threshold):
+            sys.exit(1)
@@ -0,0 +1,106 @@
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import MolDisplay
+import molsql
+
+# exports every molecule in molecules.db as an svg file, rendering on a pool of processes
+# e.g. "python3 export.py --out svgs --workers 8 --gzip"
+
+worker_db = None #each worker process has its own read-only connection and element styles
+worker_styles = None
+
+def init_worker():
+    global worker_db, worker_styles
+    worker_db = molsql.Database(readonly=True)
+    worker_styles = worker_db.element_styles() #built once per worker, not once per molecule
+
+def filename(name, compress):
+    #a file name that is safe on any file system, names that only differ in unsafe characters are kept apart by a hash
+    safe = re.sub(r'[^A-Za-z0-9._-]', '_', name)
+    if safe != name:
+        safe += "-" + hashlib.sha1(name.encode()).hexdigest()[:8]
+    return safe + (".svg.gz" if compress else ".svg")
+
+def write_atomic(path, data):
+    #writes to a temporary file in the same directory and renames it, so a file is never seen half written
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".export-")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    except:
+        os.remove(tmp)
+        raise
+
+def export_molecules(names, out, compress, engine, options=None):
+    #loads, sorts, renders and writes each molecule, returns (name, seconds, bytes written or the error)
+    results = []
+    for name in names:
+        start = time.perf_counter()
+        try:
+            mol = worker_db.load_mol(name)
+            mol.sort()
+            data = mol.svg(worker_styles, engine, options).encode('utf-8')
+            if compress:
+                data = gzip.compress(data, mtime=0)
+            write_atomic(os.path.join(out, filename(name, compress)), data)
+            results.append((name, time.perf_counter() - start, len(data)))
+        except Exception as e:
+            results.append((name, time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+    return results
+
+def export(out, workers=None, compress=False, engine="python", chunk=50, verbose=False, options=None):
+    #exports every molecule to out, returns the (name, seconds, bytes or error) of each one
+    #options is a MolDisplay.RenderOptions, None renders at the fixed scale
+    os.makedirs(out, exist_ok=True)
+    names = [row[0] for row in molsql.Database(readonly=True).molecule_table()]
+    chunks = [names[i:i + chunk] for i in range(0, len(names), chunk)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        for done in executor.map(export_molecules, chunks, [out] * len(chunks), [compress] * len(chunks), [engine] * len(chunks), [options] * len(chunks)):
+            for result in done:
+                if verbose or isinstance(result[2], str):
+                    print(f"{result[0]}: {result[1] * 1000:.2f}ms {result[2]}")
+            results.extend(done)
+    return results
+
+def report(results, elapsed):
+    times = sorted(result[1] for result in results)
+    written = [result[2] for result in results if not isinstance(result[2], str)]
+    print(f"exported {len(written)} of {len(results)} molecules in {elapsed:.2f}s ({len(results) / elapsed:.1f} molecules/s, {sum(written) / 1e6:.1f} MB)")
+    if times:
+        print(f"per molecule: mean {sum(times) / len(times) * 1000:.2f}ms, p50 {times[len(times) // 2] * 1000:.2f}ms, "
+              f"p95 {times[int(len(times) * 0.95)] * 1000:.2f}ms, max {times[-1] * 1000:.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export every molecule in molecules.db as an svg")
+    parser.add_argument("--out", default="svg", help="directory the svgs are written to")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes, defaults to the number of cpus")
+    parser.add_argument("--gzip", action="store_true", help="write gzipped .svg.gz files")
+    parser.add_argument("--engine", choices=["python", "numpy"], default="python")
+    parser.add_argument("--chunk", type=int, default=50, help="molecules sent to a worker at a time")
+    parser.add_argument("--verbose", action="store_true", help="print the time taken by every molecule")
+    parser.add_argument("--fit", action="store_true", help="scale each molecule to fill the canvas")
+    parser.add_argument("--cull", action="store_true", help="leave out atoms and bonds off the canvas")
+    parser.add_argument("--min-size", type=float, default=0, help="leave out atoms and bonds smaller than this many pixels")
+    parser.add_argument("--occlusion", action="store_true", help="leave out atoms hidden behind other atoms")
+    parser.add_argument("--precision", type=int, default=2, help="decimal places of each coordinate")
+    parser.add_argument("--compact", action="store_true", help="draw atoms as <use> of one circle per element")
+    args = parser.parse_args()
+
+    options = None
+    if args.fit or args.cull or args.min_size or args.occlusion or args.precision != 2 or args.compact:
+        options = MolDisplay.RenderOptions(fit=args.fit, cull=args.cull, min_size=args.min_size,
+                                           occlusion=args.occlusion, precision=args.precision, compact=args.compact)
+
+    start = time.perf_counter()
+    results = export(args.out, args.workers, args.gzip, args.engine, args.chunk, args.verbose, options)
+    report(results, time.perf_counter() - start)
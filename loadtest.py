@@ -0,0 +1,106 @@
+import argparse
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# load test for ajaxserver.py: start the server first, e.g. "python3 ajaxserver.py 8000 --workers 8",
+# then run "python3 loadtest.py 8000 --clients 16" to report the throughput of concurrent GETs and POSTs
+
+def upload_body(sdf):
+    #wraps an sdf file in the multipart form the upload page sends
+    return (b'------loadtest\r\nContent-Disposition: form-data; name="filename"; filename="molecule.sdf"\r\n'
+            b'Content-Type: application/octet-stream\r\n\r\n' + sdf + b'\r\n------loadtest--\r\n')
+
+def shifted(sdf, shift):
+    #the first record of sdf with every x moved by shift Angstroms, so each upload is a new molecule and not an alias of the last
+    lines = sdf.split(b"\n")
+    counts = lines[3]
+    try:
+        atom_no = int(counts[0:3]) if b"V2000" in counts else int(counts.split()[0])
+    except (ValueError, IndexError):
+        return sdf #not a file the server can parse either
+    for i in range(4, min(4 + atom_no, len(lines))):
+        fields = lines[i].split()
+        fields[0] = f"{float(fields[0]) + shift:.4f}".encode()
+        lines[i] = b" ".join(fields)
+    return b"\n".join(lines)
+
+class LoadTest():
+    def __init__(self, host, port, sdf):
+        self.host = host
+        self.port = port
+        self.sdf = sdf
+        self.lock = threading.Lock()
+        self.latencies = {} #request kind -> list of seconds
+        self.errors = 0
+        self.uploads = 0
+
+    def request(self, kind, method, path, body=None, headers={}):
+        start = time.perf_counter()
+        try:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            conn.close()
+            ok = response.status in (200, 304)
+        except OSError:
+            ok = False
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.latencies.setdefault(kind, []).append(elapsed)
+            if not ok:
+                self.errors += 1
+
+    def upload(self):
+        with self.lock:
+            self.uploads += 1
+            name = f"loadtest{self.uploads}"
+            sdf = shifted(self.sdf, self.uploads)
+        self.request("POST /upload", "POST", "/upload", upload_body(sdf),
+                     {"molname": name, "Content-Type": "multipart/form-data; boundary=----loadtest"})
+        return name
+
+    def client(self, requests, names):
+        #one client: mostly table views and renders at a few rotations, with the occasional upload
+        for i in range(requests):
+            if i % 10 == 0:
+                names.append(self.upload())
+            elif i % 2 == 0: #the first three pages of the molecule table
+                self.request("GET /table.html", "GET", f"/table.html?offset={(i // 2) % 3 * 100}")
+            else:
+                name = names[i % len(names)]
+                self.request("POST /display.html", "POST", "/display.html", b"", {"molname": name, "zrot": str((i * 30) % 360)})
+
+    def run(self, clients, requests):
+        names = [self.upload()] #there is always something to render
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            for i in range(clients):
+                executor.submit(self.client, requests, names)
+        return time.perf_counter() - start
+
+    def report(self, elapsed):
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        print(f"{total} requests in {elapsed:.2f}s: {total / elapsed:.1f} requests/s, {self.errors} errors")
+        for kind, latencies in sorted(self.latencies.items()):
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2] * 1000
+            p95 = latencies[int(len(latencies) * 0.95)] * 1000
+            print(f"  {kind:20} {len(latencies):6} requests  p50 {p50:8.2f}ms  p95 {p95:8.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent load test for ajaxserver.py")
+    parser.add_argument("port", type=int)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--clients", type=int, default=16, help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=100, help="requests made by each client")
+    parser.add_argument("--sdf", default="caffeine-3D-structure-CT1001987571(1).sdf", help="file uploaded by the test")
+    args = parser.parse_args()
+
+    with open(args.sdf, "rb") as fp:
+        sdf = fp.read()
+    test = LoadTest(args.host, args.port, sdf)
+    test.report(test.run(args.clients, args.requests))
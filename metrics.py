@@ -0,0 +1,102 @@
+import bisect
+import contextlib
+import functools
+import threading
+import time
+
+# counters and latency histograms for finding where the time goes, e.g.
+#     with metrics.timer("stage_seconds", stage="sort"):
+#         mol.sort()
+# or @metrics.timed("db_seconds", op="load_mol") on a function
+# render() returns every metric in the Prometheus text format, which ajaxserver.py serves at /metrics
+
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10) #histogram bucket bounds in seconds
+
+def key(name, labels):
+    #the metric name with its labels, e.g. request_seconds{endpoint="/upload"}
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in sorted(labels.items())) + "}"
+
+class Histogram():
+    #counts observations into cumulative buckets, plus their count and sum
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) #the last one counts observations above every bucket
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+class Metrics():
+    #a registry of counters and histograms, safe to share between the server's threads
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counters = {} #(name, labels) -> count
+        self.histograms = {} #(name, labels) -> Histogram
+        self.lock = threading.Lock()
+
+    def count(self, name, n=1, **labels):
+        labels = tuple(sorted(labels.items()))
+        with self.lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0) + n
+
+    def observe(self, name, seconds, **labels):
+        labels = tuple(sorted(labels.items()))
+        with self.lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[(name, labels)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextlib.contextmanager
+    def timer(self, name, **labels):
+        #observes the seconds spent in the with block, whether or not it raises
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name, **labels):
+        #decorator that observes the seconds spent in every call of the function
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render(self):
+        #every counter and histogram in the Prometheus text exposition format
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((k, (list(h.counts), h.count, h.sum)) for k, h in self.histograms.items())
+        lines = []
+        for (name, labels), value in counters:
+            lines.append(f"{key(name, dict(labels))} {value}")
+        for (name, labels), (counts, count, total) in histograms:
+            cumulative = 0
+            for bound, n in zip(self.buckets + ("+Inf",), counts):
+                cumulative += n
+                lines.append(f"{key(name + '_bucket', dict(labels, le=bound))} {cumulative}")
+            lines.append(f"{key(name + '_count', dict(labels))} {count}")
+            lines.append(f"{key(name + '_sum', dict(labels))} {total:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+registry = Metrics() #the registry the server and molsql record into
+
+count = registry.count
+observe = registry.observe
+timer = registry.timer
+timed = registry.timed
+render = registry.render
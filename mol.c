@@ -6,10 +6,45 @@
 * If a malloc returns a NULL, the return value of the calling function should also be NULL
 */
 
+static const char *element_symbols[ELEMENT_CODES] = {"",
+	"H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne", "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar", "K", "Ca",
+	"Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn", "Ga", "Ge", "As", "Se", "Br", "Kr", "Rb", "Sr", "Y", "Zr",
+	"Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn", "Sb", "Te", "I", "Xe", "Cs", "Ba", "La", "Ce", "Pr", "Nd",
+	"Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb", "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg",
+	"Tl", "Pb", "Bi", "Po", "At", "Rn", "Fr", "Ra", "Ac", "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm",
+	"Md", "No", "Lr", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og"
+}; //element_symbols[code] is the element with atomic number code
+
+static const double covalent_radii[ELEMENT_CODES] = {0,
+	0.31, 0.28, 1.28, 0.96, 0.84, 0.76, 0.71, 0.66, 0.57, 0.58, 1.66, 1.41, 1.21, 1.11, 1.07, 1.05, 1.02, 1.06, 2.03, 1.76,
+	1.70, 1.60, 1.53, 1.39, 1.39, 1.32, 1.26, 1.24, 1.32, 1.22, 1.22, 1.20, 1.19, 1.20, 1.20, 1.16, 2.20, 1.95, 1.90, 1.75,
+	1.64, 1.54, 1.47, 1.46, 1.42, 1.39, 1.45, 1.44, 1.42, 1.39, 1.39, 1.38, 1.39, 1.40, 2.44, 2.15, 2.07, 2.04, 2.03, 2.01,
+	1.99, 1.98, 1.98, 1.96, 1.94, 1.92, 1.92, 1.89, 1.90, 1.87, 1.87, 1.75, 1.70, 1.62, 1.51, 1.44, 1.41, 1.36, 1.36, 1.32,
+	1.45, 1.46, 1.48, 1.40, 1.50, 1.50, 2.60, 2.21, 2.15, 2.06, 2.00, 1.96, 1.90, 1.87, 1.80, 1.69, 1.50, 1.50, 1.50, 1.50,
+	1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50, 1.50
+}; //covalent_radii[code] in Angstroms (Cordero et al. 2008), elements past curium have none measured and use 1.50
+
+unsigned char element_code( const char *element ){
+//return the atomic number of element, or 0 if it is not in the periodic table
+	for(int code = 1; code < ELEMENT_CODES; code++){
+		if(element_symbols[code][0] == element[0] && strcmp(element_symbols[code], element) == 0){
+			return code;
+		}
+	}
+	return 0;
+}
+
+const char *element_symbol( unsigned char code ){
+//return the element with atomic number code, or "" if there is none
+	return code < ELEMENT_CODES ? element_symbols[code] : "";
+}
+
 void atomset( atom *atom, char element[3], double *x, double *y, double *z ){
 //copy the values pointed to by element x,y,z into the atom stored at atom
 //all pointer addresses have sufficient memory allocated to them
-	strcpy(atom->element, element);
+	strncpy(atom->element, element, 3); //pads the element with nulls so every byte of it is set
+	atom->element[2] = '\0';
+	atom->code = element_code(atom->element); //so the element can be looked up by index instead of by string
 	atom->x = *x;
 	atom->y = *y;
 	atom->z = *z;
@@ -24,21 +59,19 @@ void atomget( atom *atom, char element[3], double *x, double *y, double *z ){
 	*z = atom->z;
 }
 
-void bondset( bond *bond, unsigned short *a1, unsigned short *a2, atom **atoms, unsigned char *epairs ){
+void bondset( bond *bond, unsigned int *a1, unsigned int *a2, atom **atoms, unsigned char *epairs ){
 //copy the values a1, a2, atoms and epairs into the corresponding structure attributes in bond	
 //all pointer addresses have sufficient memory allocated to them
 //you are NOT copying atom structures, only the ADDRESSES of the atom structures
 //call compute_coords function on the bond
 	bond->a1 = *a1;
 	bond->a2 = *a2;
-	for (int i = 0; i < 2; i++) {
-		bond->atoms[i] = *atoms[i];
-	}
+	bond->atoms = *atoms; //the bond shares the molecule's atoms array
 	bond->epairs = *epairs;
 	compute_coords(bond);
 }
 
-void bondget( bond *bond, unsigned short *a1, unsigned short *a2, atom **atoms, unsigned char *epairs ){
+void bondget( bond *bond, unsigned int *a1, unsigned int *a2, atom **atoms, unsigned char *epairs ){
 //copy the structure attributes in bond to their corresponding arguments: a1, a2, atoms and epairs
 //all pointer addresses have sufficient memory allocated to them
 //you are NOT copying atom structures, only the ADDRESSES of the atom structures
@@ -63,7 +96,7 @@ void compute_coords( bond *bond){
 	bond->dy = (bond->y2 - bond->y1) / bond->len;
 }
 
-molecule *molmalloc( unsigned short atom_max, unsigned short bond_max ){
+molecule *molmalloc( size_t atom_max, size_t bond_max ){
 //return the address of a malloced area of memory, large enough to hold a molecule
 //copy atom_max value into structure
 //atom_no in the structure should be set to zero
@@ -77,6 +110,7 @@ molecule *molmalloc( unsigned short atom_max, unsigned short bond_max ){
 	}
 	aMolecule->atom_max = atom_max;
 	aMolecule->atom_no = 0;
+	aMolecule->exports = 0;
 
 	if(aMolecule->atom_max == 0){
 		aMolecule->atoms = malloc(sizeof(struct atom));
@@ -118,13 +152,17 @@ molecule *molcopy( molecule *src ){
 //use molappend atom and bond to add the atoms from src to the new molecule
 
 	molecule *copiedMol = molmalloc(src->atom_max, src->bond_max);
+	if(copiedMol == NULL){
+		return NULL;
+	}
 
-	for(int i = 0; i < src->atom_no; i++){
+	for(size_t i = 0; i < src->atom_no; i++){
 		molappend_atom(copiedMol, &src->atoms[i]);
 	} //copy the atoms from src to the new molecule
 
-	for(int i = 0; i < src->bond_no; i++){
+	for(size_t i = 0; i < src->bond_no; i++){
 		molappend_bond(copiedMol, &src->bonds[i]);
+		(copiedMol->bonds)[i].atoms = copiedMol->atoms; //the copied bonds belong to the copied atoms, not the ones in src
 	}
 
 	return copiedMol;
@@ -139,75 +177,83 @@ void molfree( molecule *ptr ){
 	free(ptr);
 }
 
-void molappend_atom( molecule *molecule, atom *atom ){
-//copy the data pointed to by atom to the first "empty" atom in atoms in the molecule pointed to by molecule
-//set the first "empty" pointer in atom_ptrs to the same atom in the atoms array, incrementing the value of atom_no
-//use realloc for atoms and atom_ptrs so that a larger amount of memory is allocated and existing data is copied to the new location
-
-	if(molecule->atom_no == molecule->atom_max){ 
-		if(molecule->atom_max == 0){ //if the atom number and the atom max are both 0
-			(molecule->atom_max)++;
+static int molgrow_atoms( molecule *molecule, size_t atom_max ){
+//realloc atoms and atom_ptrs to hold atom_max atoms, returns -1 if realloc fails
+//atom_ptrs keeps its (sorted) order and every bond is pointed at the new atoms, so no pointer is left dangling
+//the pointers are rebased before atom_ptrs is realloced, so they stay valid even if that realloc fails
+	uintptr_t old = (uintptr_t)molecule->atoms;
 
-			molecule->atoms = realloc(molecule->atoms, sizeof(struct atom) * (molecule->atom_max));
-			//increment the max and allocate space for an atom
-
-			if (molecule->atoms == NULL){
-				fprintf(stderr, "realloc failed1\n");
-				exit(-1);
-			} //print error message and exit if malloc fails
-
-			molecule->atom_ptrs = realloc(molecule->atom_ptrs, sizeof(struct atom*) * (molecule->atom_max));
-
-			if (molecule->atom_ptrs == NULL){
-				fprintf(stderr, "realloc failed2\n");
-				exit(-1);
-			}
-
-			for(int i = 0; i < molecule->atom_no; i++){
-				(molecule->atom_ptrs)[i] = &((molecule->atoms)[i]);
-			} //recalculate the pointers in case they got moved to another place in memory
+	atom *atoms = realloc(molecule->atoms, sizeof(struct atom) * atom_max);
+	if(atoms == NULL){
+		return -1;
+	}
+	molecule->atoms = atoms;
+
+	if((uintptr_t)atoms != old){ //only when the atoms moved
+		for(size_t i = 0; i < molecule->atom_no; i++){
+			molecule->atom_ptrs[i] = &atoms[((uintptr_t)molecule->atom_ptrs[i] - old) / sizeof(struct atom)];
+		} //move each pointer to the same atom in the new array
+		for(size_t i = 0; i < molecule->bond_no; i++){
+			(molecule->bonds)[i].atoms = atoms;
 		}
-		else{
-			(molecule->atom_max) *= 2;
-
-			molecule->atoms = realloc(molecule->atoms, sizeof(struct atom) * (molecule->atom_max));
+	}
 
-			if (molecule->atoms == NULL){
-				fprintf(stderr, "realloc failed3\n");
-				exit(-1);
-			}
+	atom **atom_ptrs = realloc(molecule->atom_ptrs, sizeof(struct atom*) * atom_max);
+	if(atom_ptrs == NULL){
+		return -1; //atom_max is unchanged, atoms is only bigger than it needs to be
+	}
+	molecule->atom_ptrs = atom_ptrs;
+	molecule->atom_max = atom_max;
+	return 0;
+}
 
-			molecule->atom_ptrs = realloc(molecule->atom_ptrs, sizeof(struct atom*) * (molecule->atom_max));
+static int molgrow_bonds( molecule *molecule, size_t bond_max ){
+//same as molgrow_atoms but for bonds
+	uintptr_t old = (uintptr_t)molecule->bonds;
 
-        	if (molecule->atom_ptrs == NULL){
-				fprintf(stderr, "realloc failed4\n");
-				exit(-1);
-			}
+	bond *bonds = realloc(molecule->bonds, sizeof(struct bond) * bond_max);
+	if(bonds == NULL){
+		return -1;
+	}
+	molecule->bonds = bonds;
 
-			for(int i = 0; i < molecule->atom_no; i++){
-				(molecule->atom_ptrs)[i] = &((molecule->atoms)[i]);
-			}
+	if((uintptr_t)bonds != old){
+		for(size_t i = 0; i < molecule->bond_no; i++){
+			molecule->bond_ptrs[i] = &bonds[((uintptr_t)molecule->bond_ptrs[i] - old) / sizeof(struct bond)];
 		}
 	}
-	else if(molecule->atom_max == 0){
-			(molecule->atom_max)++;
-			
-			molecule->atoms = realloc(molecule->atoms, sizeof(struct atom) * (molecule->atom_max));
 
-			if (molecule->atoms == NULL){
-				fprintf(stderr, "realloc failed5\n");
-				exit(-1);
-			}
+	bond **bond_ptrs = realloc(molecule->bond_ptrs, sizeof(struct bond*) * bond_max);
+	if(bond_ptrs == NULL){
+		return -1;
+	}
+	molecule->bond_ptrs = bond_ptrs;
+	molecule->bond_max = bond_max;
+	return 0;
+}
 
-			molecule->atom_ptrs = realloc(molecule->atom_ptrs, sizeof(struct atom*) * (molecule->atom_max));
+int molreserve( molecule *molecule, size_t atom_max, size_t bond_max ){
+//make room for at least atom_max atoms and bond_max bonds so they can be appended without reallocing
+//returns 0, or -1 if realloc fails
+	if(atom_max > molecule->atom_max && molgrow_atoms(molecule, atom_max) < 0){
+		return -1;
+	}
+	if(bond_max > molecule->bond_max && molgrow_bonds(molecule, bond_max) < 0){
+		return -1;
+	}
+	return 0;
+}
 
-        	if (molecule->atom_ptrs == NULL){
-				fprintf(stderr, "realloc failed6\n");
-				exit(-1);
-			}
-			for(int i = 0; i < molecule->atom_no; i++){
-				(molecule->atom_ptrs)[i] = &((molecule->atoms)[i]);
-			}
+void molappend_atom( molecule *molecule, atom *atom ){
+//copy the data pointed to by atom to the first "empty" atom in atoms in the molecule pointed to by molecule
+//set the first "empty" pointer in atom_ptrs to the same atom in the atoms array, incrementing the value of atom_no
+//when the molecule is full atom_max is doubled, so appending n atoms reallocs only log(n) times
+
+	if(molecule->atom_no == molecule->atom_max){
+		if(molgrow_atoms(molecule, molecule->atom_max == 0 ? 1 : molecule->atom_max * 2) < 0){
+			fprintf(stderr, "realloc failed\n");
+			exit(-1);
+		} //print error message and exit if realloc fails
 	}
 
 	(molecule->atoms)[molecule->atom_no] = *atom; //append the atom to the empty space in the array
@@ -217,74 +263,111 @@ void molappend_atom( molecule *molecule, atom *atom ){
 
 void molappend_bond( molecule *molecule, bond *bond ){
 //same as molappend_atom but for bonds
-		if(molecule->bond_no == molecule->bond_max){
-		if(molecule->bond_max == 0){
-			(molecule->bond_max)++;
+	if(molecule->bond_no == molecule->bond_max){
+		if(molgrow_bonds(molecule, molecule->bond_max == 0 ? 1 : molecule->bond_max * 2) < 0){
+			fprintf(stderr, "realloc failed\n");
+			exit(-1);
+		}
+	}
 
-			molecule->bonds = realloc(molecule->bonds, sizeof(struct bond) * (molecule->bond_max));
+	(molecule->bonds)[molecule->bond_no] = *bond;
+	(molecule->bond_ptrs)[molecule->bond_no] = &((molecule->bonds)[molecule->bond_no]);
+	(molecule->bond_no)++;
+}
 
-			if (molecule->bonds == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
+static int molload_atoms( molecule *molecule, size_t atom_no, double *coords, char *elements, unsigned char *codes, size_t bond_no, unsigned int *bonds ){
+//molload and molload_codes, the elements of the atoms are given by elements if it is not NULL and otherwise by codes
 
-			molecule->bond_ptrs = realloc(molecule->bond_ptrs, sizeof(struct bond*) * (molecule->bond_max));
+	if(atom_no > UINT_MAX - molecule->atom_no){ //a1 and a2 could not refer to every atom
+		return -1;
+	}
+	size_t new_atom_no = molecule->atom_no + atom_no;
+	size_t new_bond_no = molecule->bond_no + bond_no;
 
-			if (molecule->bond_ptrs == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
+	for(size_t i = 0; i < bond_no; i++){
+		if(bonds[i*3] >= new_atom_no || bonds[i*3+1] >= new_atom_no){
+			return -1;
+		}
+	} //check the bonds before anything is changed
 
-			for(int i = 0; i < molecule->bond_no; i++){
-				(molecule->bond_ptrs)[i] = &((molecule->bonds)[i]);
-			}
+	for(size_t i = 0; elements == NULL && i < atom_no; i++){
+		if(codes[i] == 0 || codes[i] >= ELEMENT_CODES){
+			return -1;
 		}
-		else{
-			(molecule->bond_max) *= 2;
+	}
 
-			molecule->bonds = realloc(molecule->bonds, sizeof(struct bond) * (molecule->bond_max));
+	if(molreserve(molecule, new_atom_no, new_bond_no) < 0){
+		return -1;
+	}
 
-			if (molecule->bonds == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
+	for(size_t i = 0; i < atom_no; i++){
+		atom *a = &((molecule->atoms)[molecule->atom_no]);
+		char element[3];
+		if(elements != NULL){
+			memcpy(element, &elements[i*3], 3);
+			element[2] = '\0';
+		}
+		else{
+			strcpy(element, element_symbols[codes[i]]);
+		}
+		atomset(a, element, &coords[i*3], &coords[i*3+1], &coords[i*3+2]);
+		(molecule->atom_ptrs)[molecule->atom_no] = a;
+		(molecule->atom_no)++;
+	}
 
-			molecule->bond_ptrs = realloc(molecule->bond_ptrs, sizeof(struct bond*) * (molecule->bond_max));
+	for(size_t i = 0; i < bond_no; i++){
+		bond *b = &((molecule->bonds)[molecule->bond_no]);
+		b->a1 = bonds[i*3];
+		b->a2 = bonds[i*3+1];
+		b->epairs = bonds[i*3+2];
+		b->atoms = molecule->atoms;
+		compute_coords(b);
+		(molecule->bond_ptrs)[molecule->bond_no] = b;
+		(molecule->bond_no)++;
+	}
 
-        	if (molecule->bond_ptrs == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
+	return 0;
+}
 
-			for(int i = 0; i < molecule->bond_no; i++){
-				(molecule->bond_ptrs)[i] = &((molecule->bonds)[i]);
-			}
-		}
-	}
-	else if(molecule->bond_max == 0){
-			(molecule->bond_max)++;
-			
-			molecule->bonds = realloc(molecule->bonds, sizeof(struct bond) * (molecule->bond_max));
+int molload( molecule *molecule, size_t atom_no, double *coords, char *elements, size_t bond_no, unsigned int *bonds ){
+//append atom_no atoms and bond_no bonds from packed arrays in one call
+//coords holds the x, y and z of each atom, elements holds a null padded 3 char element for each atom
+//bonds holds a1, a2 and epairs for each bond, a1 and a2 are indices into the atoms of the molecule
+//atoms and bonds are realloced at most once, to exactly the size needed, and only if atom_max or bond_max are too small
+//return 0, or -1 if the counts are too large, a bond refers to an atom that does not exist, or realloc fails
+	return molload_atoms(molecule, atom_no, coords, elements, NULL, bond_no, bonds);
+}
 
-			if (molecule->bonds == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
+int molload_codes( molecule *molecule, size_t atom_no, double *coords, unsigned char *codes, size_t bond_no, unsigned int *bonds ){
+//same as molload, but codes holds the atomic number of each atom instead of its element
+//also returns -1 if a code is not an element in the periodic table
+	return molload_atoms(molecule, atom_no, coords, NULL, codes, bond_no, bonds);
+}
 
-			molecule->bond_ptrs = realloc(molecule->bond_ptrs, sizeof(struct bond*) * (molecule->bond_max));
+void molcodes( molecule *molecule, unsigned char *codes ){
+//copy the element code of each atom into codes, which must have room for atom_no codes
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		codes[i] = (molecule->atoms)[i].code;
+	}
+}
 
-        	if (molecule->bond_ptrs == NULL){
-				fprintf(stderr, "realloc failed\n");
-				exit(-1);
-			}
-			for(int i = 0; i < molecule->bond_no; i++){
-				(molecule->bond_ptrs)[i] = &((molecule->bonds)[i]);
-			}
+void molpack( molecule *molecule, double *coords, char *elements, unsigned int *bonds ){
+//the reverse of molload, copy the atoms and bonds into packed arrays in the same layout molload reads
+//coords, elements and bonds must have room for atom_no*3 doubles, atom_no*3 chars and bond_no*3 unsigned ints
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		atom *a = &((molecule->atoms)[i]);
+		coords[i*3] = a->x;
+		coords[i*3+1] = a->y;
+		coords[i*3+2] = a->z;
+		strncpy(&elements[i*3], a->element, 3); //pads the element with nulls
 	}
 
-	(molecule->bonds)[molecule->bond_no] = *bond;
-	(molecule->bond_ptrs)[molecule->bond_no] = &((molecule->bonds)[molecule->bond_no]);
-	(molecule->bond_no)++;
+	for(size_t i = 0; i < molecule->bond_no; i++){
+		bond *b = &((molecule->bonds)[i]);
+		bonds[i*3] = b->a1;
+		bonds[i*3+1] = b->a2;
+		bonds[i*3+2] = b->epairs;
+	}
 }
 
 int atomCompare(const void *a, const void *b){
@@ -297,10 +380,11 @@ int atomCompare(const void *a, const void *b){
 	if((*aPtr)->z < (*bPtr)->z){ //if the z value of the first atom is < the z value of the second atom
 		return -1;
 	}
-	else if ((*aPtr)->z == (*bPtr)->z){ //if the z values are equal
-		return 0;
+	else if ((*aPtr)->z > (*bPtr)->z){ //if the z value of the first atom is > the z value of the second atom
+		return 1;
 	}
-	return 1; //if the z value of the first atom is > the z value of the second atom
+	//equal z values are ordered by their place in the atoms array, so the order is the same on every run
+	return (*aPtr > *bPtr) - (*aPtr < *bPtr);
 
 }
 int bond_comp(const void *a, const void *b){ //change
@@ -313,10 +397,171 @@ int bond_comp(const void *a, const void *b){ //change
 	if((*aPtr)->z < (*bPtr)->z){
 		return -1;
 	}
-	else if ((*aPtr)->z == (*bPtr)->z){
+	else if ((*aPtr)->z > (*bPtr)->z){
+		return 1;
+	}
+	return (*aPtr > *bPtr) - (*aPtr < *bPtr);
+}
+
+typedef struct sort_key
+{
+	double z;
+	void *ptr;
+} sort_key; //the z of an atom or bond next to its pointer, so sorting never follows a pointer to compare
+
+static int key_less( const sort_key *a, const sort_key *b ){
+//the order of atomCompare and bond_comp: by z, equal z by address
+	if(a->z < b->z){
+		return 1;
+	}
+	if(a->z > b->z){
 		return 0;
 	}
-	return 1;
+	return (uintptr_t)a->ptr < (uintptr_t)b->ptr;
+}
+
+static void insertion_sort( sort_key *keys, size_t start, size_t sorted, size_t end ){
+//insert keys[sorted] to keys[end-1] into keys[start] to keys[sorted-1], which are already sorted
+	for(size_t i = sorted; i < end; i++){
+		sort_key key = keys[i];
+		size_t j = i;
+		while(j > start && key_less(&key, &keys[j-1])){
+			keys[j] = keys[j-1];
+			j--;
+		}
+		keys[j] = key;
+	}
+}
+
+static void merge( sort_key *src, sort_key *dst, size_t start, size_t middle, size_t end ){
+//merge the sorted src[start..middle) and src[middle..end) into dst[start..end), taking from the left on ties so the merge is stable
+	if(key_less(&src[middle-1], &src[middle]) || middle == end){
+		memcpy(&dst[start], &src[start], (end - start) * sizeof(sort_key));
+		return;
+	} //already in order, which is the common case for the runs of a molecule that has barely moved
+	size_t i = start, j = middle, k = start;
+	while(i < middle && j < end){
+		dst[k++] = key_less(&src[j], &src[i]) ? src[j++] : src[i++];
+	}
+	memcpy(&dst[k], &src[i], (middle - i) * sizeof(sort_key));
+	k += middle - i;
+	memcpy(&dst[k], &src[j], (end - j) * sizeof(sort_key));
+}
+
+static sort_key *natural_merge_sort( sort_key *keys, sort_key *scratch, size_t *runs, size_t n ){
+//sort keys with a natural merge sort: the runs already in order are found, short ones are extended to MOLSORT_MINRUN
+//by insertion sort and the runs are merged in pairs, so the nearly sorted order left by the last molsort and a small
+//rotation takes a few passes and already sorted keys take one
+//scratch holds n keys and runs n / MOLSORT_MINRUN + 2 sizes, returns whichever of keys and scratch the sorted keys end up in
+	size_t run_no = 0;
+	for(size_t start = 0; start < n; ){
+		size_t end = start + 1;
+		if(end < n && key_less(&keys[end], &keys[start])){
+			while(end < n && key_less(&keys[end], &keys[end-1])){
+				end++;
+			}
+			for(size_t i = start, j = end - 1; i < j; i++, j--){
+				sort_key swap = keys[i];
+				keys[i] = keys[j];
+				keys[j] = swap;
+			} //a strictly decreasing run is reversed, its keys are all different so the order stays the same as a stable sort
+		}
+		else{
+			while(end < n && !key_less(&keys[end], &keys[end-1])){
+				end++;
+			}
+		}
+		if(end - start < MOLSORT_MINRUN && end < n){
+			size_t extended = start + MOLSORT_MINRUN < n ? start + MOLSORT_MINRUN : n;
+			insertion_sort(keys, start, end, extended);
+			end = extended;
+		}
+		runs[run_no++] = start;
+		start = end;
+	}
+	runs[run_no] = n;
+
+	sort_key *src = keys, *dst = scratch;
+	while(run_no > 1){ //each pass merges the runs in pairs, halving the number of runs
+		size_t merged = 0;
+		for(size_t r = 0; r < run_no; r += 2){
+			if(r + 1 < run_no){
+				merge(src, dst, runs[r], runs[r+1], runs[r+2]);
+			}
+			else{
+				memcpy(&dst[runs[r]], &src[runs[r]], (runs[r+1] - runs[r]) * sizeof(sort_key));
+			}
+			runs[merged++] = runs[r];
+		}
+		runs[merged] = n;
+		run_no = merged;
+		sort_key *swap = src;
+		src = dst;
+		dst = swap;
+	}
+	return src;
+}
+
+static int sort_buffers( size_t n, sort_key **keys, sort_key **scratch, size_t **runs ){
+//malloc the buffers natural_merge_sort needs for n keys, returns -1 and frees them if any malloc fails
+	*keys = malloc(n * sizeof(sort_key));
+	*scratch = malloc(n * sizeof(sort_key));
+	*runs = malloc((n / MOLSORT_MINRUN + 2) * sizeof(size_t));
+	if(*keys == NULL || *scratch == NULL || *runs == NULL){
+		free(*keys);
+		free(*scratch);
+		free(*runs);
+		return -1;
+	}
+	return 0;
+}
+
+static int atom_sort( atom **ptrs, size_t n ){
+//sort ptrs in the order of atomCompare with natural_merge_sort, returns -1 if malloc fails
+	sort_key *keys, *scratch, *sorted;
+	size_t *runs;
+	if(n < 2){
+		return 0;
+	}
+	if(sort_buffers(n, &keys, &scratch, &runs) < 0){
+		return -1;
+	}
+	for(size_t i = 0; i < n; i++){
+		keys[i].z = ptrs[i]->z;
+		keys[i].ptr = ptrs[i];
+	}
+	sorted = natural_merge_sort(keys, scratch, runs, n);
+	for(size_t i = 0; i < n; i++){
+		ptrs[i] = sorted[i].ptr;
+	}
+	free(keys);
+	free(scratch);
+	free(runs);
+	return 0;
+}
+
+static int bond_sort( bond **ptrs, size_t n ){
+//same as atom_sort but for bonds, in the order of bond_comp
+	sort_key *keys, *scratch, *sorted;
+	size_t *runs;
+	if(n < 2){
+		return 0;
+	}
+	if(sort_buffers(n, &keys, &scratch, &runs) < 0){
+		return -1;
+	}
+	for(size_t i = 0; i < n; i++){
+		keys[i].z = ptrs[i]->z;
+		keys[i].ptr = ptrs[i];
+	}
+	sorted = natural_merge_sort(keys, scratch, runs, n);
+	for(size_t i = 0; i < n; i++){
+		ptrs[i] = sorted[i].ptr;
+	}
+	free(keys);
+	free(scratch);
+	free(runs);
+	return 0;
 }
 
 void molsort( molecule *molecule ){
@@ -324,10 +569,17 @@ void molsort( molecule *molecule ){
 //atom_ptrs[0] should point to the atom that contains the lowest z value
 //atom_ptrs[atom_no-1] should contain the highest z value
 //bond z values are the average z value of their 2 atoms
-//**HINT USE qsort** bond_ptrs[0] should point to the bond that has the lowest z value and bond_ptrs[atom_no-1] should contain the highest z value
+//bond_ptrs[0] should point to the bond that has the lowest z value and bond_ptrs[atom_no-1] should contain the highest z value
+//ties are broken by address so the order never changes between runs, the same order as atomCompare and bond_comp
+//the pointers are usually still nearly sorted from the last call, which the natural merge sort takes advantage of
+//qsort is only used if there is not enough memory for the merge sort's buffers
 
-	qsort(&molecule->atom_ptrs[0], molecule->atom_no, sizeof(atom*), atomCompare);
-	qsort(&molecule->bond_ptrs[0], molecule->bond_no, sizeof(bond*), bond_comp); //CHECK
+	if(atom_sort(molecule->atom_ptrs, molecule->atom_no) < 0){
+		qsort(&molecule->atom_ptrs[0], molecule->atom_no, sizeof(atom*), atomCompare);
+	}
+	if(bond_sort(molecule->bond_ptrs, molecule->bond_no) < 0){
+		qsort(&molecule->bond_ptrs[0], molecule->bond_no, sizeof(bond*), bond_comp);
+	}
 
 }
 
@@ -359,12 +611,23 @@ void zrotation( xform_matrix xform_matrix, unsigned short deg ){
 	xform_matrix [2][0] = 0; xform_matrix [2][1] = 0; xform_matrix [2][2] = 1;
 }
 
+void xyzrotation( xform_matrix xform_matrix, double xdeg, double ydeg, double zdeg ){
+//return the transformation matrix for a rotation of xdeg degrees around the x-axis, then ydeg around the y-axis, then zdeg around the z-axis
+//this is zrotation * yrotation * xrotation composed into one matrix, so the molecule only has to be transformed once
+	double x = xdeg * (M_PI / 180.0), y = ydeg * (M_PI / 180.0), z = zdeg * (M_PI / 180.0);
+	double cx = cos(x), sx = sin(x), cy = cos(y), sy = sin(y), cz = cos(z), sz = sin(z);
+
+	xform_matrix [0][0] = cz * cy; xform_matrix [0][1] = (cz * sy * sx) - (sz * cx); xform_matrix [0][2] = (cz * sy * cx) + (sz * sx);
+	xform_matrix [1][0] = sz * cy; xform_matrix [1][1] = (sz * sy * sx) + (cz * cx); xform_matrix [1][2] = (sz * sy * cx) - (cz * sx);
+	xform_matrix [2][0] = sy * -1; xform_matrix [2][1] = cy * sx; xform_matrix [2][2] = cy * cx;
+}
+
 void mol_xform( molecule *molecule, xform_matrix matrix ){
 //apply the transformation matrix to all the atoms of molecule by performing a vector matrix multiplication on the x,y,z coordinates
 //apply compute_coords to each bond in the molecule
 	double xTemp, yTemp, zTemp = 0.0; //create temporary variables to hold the values during multiple - avoids error in multiplying
 
-	for(int i = 0; i < molecule->atom_no; i++){ //perform the transformation on all of the atoms
+	for(size_t i = 0; i < molecule->atom_no; i++){ //perform the transformation on all of the atoms
 		xTemp = (molecule->atoms[i].x * matrix[0][0]) + (molecule->atoms[i].y * matrix[0][1]) + (molecule->atoms[i].z * matrix[0][2]);
 		yTemp = (molecule->atoms[i].x * matrix[1][0]) + (molecule->atoms[i].y * matrix[1][1]) + (molecule->atoms[i].z * matrix[1][2]); 
 		zTemp = (molecule->atoms[i].x * matrix[2][0]) + (molecule->atoms[i].y * matrix[2][1]) + (molecule->atoms[i].z * matrix[2][2]);
@@ -374,7 +637,249 @@ void mol_xform( molecule *molecule, xform_matrix matrix ){
 		molecule->atoms[i].z = zTemp;
 		//set the atoms values to the multiplied variables
 	}
-	for(int i = 0; i < molecule->bond_no; i++){ //perform the transformation on all of the bonds
+	for(size_t i = 0; i < molecule->bond_no; i++){ //perform the transformation on all of the bonds
 		compute_coords(&molecule->bonds[i]);
 	}
 }
+
+double covalent_radius( unsigned char code ){
+//return the covalent radius in Angstroms of the element with atomic number code, or 0 if there is none
+	return code < ELEMENT_CODES ? covalent_radii[code] : 0;
+}
+
+static size_t gridindex( double v, double min, double cell, size_t n ){
+//return the cell along one axis that holds v, clamped to the grid so atoms at the edge or with a nan coordinate still have a cell
+	double i = floor((v - min) / cell);
+	if(!(i >= 0)){
+		return 0;
+	}
+	if(i >= n){
+		return n - 1;
+	}
+	return (size_t)i;
+}
+
+static size_t gridcell( atom_grid *grid, atom *a ){
+//return the index of the cell that holds a
+	size_t ix = gridindex(a->x, grid->x, grid->cell, grid->nx);
+	size_t iy = gridindex(a->y, grid->y, grid->cell, grid->ny);
+	size_t iz = gridindex(a->z, grid->z, grid->cell, grid->nz);
+	return (iz * grid->ny + iy) * grid->nx + ix;
+}
+
+atom_grid *gridmalloc( molecule *molecule, double cell ){
+//return a grid of cubes of side at least cell over the atoms of molecule, built with a counting sort in O(atom_no + cells)
+//the cells are made larger when the atoms are spread out, so there are never more than about 2 cells per atom
+//return NULL if cell is not positive or malloc fails
+	if(!(cell > 0) || molecule->atom_no > UINT_MAX){
+		return NULL;
+	}
+	atom_grid *grid = malloc(sizeof(atom_grid));
+	if(grid == NULL){
+		return NULL;
+	}
+
+	double min[3] = {0, 0, 0}, max[3] = {0, 0, 0};
+	int found = 0;
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		atom *a = &(molecule->atoms[i]);
+		double xyz[3] = {a->x, a->y, a->z};
+		if(!isfinite(xyz[0]) || !isfinite(xyz[1]) || !isfinite(xyz[2])){
+			continue;
+		} //left out of the bounds, gridindex clamps them into a cell
+		for(int k = 0; k < 3; k++){
+			if(!found || xyz[k] < min[k]) min[k] = xyz[k];
+			if(!found || xyz[k] > max[k]) max[k] = xyz[k];
+		}
+		found = 1;
+	}
+
+	double limit = 2.0 * molecule->atom_no + 1;
+	double n[3], cells;
+	while(1){
+		cells = 1;
+		for(int k = 0; k < 3; k++){
+			n[k] = floor((max[k] - min[k]) / cell) + 1;
+			cells *= n[k];
+		}
+		if(cells <= limit){
+			break;
+		}
+		cell *= cbrt(cells / limit) * 1.01; //too sparse, grow the cells until there are few enough
+	}
+
+	grid->x = min[0]; grid->y = min[1]; grid->z = min[2];
+	grid->cell = cell;
+	grid->nx = n[0]; grid->ny = n[1]; grid->nz = n[2];
+	grid->atom_no = molecule->atom_no;
+	grid->start = calloc(grid->nx * grid->ny * grid->nz + 1, sizeof(size_t));
+	grid->atoms = malloc((molecule->atom_no ? molecule->atom_no : 1) * sizeof(unsigned int));
+	if(grid->start == NULL || grid->atoms == NULL){
+		gridfree(grid);
+		return NULL;
+	}
+
+	size_t cell_no = grid->nx * grid->ny * grid->nz;
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		(grid->start)[gridcell(grid, &(molecule->atoms[i])) + 1]++;
+	} //count the atoms in each cell
+	for(size_t c = 0; c < cell_no; c++){
+		(grid->start)[c + 1] += (grid->start)[c];
+	} //so each cell starts where the one before it ends
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		(grid->atoms)[(grid->start)[gridcell(grid, &(molecule->atoms[i]))]++] = i;
+	} //fills each cell in atom order, moving its start to its end
+	for(size_t c = cell_no; c > 0; c--){
+		(grid->start)[c] = (grid->start)[c - 1];
+	} //moves every start back to the beginning of its cell
+	(grid->start)[0] = 0;
+	return grid;
+}
+
+void gridfree( atom_grid *grid ){
+//free the grid and its arrays
+	free(grid->start);
+	free(grid->atoms);
+	free(grid);
+}
+
+size_t gridnear( atom_grid *grid, molecule *molecule, double x, double y, double z, double radius, unsigned int *near, size_t near_max ){
+//return the number of atoms of molecule within radius of x, y, z, and copy the indices of up to near_max of them into near
+//the grid must have been built from molecule, and the atoms not appended to since
+	double xyz[3] = {x, y, z}, corner[3] = {grid->x, grid->y, grid->z};
+	size_t n[3] = {grid->nx, grid->ny, grid->nz}, lo[3], hi[3], count = 0;
+
+	if(!(radius >= 0)){
+		return 0;
+	}
+	size_t widest = n[0] > n[1] ? (n[0] > n[2] ? n[0] : n[2]) : (n[1] > n[2] ? n[1] : n[2]);
+	double cells = ceil(radius / grid->cell);
+	size_t ring = cells < widest ? (size_t)cells : widest; //a radius wider than the grid covers all of it, and never overflows
+	for(int k = 0; k < 3; k++){
+		size_t c = gridindex(xyz[k], corner[k], grid->cell, n[k]);
+		lo[k] = c > ring ? c - ring : 0;
+		hi[k] = c + ring < n[k] ? c + ring : n[k] - 1;
+	}
+
+	for(size_t iz = lo[2]; iz <= hi[2]; iz++){
+		for(size_t iy = lo[1]; iy <= hi[1]; iy++){
+			for(size_t ix = lo[0]; ix <= hi[0]; ix++){
+				size_t c = (iz * grid->ny + iy) * grid->nx + ix;
+				for(size_t j = (grid->start)[c]; j < (grid->start)[c + 1]; j++){
+					atom *a = &(molecule->atoms[(grid->atoms)[j]]);
+					double dx = a->x - x, dy = a->y - y, dz = a->z - z;
+					if(dx * dx + dy * dy + dz * dz <= radius * radius){
+						if(count < near_max){
+							near[count] = (grid->atoms)[j];
+						}
+						count++;
+					}
+				}
+			}
+		}
+	}
+	return count;
+}
+
+static int perceive_pairs( molecule *molecule, atom_grid *grid, double *near, size_t c1, size_t c2, double tolerance ){
+//append a bond for each pair of an atom in cell c1 and an atom in cell c2 that is bonded, see molperceive
+//near holds the x, y, z and radius of the atoms in grid order, return 0, or -1 if realloc fails
+	for(size_t k1 = (grid->start)[c1]; k1 < (grid->start)[c1 + 1]; k1++){
+		double *p1 = &near[k1*4];
+		unsigned int i = (grid->atoms)[k1];
+		if(p1[3] <= 0){
+			continue;
+		}
+		for(size_t k2 = (grid->start)[c2]; k2 < (grid->start)[c2 + 1]; k2++){
+			double *p2 = &near[k2*4];
+			unsigned int j = (grid->atoms)[k2];
+			if(j <= i || p2[3] <= 0){
+				continue;
+			} //each pair once, from its lower numbered atom
+			double dx = p2[0] - p1[0], dy = p2[1] - p1[1], dz = p2[2] - p1[2];
+			double d2 = dx * dx + dy * dy + dz * dz, cutoff = p1[3] + p2[3] + tolerance;
+			if(cutoff <= 0 || d2 < 0.16 || d2 > cutoff * cutoff){
+				continue;
+			} //a negative tolerance can leave a pair of small atoms no room to bond at all
+
+			if(molecule->bond_no == molecule->bond_max &&
+			   molreserve(molecule, 0, molecule->bond_max == 0 ? 1 : molecule->bond_max * 2) < 0){
+				return -1;
+			}
+			bond *b = &((molecule->bonds)[molecule->bond_no]);
+			b->a1 = i;
+			b->a2 = j;
+			b->epairs = 1;
+			b->atoms = molecule->atoms;
+			compute_coords(b);
+			(molecule->bond_ptrs)[molecule->bond_no] = b;
+			(molecule->bond_no)++;
+		}
+	}
+	return 0;
+}
+
+int molperceive( molecule *molecule, const double *radii, double tolerance ){
+//append a single bond between every pair of atoms closer than the sum of their covalent radii plus tolerance
+//radii holds a radius in Angstroms for each element code, NULL uses covalent_radius, atoms with a radius of 0 get no bonds
+//pairs closer than 0.4 Angstroms are taken as overlapping atoms rather than bonded
+//only the atoms in the 27 cells around each atom are checked, so it runs in O(atom_no) for atoms spread like a molecule's
+//return 0, -1 if malloc or realloc fails, in which case the bonds found so far are kept,
+//or -2 if tolerance is not finite or so negative that 2 * the largest radius + tolerance is not positive
+	if(!isfinite(tolerance)){
+		return -2;
+	}
+	if(radii == NULL){
+		radii = covalent_radii;
+	}
+	double max_radius = 0;
+	for(size_t i = 0; i < molecule->atom_no; i++){
+		unsigned char code = molecule->atoms[i].code;
+		if(code < ELEMENT_CODES && radii[code] > max_radius){
+			max_radius = radii[code];
+		}
+	}
+	if(max_radius > 0 && !(2 * max_radius + tolerance > 0)){
+		return -2;
+	}
+	if(molecule->atom_no < 2 || max_radius <= 0){
+		return 0;
+	}
+
+	atom_grid *grid = gridmalloc(molecule, 2 * max_radius + tolerance);
+	if(grid == NULL){
+		return -1;
+	}
+
+	double *near = malloc(molecule->atom_no * 4 * sizeof(double));
+	if(near == NULL){
+		gridfree(grid);
+		return -1;
+	}
+	for(size_t k = 0; k < molecule->atom_no; k++){
+		atom *a = &(molecule->atoms[(grid->atoms)[k]]);
+		near[k*4] = a->x;
+		near[k*4+1] = a->y;
+		near[k*4+2] = a->z;
+		near[k*4+3] = a->code < ELEMENT_CODES ? radii[a->code] : 0;
+	} //x, y, z and radius of the atoms in grid order, so the atoms of neighbouring cells are close together in memory
+
+	size_t cell_no = grid->nx * grid->ny * grid->nz;
+	for(size_t c = 0; c < cell_no; c++){
+		size_t ix = c % grid->nx, iy = (c / grid->nx) % grid->ny, iz = c / (grid->nx * grid->ny);
+		for(int d = 0; d < 27; d++){ //the cell and the 26 around it, d % 3, d / 3 % 3 and d / 9 are the offsets plus 1
+			size_t jx = ix + d % 3, jy = iy + d / 3 % 3, jz = iz + d / 9;
+			if(jx < 1 || jx > grid->nx || jy < 1 || jy > grid->ny || jz < 1 || jz > grid->nz){
+				continue;
+			}
+			if(perceive_pairs(molecule, grid, near, c, ((jz - 1) * grid->ny + jy - 1) * grid->nx + jx - 1, tolerance) < 0){
+				free(near);
+				gridfree(grid);
+				return -1;
+			}
+		}
+	}
+	free(near);
+	gridfree(grid);
+	return 0;
+}
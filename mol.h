@@ -2,6 +2,14 @@
 #include <string.h>
 #include <stdlib.h>
 #include <math.h>
+#include <limits.h>
+#include <stdint.h>
+
+#ifndef MOLSORT_MINRUN
+#define MOLSORT_MINRUN 32 //runs shorter than this are extended by insertion sort before molsort merges them
+#endif
+
+#define ELEMENT_CODES 119 //element codes are atomic numbers, 1 to 118
 
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
@@ -10,12 +18,13 @@
 typedef struct atom
 {
 	char element[3]; //null-terminated string representing the element name of the atom
+	unsigned char code; //atomic number of the element, 0 if it is not in the periodic table, set by atomset
 	double x,y,z; //x,y, and z describe the position in Angstroms of the atom relative to a common origin for a molecule
 } atom; //an atom and its position in 3-D space
 
 typedef struct bond
 {
-	unsigned short a1, a2; //pointers to the two atoms in the co-valent bond, no need to free a1 or a2
+	unsigned int a1, a2; //indices of the two atoms in the co-valent bond, no need to free a1 or a2
 	unsigned char epairs;  //number of electron pairs in the bond (eparis=2 is a double bond)
 	atom *atoms;
 	double x1, x2, y1, y2, z, len, dx, dy; 
@@ -27,38 +36,68 @@ typedef struct bond
 
 typedef struct molecule
 {
-	unsigned short atom_max, atom_no; 
+	size_t atom_max, atom_no; 
 	//atom_max is a non-negative integer that records the dimensionality of an array pointed to by atoms
 	//atom_no is the number of atoms currently stored in the array atoms; never larger than atom_max
 	atom *atoms, **atom_ptrs; 
 	//allocate memory to the atoms pointer
 	//atoms_ptrs is an array of atoms pointers (size is the same?) and is initialized to to corresponding structures
 	//atoms_pts[0] points to atoms[0]
-	unsigned short bond_max, bond_no;
+	size_t bond_max, bond_no;
 	//bond_max is a non-negative integer that records the dimensionality of an array pointed to by bonds
 	//bond_no is the number of bonds currently stored in the array bonds; must never be larger than bond_max
 	bond *bonds, **bond_ptrs; 
 	//allocate memory to the bonds pointer
 	//bond_ptrs is an array of bonds pointers (size the same?) and is initialized to to corresponding structures
 	//bond_pts[0] points to bonds[0]
+	size_t exports;
+	//number of live buffer views into the arrays (the python views); nothing may realloc the arrays while it is not zero
 } molecule; //consists of zero or more atoms, and zero or more bonds
 
 typedef double xform_matrix[3][3]; //3-D transformation matrix
 
+typedef struct mx_wrapper
+{
+	xform_matrix xform_matrix;
+} mx_wrapper; //holds a transformation matrix so it can be built and passed around from python
+
+typedef struct atom_grid
+{
+	double x, y, z; //the corner of the grid, the smallest x, y and z of the atoms
+	double cell; //length of the side of each cube shaped cell, never less than the cell asked for
+	size_t nx, ny, nz; //number of cells along each axis
+	size_t atom_no; //number of atoms in the molecule when the grid was built
+	size_t *start; //the atoms in cell c are atoms[start[c]] up to atoms[start[c+1]], nx*ny*nz+1 offsets
+	unsigned int *atoms; //index of each atom in the molecule, ordered by cell
+} atom_grid; //uniform grid (cell list) over the atoms of a molecule, so the atoms near a point are found without checking every atom
+
+unsigned char element_code( const char *element );
+const char *element_symbol( unsigned char code );
 void atomset( atom *atom, char element[3], double *x, double *y, double *z );
 void atomget( atom *atom, char element[3], double *x, double *y, double *z );
-void bondset( bond *bond, unsigned short *a1, unsigned short *a2, atom **atoms, unsigned char *epairs );
-void bondget( bond *bond, unsigned short *a1, unsigned short *a2, atom **atoms, unsigned char *epairs );
+void bondset( bond *bond, unsigned int *a1, unsigned int *a2, atom **atoms, unsigned char *epairs );
+void bondget( bond *bond, unsigned int *a1, unsigned int *a2, atom **atoms, unsigned char *epairs );
 void compute_coords( bond *bond );
-molecule *molmalloc( unsigned short atom_max, unsigned short bond_max );
+molecule *molmalloc( size_t atom_max, size_t bond_max );
 molecule *molcopy( molecule *src );
 void molfree( molecule *ptr );
+int molreserve( molecule *molecule, size_t atom_max, size_t bond_max );
 void molappend_atom( molecule *molecule, atom *atom );
 void molappend_bond( molecule *molecule, bond *bond );
+int molload( molecule *molecule, size_t atom_no, double *coords, char *elements, size_t bond_no, unsigned int *bonds );
+int molload_codes( molecule *molecule, size_t atom_no, double *coords, unsigned char *codes, size_t bond_no, unsigned int *bonds );
+void molcodes( molecule *molecule, unsigned char *codes );
+void molpack( molecule *molecule, double *coords, char *elements, unsigned int *bonds );
 int atomCompare(const void *a, const void *b);
 int bond_comp(const void *a, const void *b);
 void molsort( molecule *molecule );
 void xrotation( xform_matrix xform_matrix, unsigned short deg );
 void yrotation( xform_matrix xform_matrix, unsigned short deg );
 void zrotation( xform_matrix xform_matrix, unsigned short deg );
+void xyzrotation( xform_matrix xform_matrix, double xdeg, double ydeg, double zdeg );
 void mol_xform( molecule *molecule, xform_matrix matrix );
+double covalent_radius( unsigned char code );
+atom_grid *gridmalloc( molecule *molecule, double cell );
+void gridfree( atom_grid *grid );
+size_t gridnear( atom_grid *grid, molecule *molecule, double x, double y, double z, double radius, unsigned int *near, size_t near_max );
+int molperceive( molecule *molecule, const double *radii, double tolerance );
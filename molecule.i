@@ -2,10 +2,84 @@
 %module molecule
 %{
   #include "mol.h"
+
+  // a read only buffer over memory inside a molecule that holds a reference to the molecule's python object
+  // so a memoryview or numpy array made from it keeps the molecule from being freed while the view is alive
+  // it is counted in mol->exports, so the molecule refuses to grow (and realloc the memory) while the view is alive
+  typedef struct
+  {
+    PyObject_HEAD
+    PyObject *owner;
+    molecule *mol;
+    void *buf;
+    Py_ssize_t len;
+  } molecule_view;
+
+  static int molecule_view_getbuffer( PyObject *self, Py_buffer *view, int flags )
+  {
+    molecule_view *v = (molecule_view *)self;
+    return PyBuffer_FillInfo( view, self, v->buf, v->len, 1, flags );
+  }
+
+  static void molecule_view_dealloc( PyObject *self )
+  {
+    ((molecule_view *)self)->mol->exports--;
+    Py_XDECREF( ((molecule_view *)self)->owner );
+    PyObject_Del( self );
+  }
+
+  static PyBufferProcs molecule_view_as_buffer = { molecule_view_getbuffer, NULL };
+
+  static PyTypeObject molecule_view_type = {
+    PyVarObject_HEAD_INIT( NULL, 0 )
+    .tp_name = "molecule.view",
+    .tp_basicsize = sizeof(molecule_view),
+    .tp_dealloc = molecule_view_dealloc,
+    .tp_as_buffer = &molecule_view_as_buffer,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "read only buffer over a molecule's memory that keeps the molecule alive",
+  };
+
+  // returns a read only memoryview of len bytes at buf, which is memory of mol, owned by owner
+  static PyObject *molecule_memoryview( PyObject *owner, molecule *mol, void *buf, Py_ssize_t len )
+  {
+    molecule_view *v;
+    PyObject *memory;
+
+    if ( PyType_Ready( &molecule_view_type ) < 0 )
+      return NULL;
+    v = PyObject_New( molecule_view, &molecule_view_type );
+    if ( v == NULL )
+      return NULL;
+    Py_INCREF( owner );
+    v->owner = owner;
+    v->mol = mol;
+    mol->exports++;
+    v->buf = buf;
+    v->len = len;
+
+    memory = PyMemoryView_FromObject( (PyObject *)v );
+    Py_DECREF( v );
+    return memory;
+  }
+
+  // sets BufferError and returns 1 if mol has live views, so its arrays must not be realloced, like resizing a bytearray
+  static int molecule_exported( molecule *mol )
+  {
+    if ( mol->exports == 0 )
+      return 0;
+    PyErr_SetString( PyExc_BufferError, "the molecule cannot grow while views of its arrays exist" );
+    return 1;
+  }
 %}
 
+%immutable molecule::exports;
+
 %include "mol.h"
 
+%constant size_t ATOM_SIZE = sizeof(atom);
+%constant size_t BOND_SIZE = sizeof(bond);
+
 %extend atom {
   atom( char element[3], double x, double y, double z )
   {
@@ -29,23 +103,12 @@
 };
 
 %extend mx_wrapper {
-  mx_wrapper( int xrot, int yrot, int zrot )
+  mx_wrapper( double xrot, double yrot, double zrot )
   {
     mx_wrapper *mx;
 
     mx = malloc( sizeof( mx_wrapper ) );
-    if ( (xrot!=0) && (yrot==0) && (zrot==0) )
-    {
-      xrotation( mx->xform_matrix, xrot );
-    }
-    if ( (xrot==0) && (yrot!=0) && (zrot==0) )
-    {
-      yrotation( mx->xform_matrix, yrot );
-    }
-    if ( (xrot==0) && (yrot==0) && (zrot!=0) )
-    {
-      zrotation( mx->xform_matrix, zrot );
-    }
+    xyzrotation( mx->xform_matrix, xrot, yrot, zrot ); // any combination of axes, composed into one matrix
 
     return mx;
   }
@@ -56,6 +119,53 @@
   }
 };
 
+%exception atom_grid::atom_grid {
+  $action
+  if ( result == NULL )
+  {
+    PyErr_SetString( PyExc_ValueError, "cell must be positive, or there was not enough memory for the grid" );
+    SWIG_fail;
+  }
+}
+
+%extend atom_grid {
+  // a uniform grid over the atoms of mol, valid until atoms are appended to mol or mol is freed
+  atom_grid( molecule *mol, double cell )
+  {
+    return gridmalloc( mol, cell );
+  }
+
+  ~atom_grid()
+  {
+    gridfree( $self );
+  }
+
+  // returns the indices of the atoms of mol within radius of x, y, z as a list, mol must be the molecule the grid was built from
+  PyObject *near( molecule *mol, double x, double y, double z, double radius )
+  {
+    unsigned int *near;
+    size_t count;
+    PyObject *list;
+
+    if ( mol->atom_no != $self->atom_no )
+    {
+      PyErr_SetString( PyExc_ValueError, "the molecule has changed since the grid was built" );
+      return NULL;
+    }
+    count = gridnear( $self, mol, x, y, z, radius, NULL, 0 );
+    near = malloc( (count ? count : 1) * sizeof(unsigned int) );
+    if ( near == NULL )
+      return PyErr_NoMemory();
+    gridnear( $self, mol, x, y, z, radius, near, count );
+
+    list = PyList_New( count );
+    for ( size_t i = 0; list != NULL && i < count; i++ )
+      PyList_SET_ITEM( list, i, PyLong_FromUnsignedLong( near[i] ) );
+    free( near );
+    return list;
+  }
+};
+
 %extend molecule {
   molecule()
   {
@@ -64,25 +174,33 @@
     return mol;
   }
 
+  molecule( size_t atom_max, size_t bond_max )
+  {
+    return molmalloc( atom_max, bond_max );
+  }
+
   ~molecule()
   {
     molfree($self);
   }
 
-  void append_atom( char element[3], double x, double y, double z )
+  // append_atom, append_bond, reserve, load and perceive_bonds raise BufferError while views of the molecule exist
+  PyObject *append_atom( char element[3], double x, double y, double z )
   {
     atom a1;
-    strcpy( a1.element, element );
-    a1.x = x;
-    a1.y = y;
-    a1.z = z;
+    if ( molecule_exported( $self ) )
+      return NULL;
+    atomset( &a1, element, &x, &y, &z ); // sets the element code and null pads the element
 
     molappend_atom( $self, &a1 );
+    Py_RETURN_NONE;
   }
 
-  void append_bond( unsigned short a1, unsigned short a2, unsigned char epairs )
+  PyObject *append_bond( unsigned int a1, unsigned int a2, unsigned char epairs )
   {
     bond b1;
+    if ( molecule_exported( $self ) )
+      return NULL;
     b1.a1 = a1;
     b1.a2 = a2;
     b1.atoms = $self->atoms;
@@ -91,14 +209,189 @@
     // printf( ">A> %hu %hu %lf\n", b1.a1, b1.a2, b1.z );
 
     molappend_bond( $self, &b1 );
+    Py_RETURN_NONE;
   }
 
-  atom *get_atom( unsigned short i )
+  // makes room for atom_max atoms and bond_max bonds up front, so appending them never reallocs
+  PyObject *reserve( size_t atom_max, size_t bond_max )
+  {
+    if ( molecule_exported( $self ) )
+      return NULL;
+    if ( molreserve( $self, atom_max, bond_max ) < 0 )
+      return PyErr_NoMemory();
+    Py_RETURN_NONE;
+  }
+
+  // coords, elements and bonds are bytes, array.array or any other buffer
+  // coords: x, y, z doubles per atom; elements: 3 null padded chars per atom, or one element code per atom
+  // bonds: a1, a2, epairs unsigned ints per bond (array.array('I'))
+  PyObject *load( PyObject *coords, PyObject *elements, PyObject *bonds )
+  {
+    Py_buffer c, e, b;
+    Py_ssize_t atom_no, bond_no;
+    int result;
+
+    if ( molecule_exported( $self ) )
+      return NULL;
+    if ( PyObject_GetBuffer( coords, &c, PyBUF_SIMPLE ) < 0 )
+      return NULL;
+    if ( PyObject_GetBuffer( elements, &e, PyBUF_SIMPLE ) < 0 )
+    {
+      PyBuffer_Release( &c );
+      return NULL;
+    }
+    if ( PyObject_GetBuffer( bonds, &b, PyBUF_SIMPLE ) < 0 )
+    {
+      PyBuffer_Release( &c );
+      PyBuffer_Release( &e );
+      return NULL;
+    }
+
+    atom_no = c.len / (3 * sizeof(double));
+    bond_no = b.len / (3 * sizeof(unsigned int));
+    if ( c.len % (3 * sizeof(double)) || (e.len != atom_no * 3 && e.len != atom_no) || b.len % (3 * sizeof(unsigned int)) )
+    {
+      PyErr_SetString( PyExc_ValueError, "buffer sizes do not match" );
+      result = -1;
+    }
+    else if ( (e.len == atom_no * 3 ? molload( $self, atom_no, c.buf, e.buf, bond_no, b.buf )
+                                    : molload_codes( $self, atom_no, c.buf, e.buf, bond_no, b.buf )) < 0 )
+    {
+      PyErr_SetString( PyExc_ValueError, "too many atoms or bonds, a bond refers to an atom that does not exist or an unknown element code" );
+      result = -1;
+    }
+    else
+    {
+      result = 0;
+    }
+
+    PyBuffer_Release( &c );
+    PyBuffer_Release( &e );
+    PyBuffer_Release( &b );
+    if ( result < 0 )
+      return NULL;
+    Py_RETURN_NONE;
+  }
+
+  // returns (coords, elements, bonds) as bytes in the layout load takes
+  PyObject *pack()
+  {
+    PyObject *coords, *elements, *bonds;
+
+    coords = PyBytes_FromStringAndSize( NULL, $self->atom_no * 3 * sizeof(double) );
+    elements = PyBytes_FromStringAndSize( NULL, $self->atom_no * 3 );
+    bonds = PyBytes_FromStringAndSize( NULL, $self->bond_no * 3 * sizeof(unsigned int) );
+    if ( coords == NULL || elements == NULL || bonds == NULL )
+    {
+      Py_XDECREF( coords );
+      Py_XDECREF( elements );
+      Py_XDECREF( bonds );
+      return NULL;
+    }
+
+    molpack( $self, (double *)PyBytes_AS_STRING( coords ), PyBytes_AS_STRING( elements ),
+             (unsigned int *)PyBytes_AS_STRING( bonds ) );
+    return Py_BuildValue( "(NNN)", coords, elements, bonds );
+  }
+
+  // returns the element code of each atom as bytes, in the order of the atoms array
+  PyObject *codes()
+  {
+    PyObject *codes = PyBytes_FromStringAndSize( NULL, $self->atom_no );
+    if ( codes == NULL )
+      return NULL;
+    molcodes( $self, (unsigned char *)PyBytes_AS_STRING( codes ) );
+    return codes;
+  }
+
+  // zero copy, read only memoryviews of the atoms and bonds arrays and of the atom_ptrs and bond_ptrs addresses
+  // each view holds a reference to the molecule, so it is never freed under the view
+  // they point into the molecule's arrays, which cannot be realloced while a view is alive (see molecule_exported)
+  // owner is the python object of the molecule, passed by the atoms_view, bonds_view... methods below
+  PyObject *_atoms_view( PyObject *owner )
+  {
+    return molecule_memoryview( owner, $self, $self->atoms, $self->atom_no * sizeof(atom) );
+  }
+
+  PyObject *_bonds_view( PyObject *owner )
+  {
+    return molecule_memoryview( owner, $self, $self->bonds, $self->bond_no * sizeof(bond) );
+  }
+
+  PyObject *_atom_ptrs_view( PyObject *owner )
+  {
+    return molecule_memoryview( owner, $self, $self->atom_ptrs, $self->atom_no * sizeof(atom *) );
+  }
+
+  PyObject *_bond_ptrs_view( PyObject *owner )
+  {
+    return molecule_memoryview( owner, $self, $self->bond_ptrs, $self->bond_no * sizeof(bond *) );
+  }
+
+  %pythoncode %{
+    def atoms_view(self):
+        return self._atoms_view(self)
+
+    def bonds_view(self):
+        return self._bonds_view(self)
+
+    def atom_ptrs_view(self):
+        return self._atom_ptrs_view(self)
+
+    def bond_ptrs_view(self):
+        return self._bond_ptrs_view(self)
+  %}
+
+  // returns (atoms, bonds) addresses, atom_ptrs[i] is atom number (atom_ptrs[i] - atoms) / ATOM_SIZE
+  PyObject *address()
+  {
+    return Py_BuildValue( "(NN)", PyLong_FromVoidPtr( $self->atoms ), PyLong_FromVoidPtr( $self->bonds ) );
+  }
+
+  // appends a single bond between each pair of atoms closer than their covalent radii plus tolerance Angstroms, returns the number added
+  // radii is None for the built-in covalent radii, or a buffer of ELEMENT_CODES doubles (array.array('d')) indexed by element code
+  // raises ValueError if tolerance is not finite, or is so negative no atoms could be bonded
+  PyObject *perceive_bonds( double tolerance = 0.45, PyObject *radii = Py_None )
+  {
+    Py_buffer r;
+    size_t bond_no = $self->bond_no;
+    int result;
+
+    if ( molecule_exported( $self ) )
+      return NULL;
+    if ( radii == Py_None )
+    {
+      result = molperceive( $self, NULL, tolerance );
+    }
+    else
+    {
+      if ( PyObject_GetBuffer( radii, &r, PyBUF_SIMPLE ) < 0 )
+        return NULL;
+      if ( r.len != ELEMENT_CODES * sizeof(double) )
+      {
+        PyBuffer_Release( &r );
+        PyErr_SetString( PyExc_ValueError, "radii must hold a double for every element code" );
+        return NULL;
+      }
+      result = molperceive( $self, r.buf, tolerance );
+      PyBuffer_Release( &r );
+    }
+    if ( result == -2 )
+    {
+      PyErr_SetString( PyExc_ValueError, "tolerance must be finite and larger than minus twice the largest covalent radius" );
+      return NULL;
+    }
+    if ( result < 0 )
+      return PyErr_NoMemory();
+    return PyLong_FromSize_t( $self->bond_no - bond_no );
+  }
+
+  atom *get_atom( size_t i )
   {
     return $self->atom_ptrs[i];
   }
 
-  bond *get_bond( unsigned short i )
+  bond *get_bond( size_t i )
   {
     return $self->bond_ptrs[i];
   }
@@ -112,6 +405,15 @@
   {
     mol_xform( self, xform_matrix );
   }
+
+  // rotates xrot degrees around the x-axis, then yrot around y, then zrot around z in one pass over the atoms
+  void rotate( double xrot, double yrot, double zrot )
+  {
+    xform_matrix matrix;
+
+    xyzrotation( matrix, xrot, yrot, zrot );
+    mol_xform( $self, matrix );
+  }
 };
 
 
@@ -61,11 +61,14 @@ class _SwigNonDynamicMeta(type):
     __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
 
 
+MOLSORT_MINRUN = _molecule.MOLSORT_MINRUN
+ELEMENT_CODES = _molecule.ELEMENT_CODES
 M_PI = _molecule.M_PI
 class atom(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
     element = property(_molecule.atom_element_get, _molecule.atom_element_set)
+    code = property(_molecule.atom_code_get, _molecule.atom_code_set)
     x = property(_molecule.atom_x_get, _molecule.atom_x_set)
     y = property(_molecule.atom_y_get, _molecule.atom_y_set)
     z = property(_molecule.atom_z_get, _molecule.atom_z_set)
@@ -111,9 +114,10 @@ class molecule(object):
     bond_no = property(_molecule.molecule_bond_no_get, _molecule.molecule_bond_no_set)
     bonds = property(_molecule.molecule_bonds_get, _molecule.molecule_bonds_set)
     bond_ptrs = property(_molecule.molecule_bond_ptrs_get, _molecule.molecule_bond_ptrs_set)
+    exports = property(_molecule.molecule_exports_get)
 
-    def __init__(self):
-        _molecule.molecule_swiginit(self, _molecule.new_molecule())
+    def __init__(self, *args):
+        _molecule.molecule_swiginit(self, _molecule.new_molecule(*args))
     __swig_destroy__ = _molecule.delete_molecule
 
     def append_atom(self, element, x, y, z):
@@ -122,6 +126,49 @@ class molecule(object):
     def append_bond(self, a1, a2, epairs):
         return _molecule.molecule_append_bond(self, a1, a2, epairs)
 
+    def reserve(self, atom_max, bond_max):
+        return _molecule.molecule_reserve(self, atom_max, bond_max)
+
+    def load(self, coords, elements, bonds):
+        return _molecule.molecule_load(self, coords, elements, bonds)
+
+    def pack(self):
+        return _molecule.molecule_pack(self)
+
+    def codes(self):
+        return _molecule.molecule_codes(self)
+
+    def _atoms_view(self, owner):
+        return _molecule.molecule__atoms_view(self, owner)
+
+    def _bonds_view(self, owner):
+        return _molecule.molecule__bonds_view(self, owner)
+
+    def _atom_ptrs_view(self, owner):
+        return _molecule.molecule__atom_ptrs_view(self, owner)
+
+    def _bond_ptrs_view(self, owner):
+        return _molecule.molecule__bond_ptrs_view(self, owner)
+
+    def atoms_view(self):
+        return self._atoms_view(self)
+
+    def bonds_view(self):
+        return self._bonds_view(self)
+
+    def atom_ptrs_view(self):
+        return self._atom_ptrs_view(self)
+
+    def bond_ptrs_view(self):
+        return self._bond_ptrs_view(self)
+
+
+    def address(self):
+        return _molecule.molecule_address(self)
+
+    def perceive_bonds(self, *args):
+        return _molecule.molecule_perceive_bonds(self, *args)
+
     def get_atom(self, i):
         return _molecule.molecule_get_atom(self, i)
 
@@ -131,9 +178,57 @@ class molecule(object):
     def sort(self):
         return _molecule.molecule_sort(self)
 
+    def xform(self, xform_matrix):
+        return _molecule.molecule_xform(self, xform_matrix)
+
+    def rotate(self, xrot, yrot, zrot):
+        return _molecule.molecule_rotate(self, xrot, yrot, zrot)
+
 # Register molecule in _molecule:
 _molecule.molecule_swigregister(molecule)
 
+class mx_wrapper(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    xform_matrix = property(_molecule.mx_wrapper_xform_matrix_get, _molecule.mx_wrapper_xform_matrix_set)
+
+    def __init__(self, xrot, yrot, zrot):
+        _molecule.mx_wrapper_swiginit(self, _molecule.new_mx_wrapper(xrot, yrot, zrot))
+    __swig_destroy__ = _molecule.delete_mx_wrapper
+
+# Register mx_wrapper in _molecule:
+_molecule.mx_wrapper_swigregister(mx_wrapper)
+
+class atom_grid(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    x = property(_molecule.atom_grid_x_get, _molecule.atom_grid_x_set)
+    y = property(_molecule.atom_grid_y_get, _molecule.atom_grid_y_set)
+    z = property(_molecule.atom_grid_z_get, _molecule.atom_grid_z_set)
+    cell = property(_molecule.atom_grid_cell_get, _molecule.atom_grid_cell_set)
+    nx = property(_molecule.atom_grid_nx_get, _molecule.atom_grid_nx_set)
+    ny = property(_molecule.atom_grid_ny_get, _molecule.atom_grid_ny_set)
+    nz = property(_molecule.atom_grid_nz_get, _molecule.atom_grid_nz_set)
+    atom_no = property(_molecule.atom_grid_atom_no_get, _molecule.atom_grid_atom_no_set)
+    start = property(_molecule.atom_grid_start_get, _molecule.atom_grid_start_set)
+    atoms = property(_molecule.atom_grid_atoms_get, _molecule.atom_grid_atoms_set)
+
+    def __init__(self, mol, cell):
+        _molecule.atom_grid_swiginit(self, _molecule.new_atom_grid(mol, cell))
+    __swig_destroy__ = _molecule.delete_atom_grid
+
+    def near(self, mol, x, y, z, radius):
+        return _molecule.atom_grid_near(self, mol, x, y, z, radius)
+
+# Register atom_grid in _molecule:
+_molecule.atom_grid_swigregister(atom_grid)
+
+
+def element_code(element):
+    return _molecule.element_code(element)
+
+def element_symbol(code):
+    return _molecule.element_symbol(code)
 
 def atomset(atom, element, x, y, z):
     return _molecule.atomset(atom, element, x, y, z)
@@ -159,12 +254,27 @@ def molcopy(src):
 def molfree(ptr):
     return _molecule.molfree(ptr)
 
+def molreserve(molecule, atom_max, bond_max):
+    return _molecule.molreserve(molecule, atom_max, bond_max)
+
 def molappend_atom(molecule, atom):
     return _molecule.molappend_atom(molecule, atom)
 
 def molappend_bond(molecule, bond):
     return _molecule.molappend_bond(molecule, bond)
 
+def molload(molecule, atom_no, coords, elements, bond_no, bonds):
+    return _molecule.molload(molecule, atom_no, coords, elements, bond_no, bonds)
+
+def molload_codes(molecule, atom_no, coords, codes, bond_no, bonds):
+    return _molecule.molload_codes(molecule, atom_no, coords, codes, bond_no, bonds)
+
+def molcodes(molecule, codes):
+    return _molecule.molcodes(molecule, codes)
+
+def molpack(molecule, coords, elements, bonds):
+    return _molecule.molpack(molecule, coords, elements, bonds)
+
 def atomCompare(a, b):
     return _molecule.atomCompare(a, b)
 
@@ -183,7 +293,27 @@ def yrotation(xform_matrix, deg):
 def zrotation(xform_matrix, deg):
     return _molecule.zrotation(xform_matrix, deg)
 
+def xyzrotation(xform_matrix, xdeg, ydeg, zdeg):
+    return _molecule.xyzrotation(xform_matrix, xdeg, ydeg, zdeg)
+
 def mol_xform(molecule, matrix):
     return _molecule.mol_xform(molecule, matrix)
 
+def covalent_radius(code):
+    return _molecule.covalent_radius(code)
+
+def gridmalloc(molecule, cell):
+    return _molecule.gridmalloc(molecule, cell)
+
+def gridfree(grid):
+    return _molecule.gridfree(grid)
+
+def gridnear(grid, molecule, x, y, z, radius, near, near_max):
+    return _molecule.gridnear(grid, molecule, x, y, z, radius, near, near_max)
+
+def molperceive(molecule, radii, tolerance):
+    return _molecule.molperceive(molecule, radii, tolerance)
+ATOM_SIZE = _molecule.ATOM_SIZE
+BOND_SIZE = _molecule.BOND_SIZE
+
 
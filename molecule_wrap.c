@@ -2668,16 +2668,19 @@ SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyO
 #define SWIGTYPE_p_a_3__a_3__double swig_types[0]
 #define SWIGTYPE_p_a_3__double swig_types[1]
 #define SWIGTYPE_p_atom swig_types[2]
-#define SWIGTYPE_p_bond swig_types[3]
-#define SWIGTYPE_p_char swig_types[4]
-#define SWIGTYPE_p_double swig_types[5]
-#define SWIGTYPE_p_molecule swig_types[6]
-#define SWIGTYPE_p_p_atom swig_types[7]
-#define SWIGTYPE_p_p_bond swig_types[8]
-#define SWIGTYPE_p_unsigned_char swig_types[9]
-#define SWIGTYPE_p_unsigned_short swig_types[10]
-static swig_type_info *swig_types[12];
-static swig_module_info swig_module = {swig_types, 11, 0, 0, 0, 0};
+#define SWIGTYPE_p_atom_grid swig_types[3]
+#define SWIGTYPE_p_bond swig_types[4]
+#define SWIGTYPE_p_char swig_types[5]
+#define SWIGTYPE_p_double swig_types[6]
+#define SWIGTYPE_p_molecule swig_types[7]
+#define SWIGTYPE_p_mx_wrapper swig_types[8]
+#define SWIGTYPE_p_p_atom swig_types[9]
+#define SWIGTYPE_p_p_bond swig_types[10]
+#define SWIGTYPE_p_size_t swig_types[11]
+#define SWIGTYPE_p_unsigned_char swig_types[12]
+#define SWIGTYPE_p_unsigned_int swig_types[13]
+static swig_type_info *swig_types[15];
+static swig_module_info swig_module = {swig_types, 14, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -2710,6 +2713,82 @@ static swig_module_info swig_module = {swig_types, 11, 0, 0, 0, 0};
 
   #include "mol.h"
 
+  // a read only buffer over memory inside a molecule that holds a reference to the molecule's python object
+  // so a memoryview or numpy array made from it keeps the molecule from being freed while the view is alive
+  // it is counted in mol->exports, so the molecule refuses to grow (and realloc the memory) while the view is alive
+  typedef struct
+  {
+    PyObject_HEAD
+    PyObject *owner;
+    molecule *mol;
+    void *buf;
+    Py_ssize_t len;
+  } molecule_view;
+
+  static int molecule_view_getbuffer( PyObject *self, Py_buffer *view, int flags )
+  {
+    molecule_view *v = (molecule_view *)self;
+    return PyBuffer_FillInfo( view, self, v->buf, v->len, 1, flags );
+  }
+
+  static void molecule_view_dealloc( PyObject *self )
+  {
+    ((molecule_view *)self)->mol->exports--;
+    Py_XDECREF( ((molecule_view *)self)->owner );
+    PyObject_Del( self );
+  }
+
+  static PyBufferProcs molecule_view_as_buffer = { molecule_view_getbuffer, NULL };
+
+  static PyTypeObject molecule_view_type = {
+    PyVarObject_HEAD_INIT( NULL, 0 )
+    .tp_name = "molecule.view",
+    .tp_basicsize = sizeof(molecule_view),
+    .tp_dealloc = molecule_view_dealloc,
+    .tp_as_buffer = &molecule_view_as_buffer,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "read only buffer over a molecule's memory that keeps the molecule alive",
+  };
+
+  // returns a read only memoryview of len bytes at buf, which is memory of mol, owned by owner
+  static PyObject *molecule_memoryview( PyObject *owner, molecule *mol, void *buf, Py_ssize_t len )
+  {
+    molecule_view *v;
+    PyObject *memory;
+
+    if ( PyType_Ready( &molecule_view_type ) < 0 )
+      return NULL;
+    v = PyObject_New( molecule_view, &molecule_view_type );
+    if ( v == NULL )
+      return NULL;
+    Py_INCREF( owner );
+    v->owner = owner;
+    v->mol = mol;
+    mol->exports++;
+    v->buf = buf;
+    v->len = len;
+
+    memory = PyMemoryView_FromObject( (PyObject *)v );
+    Py_DECREF( v );
+    return memory;
+  }
+
+  // sets BufferError and returns 1 if mol has live views, so its arrays must not be realloced, like resizing a bytearray
+  static int molecule_exported( molecule *mol )
+  {
+    if ( mol->exports == 0 )
+      return 0;
+    PyErr_SetString( PyExc_BufferError, "the molecule cannot grow while views of its arrays exist" );
+    return 1;
+  }
+
+
+SWIGINTERNINLINE PyObject*
+  SWIG_From_int  (int value)
+{
+  return PyInt_FromLong((long) value);
+}
+
 
   #define SWIG_From_double   PyFloat_FromDouble 
 
@@ -2896,6 +2975,16 @@ SWIG_strnlen(const char* s, size_t maxlen)
 }
 
 
+#include <limits.h>
+#if !defined(SWIG_NO_LLONG_MAX)
+# if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
+#   define LLONG_MAX __LONG_LONG_MAX__
+#   define LLONG_MIN (-LLONG_MAX - 1LL)
+#   define ULLONG_MAX (LLONG_MAX * 2ULL + 1ULL)
+# endif
+#endif
+
+
 SWIGINTERN int
 SWIG_AsVal_double (PyObject *obj, double *val)
 {
@@ -2941,25 +3030,6 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   return res;
 }
 
-SWIGINTERN struct atom *new_atom(char element[3],double x,double y,double z){
-    atom *a;
-    a = (atom *)malloc( sizeof(atom) );
-    atomset( a, element, &x, &y, &z );
-    return a;
-  }
-SWIGINTERN void delete_atom(struct atom *self){
-    free(self);
-  }
-
-#include <limits.h>
-#if !defined(SWIG_NO_LLONG_MAX)
-# if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
-#   define LLONG_MAX __LONG_LONG_MAX__
-#   define LLONG_MIN (-LLONG_MAX - 1LL)
-#   define ULLONG_MAX (LLONG_MAX * 2ULL + 1ULL)
-# endif
-#endif
-
 
 #include <float.h>
 
@@ -3046,15 +3116,15 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
 
 
 SWIGINTERN int
-SWIG_AsVal_unsigned_SS_short (PyObject * obj, unsigned short *val)
+SWIG_AsVal_unsigned_SS_char (PyObject * obj, unsigned char *val)
 {
   unsigned long v;
   int res = SWIG_AsVal_unsigned_SS_long (obj, &v);
   if (SWIG_IsOK(res)) {
-    if ((v > USHRT_MAX)) {
+    if ((v > UCHAR_MAX)) {
       return SWIG_OverflowError;
     } else {
-      if (val) *val = (unsigned short)(v);
+      if (val) *val = (unsigned char)(v);
     }
   }  
   return res;
@@ -3073,56 +3143,163 @@ SWIG_From_unsigned_SS_long  (unsigned long value)
 
 
 SWIGINTERNINLINE PyObject *
-SWIG_From_unsigned_SS_short  (unsigned short value)
+SWIG_From_unsigned_SS_char  (unsigned char value)
 {    
   return SWIG_From_unsigned_SS_long  (value);
 }
 
+SWIGINTERN struct atom *new_atom(char element[3],double x,double y,double z){
+    atom *a;
+    a = (atom *)malloc( sizeof(atom) );
+    atomset( a, element, &x, &y, &z );
+    return a;
+  }
+SWIGINTERN void delete_atom(struct atom *self){
+    free(self);
+  }
 
 SWIGINTERN int
-SWIG_AsVal_unsigned_SS_char (PyObject * obj, unsigned char *val)
+SWIG_AsVal_unsigned_SS_int (PyObject * obj, unsigned int *val)
 {
   unsigned long v;
   int res = SWIG_AsVal_unsigned_SS_long (obj, &v);
   if (SWIG_IsOK(res)) {
-    if ((v > UCHAR_MAX)) {
+    if ((v > UINT_MAX)) {
       return SWIG_OverflowError;
     } else {
-      if (val) *val = (unsigned char)(v);
+      if (val) *val = (unsigned int)(v);
     }
   }  
   return res;
 }
 
 
-SWIGINTERNINLINE PyObject *
-SWIG_From_unsigned_SS_char  (unsigned char value)
-{    
-  return SWIG_From_unsigned_SS_long  (value);
+SWIGINTERNINLINE PyObject*
+  SWIG_From_unsigned_SS_int  (unsigned int value)
+{
+  return PyInt_FromSize_t((size_t) value);
 }
 
 SWIGINTERN struct bond *new_bond(bond *bond){
     return bond;
   }
-SWIGINTERN struct molecule *new_molecule(void){
+
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, 0, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
+      if (val) *val = (unsigned long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+SWIGINTERNINLINE int
+SWIG_AsVal_size_t (PyObject * obj, size_t *val)
+{
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(size_t) <= sizeof(unsigned long long)) {
+    unsigned long long v;
+    res = SWIG_AsVal_unsigned_SS_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+  }
+#endif
+  return res;
+}
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong((long)(value));
+}
+#endif
+
+
+SWIGINTERNINLINE PyObject *
+SWIG_From_size_t  (size_t value)
+{    
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    return SWIG_From_unsigned_SS_long  ((unsigned long)(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else {
+    /* assume sizeof(size_t) <= sizeof(unsigned long long) */
+    return SWIG_From_unsigned_SS_long_SS_long  ((unsigned long long)(value));
+  }
+#endif
+}
+
+SWIGINTERN struct molecule *new_molecule__SWIG_0(void){
     molecule *mol;
     mol = molmalloc( 0, 0 );
     return mol;
   }
+SWIGINTERN struct molecule *new_molecule__SWIG_1(size_t atom_max,size_t bond_max){
+    return molmalloc( atom_max, bond_max );
+  }
 SWIGINTERN void delete_molecule(struct molecule *self){
     molfree(self);
   }
-SWIGINTERN void molecule_append_atom(struct molecule *self,char element[3],double x,double y,double z){
+SWIGINTERN PyObject *molecule_append_atom(struct molecule *self,char element[3],double x,double y,double z){
     atom a1;
-    strcpy( a1.element, element );
-    a1.x = x;
-    a1.y = y;
-    a1.z = z;
+    if ( molecule_exported( self ) )
+      return NULL;
+    atomset( &a1, element, &x, &y, &z ); // sets the element code and null pads the element
 
     molappend_atom( self, &a1 );
+    Py_RETURN_NONE;
   }
-SWIGINTERN void molecule_append_bond(struct molecule *self,unsigned short a1,unsigned short a2,unsigned char epairs){
+SWIGINTERN PyObject *molecule_append_bond(struct molecule *self,unsigned int a1,unsigned int a2,unsigned char epairs){
     bond b1;
+    if ( molecule_exported( self ) )
+      return NULL;
     b1.a1 = a1;
     b1.a2 = a2;
     b1.atoms = self->atoms;
@@ -3131,21 +3308,215 @@ SWIGINTERN void molecule_append_bond(struct molecule *self,unsigned short a1,uns
     // printf( ">A> %hu %hu %lf\n", b1.a1, b1.a2, b1.z );
 
     molappend_bond( self, &b1 );
+    Py_RETURN_NONE;
+  }
+SWIGINTERN PyObject *molecule_reserve(struct molecule *self,size_t atom_max,size_t bond_max){
+    if ( molecule_exported( self ) )
+      return NULL;
+    if ( molreserve( self, atom_max, bond_max ) < 0 )
+      return PyErr_NoMemory();
+    Py_RETURN_NONE;
+  }
+SWIGINTERN PyObject *molecule_load(struct molecule *self,PyObject *coords,PyObject *elements,PyObject *bonds){
+    Py_buffer c, e, b;
+    Py_ssize_t atom_no, bond_no;
+    int result;
+
+    if ( molecule_exported( self ) )
+      return NULL;
+    if ( PyObject_GetBuffer( coords, &c, PyBUF_SIMPLE ) < 0 )
+      return NULL;
+    if ( PyObject_GetBuffer( elements, &e, PyBUF_SIMPLE ) < 0 )
+    {
+      PyBuffer_Release( &c );
+      return NULL;
+    }
+    if ( PyObject_GetBuffer( bonds, &b, PyBUF_SIMPLE ) < 0 )
+    {
+      PyBuffer_Release( &c );
+      PyBuffer_Release( &e );
+      return NULL;
+    }
+
+    atom_no = c.len / (3 * sizeof(double));
+    bond_no = b.len / (3 * sizeof(unsigned int));
+    if ( c.len % (3 * sizeof(double)) || (e.len != atom_no * 3 && e.len != atom_no) || b.len % (3 * sizeof(unsigned int)) )
+    {
+      PyErr_SetString( PyExc_ValueError, "buffer sizes do not match" );
+      result = -1;
+    }
+    else if ( (e.len == atom_no * 3 ? molload( self, atom_no, c.buf, e.buf, bond_no, b.buf )
+                                    : molload_codes( self, atom_no, c.buf, e.buf, bond_no, b.buf )) < 0 )
+    {
+      PyErr_SetString( PyExc_ValueError, "too many atoms or bonds, a bond refers to an atom that does not exist or an unknown element code" );
+      result = -1;
+    }
+    else
+    {
+      result = 0;
+    }
+
+    PyBuffer_Release( &c );
+    PyBuffer_Release( &e );
+    PyBuffer_Release( &b );
+    if ( result < 0 )
+      return NULL;
+    Py_RETURN_NONE;
+  }
+SWIGINTERN PyObject *molecule_pack(struct molecule *self){
+    PyObject *coords, *elements, *bonds;
+
+    coords = PyBytes_FromStringAndSize( NULL, self->atom_no * 3 * sizeof(double) );
+    elements = PyBytes_FromStringAndSize( NULL, self->atom_no * 3 );
+    bonds = PyBytes_FromStringAndSize( NULL, self->bond_no * 3 * sizeof(unsigned int) );
+    if ( coords == NULL || elements == NULL || bonds == NULL )
+    {
+      Py_XDECREF( coords );
+      Py_XDECREF( elements );
+      Py_XDECREF( bonds );
+      return NULL;
+    }
+
+    molpack( self, (double *)PyBytes_AS_STRING( coords ), PyBytes_AS_STRING( elements ),
+             (unsigned int *)PyBytes_AS_STRING( bonds ) );
+    return Py_BuildValue( "(NNN)", coords, elements, bonds );
+  }
+SWIGINTERN PyObject *molecule_codes(struct molecule *self){
+    PyObject *codes = PyBytes_FromStringAndSize( NULL, self->atom_no );
+    if ( codes == NULL )
+      return NULL;
+    molcodes( self, (unsigned char *)PyBytes_AS_STRING( codes ) );
+    return codes;
+  }
+SWIGINTERN PyObject *molecule__atoms_view(struct molecule *self,PyObject *owner){
+    return molecule_memoryview( owner, self, self->atoms, self->atom_no * sizeof(atom) );
+  }
+SWIGINTERN PyObject *molecule__bonds_view(struct molecule *self,PyObject *owner){
+    return molecule_memoryview( owner, self, self->bonds, self->bond_no * sizeof(bond) );
+  }
+SWIGINTERN PyObject *molecule__atom_ptrs_view(struct molecule *self,PyObject *owner){
+    return molecule_memoryview( owner, self, self->atom_ptrs, self->atom_no * sizeof(atom *) );
+  }
+SWIGINTERN PyObject *molecule__bond_ptrs_view(struct molecule *self,PyObject *owner){
+    return molecule_memoryview( owner, self, self->bond_ptrs, self->bond_no * sizeof(bond *) );
+  }
+SWIGINTERN PyObject *molecule_address(struct molecule *self){
+    return Py_BuildValue( "(NN)", PyLong_FromVoidPtr( self->atoms ), PyLong_FromVoidPtr( self->bonds ) );
+  }
+SWIGINTERN PyObject *molecule_perceive_bonds(struct molecule *self,double tolerance,PyObject *radii){
+    Py_buffer r;
+    size_t bond_no = self->bond_no;
+    int result;
+
+    if ( molecule_exported( self ) )
+      return NULL;
+    if ( radii == Py_None )
+    {
+      result = molperceive( self, NULL, tolerance );
+    }
+    else
+    {
+      if ( PyObject_GetBuffer( radii, &r, PyBUF_SIMPLE ) < 0 )
+        return NULL;
+      if ( r.len != 119 * sizeof(double) )
+      {
+        PyBuffer_Release( &r );
+        PyErr_SetString( PyExc_ValueError, "radii must hold a double for every element code" );
+        return NULL;
+      }
+      result = molperceive( self, r.buf, tolerance );
+      PyBuffer_Release( &r );
+    }
+    if ( result == -2 )
+    {
+      PyErr_SetString( PyExc_ValueError, "tolerance must be finite and larger than minus twice the largest covalent radius" );
+      return NULL;
+    }
+    if ( result < 0 )
+      return PyErr_NoMemory();
+    return PyLong_FromSize_t( self->bond_no - bond_no );
   }
-SWIGINTERN atom *molecule_get_atom(struct molecule *self,unsigned short i){
+SWIGINTERN atom *molecule_get_atom(struct molecule *self,size_t i){
     return self->atom_ptrs[i];
   }
-SWIGINTERN bond *molecule_get_bond(struct molecule *self,unsigned short i){
+SWIGINTERN bond *molecule_get_bond(struct molecule *self,size_t i){
     return self->bond_ptrs[i];
   }
 SWIGINTERN void molecule_sort(struct molecule *self){
     molsort( self );
   }
+SWIGINTERN void molecule_xform(struct molecule *self,xform_matrix xform_matrix){
+    mol_xform( self, xform_matrix );
+  }
+SWIGINTERN void molecule_rotate(struct molecule *self,double xrot,double yrot,double zrot){
+    xform_matrix matrix;
 
-SWIGINTERNINLINE PyObject*
-  SWIG_From_int  (int value)
+    xyzrotation( matrix, xrot, yrot, zrot );
+    mol_xform( self, matrix );
+  }
+SWIGINTERN struct mx_wrapper *new_mx_wrapper(double xrot,double yrot,double zrot){
+    mx_wrapper *mx;
+
+    mx = malloc( sizeof( mx_wrapper ) );
+    xyzrotation( mx->xform_matrix, xrot, yrot, zrot ); // any combination of axes, composed into one matrix
+
+    return mx;
+  }
+SWIGINTERN void delete_mx_wrapper(struct mx_wrapper *self){
+    free( self );
+  }
+SWIGINTERN struct atom_grid *new_atom_grid(molecule *mol,double cell){
+    return gridmalloc( mol, cell );
+  }
+SWIGINTERN void delete_atom_grid(struct atom_grid *self){
+    gridfree( self );
+  }
+SWIGINTERN PyObject *atom_grid_near(struct atom_grid *self,molecule *mol,double x,double y,double z,double radius){
+    unsigned int *near;
+    size_t count;
+    PyObject *list;
+
+    if ( mol->atom_no != self->atom_no )
+    {
+      PyErr_SetString( PyExc_ValueError, "the molecule has changed since the grid was built" );
+      return NULL;
+    }
+    count = gridnear( self, mol, x, y, z, radius, NULL, 0 );
+    near = malloc( (count ? count : 1) * sizeof(unsigned int) );
+    if ( near == NULL )
+      return PyErr_NoMemory();
+    gridnear( self, mol, x, y, z, radius, near, count );
+
+    list = PyList_New( count );
+    for ( size_t i = 0; list != NULL && i < count; i++ )
+      PyList_SET_ITEM( list, i, PyLong_FromUnsignedLong( near[i] ) );
+    free( near );
+    return list;
+  }
+
+
+
+
+SWIGINTERNINLINE PyObject * 
+SWIG_FromCharPtr(const char *cptr)
+{ 
+  return SWIG_FromCharPtrAndSize(cptr, (cptr ? strlen(cptr) : 0));
+}
+
+
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_short (PyObject * obj, unsigned short *val)
 {
-  return PyInt_FromLong((long) value);
+  unsigned long v;
+  int res = SWIG_AsVal_unsigned_SS_long (obj, &v);
+  if (SWIG_IsOK(res)) {
+    if ((v > USHRT_MAX)) {
+      return SWIG_OverflowError;
+    } else {
+      if (val) *val = (unsigned short)(v);
+    }
+  }  
+  return res;
 }
 
 #ifdef __cplusplus
@@ -3210,28 +3581,28 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_atom_x_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_atom_code_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct atom *arg1 = (struct atom *) 0 ;
-  double arg2 ;
+  unsigned char arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
+  unsigned char val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "atom_x_set", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "atom_code_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_x_set" "', argument " "1"" of type '" "struct atom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_code_set" "', argument " "1"" of type '" "struct atom *""'"); 
   }
   arg1 = (struct atom *)(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_char(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_x_set" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_code_set" "', argument " "2"" of type '" "unsigned char""'");
   } 
-  arg2 = (double)(val2);
-  if (arg1) (arg1)->x = arg2;
+  arg2 = (unsigned char)(val2);
+  if (arg1) (arg1)->code = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3239,30 +3610,30 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_atom_x_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_atom_code_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct atom *arg1 = (struct atom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  double result;
+  unsigned char result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_x_get" "', argument " "1"" of type '" "struct atom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_code_get" "', argument " "1"" of type '" "struct atom *""'"); 
   }
   arg1 = (struct atom *)(argp1);
-  result = (double) ((arg1)->x);
-  resultobj = SWIG_From_double((double)(result));
+  result = (unsigned char) ((arg1)->code);
+  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_atom_y_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_atom_x_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct atom *arg1 = (struct atom *) 0 ;
   double arg2 ;
@@ -3272,7 +3643,59 @@ SWIGINTERN PyObject *_wrap_atom_y_set(PyObject *SWIGUNUSEDPARM(self), PyObject *
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "atom_y_set", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "atom_x_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_x_set" "', argument " "1"" of type '" "struct atom *""'"); 
+  }
+  arg1 = (struct atom *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_x_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->x = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_x_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom *arg1 = (struct atom *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_x_get" "', argument " "1"" of type '" "struct atom *""'"); 
+  }
+  arg1 = (struct atom *)(argp1);
+  result = (double) ((arg1)->x);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_y_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom *arg1 = (struct atom *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_y_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_y_set" "', argument " "1"" of type '" "struct atom *""'"); 
@@ -3448,10 +3871,10 @@ SWIGINTERN PyObject *atom_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
 SWIGINTERN PyObject *_wrap_bond_a1_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct bond *arg1 = (struct bond *) 0 ;
-  unsigned short arg2 ;
+  unsigned int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  unsigned int val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -3461,11 +3884,11 @@ SWIGINTERN PyObject *_wrap_bond_a1_set(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_a1_set" "', argument " "1"" of type '" "struct bond *""'"); 
   }
   arg1 = (struct bond *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_a1_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_a1_set" "', argument " "2"" of type '" "unsigned int""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (unsigned int)(val2);
   if (arg1) (arg1)->a1 = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -3480,7 +3903,7 @@ SWIGINTERN PyObject *_wrap_bond_a1_get(PyObject *SWIGUNUSEDPARM(self), PyObject
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  unsigned int result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -3489,8 +3912,8 @@ SWIGINTERN PyObject *_wrap_bond_a1_get(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_a1_get" "', argument " "1"" of type '" "struct bond *""'"); 
   }
   arg1 = (struct bond *)(argp1);
-  result = (unsigned short) ((arg1)->a1);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result = (unsigned int) ((arg1)->a1);
+  resultobj = SWIG_From_unsigned_SS_int((unsigned int)(result));
   return resultobj;
 fail:
   return NULL;
@@ -3500,10 +3923,10 @@ fail:
 SWIGINTERN PyObject *_wrap_bond_a2_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct bond *arg1 = (struct bond *) 0 ;
-  unsigned short arg2 ;
+  unsigned int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  unsigned int val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -3513,11 +3936,11 @@ SWIGINTERN PyObject *_wrap_bond_a2_set(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_a2_set" "', argument " "1"" of type '" "struct bond *""'"); 
   }
   arg1 = (struct bond *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_a2_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_a2_set" "', argument " "2"" of type '" "unsigned int""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (unsigned int)(val2);
   if (arg1) (arg1)->a2 = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -3532,7 +3955,7 @@ SWIGINTERN PyObject *_wrap_bond_a2_get(PyObject *SWIGUNUSEDPARM(self), PyObject
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  unsigned int result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -3541,8 +3964,8 @@ SWIGINTERN PyObject *_wrap_bond_a2_get(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_a2_get" "', argument " "1"" of type '" "struct bond *""'"); 
   }
   arg1 = (struct bond *)(argp1);
-  result = (unsigned short) ((arg1)->a2);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result = (unsigned int) ((arg1)->a2);
+  resultobj = SWIG_From_unsigned_SS_int((unsigned int)(result));
   return resultobj;
 fail:
   return NULL;
@@ -4128,10 +4551,10 @@ SWIGINTERN PyObject *bond_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
 SWIGINTERN PyObject *_wrap_molecule_atom_max_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  size_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -4141,11 +4564,11 @@ SWIGINTERN PyObject *_wrap_molecule_atom_max_set(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_atom_max_set" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_atom_max_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_atom_max_set" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (size_t)(val2);
   if (arg1) (arg1)->atom_max = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -4160,7 +4583,7 @@ SWIGINTERN PyObject *_wrap_molecule_atom_max_get(PyObject *SWIGUNUSEDPARM(self),
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  size_t result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -4169,8 +4592,8 @@ SWIGINTERN PyObject *_wrap_molecule_atom_max_get(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_atom_max_get" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  result = (unsigned short) ((arg1)->atom_max);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result =  ((arg1)->atom_max);
+  resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
 fail:
   return NULL;
@@ -4180,10 +4603,10 @@ fail:
 SWIGINTERN PyObject *_wrap_molecule_atom_no_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  size_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -4193,11 +4616,11 @@ SWIGINTERN PyObject *_wrap_molecule_atom_no_set(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_atom_no_set" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_atom_no_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_atom_no_set" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (size_t)(val2);
   if (arg1) (arg1)->atom_no = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -4212,7 +4635,7 @@ SWIGINTERN PyObject *_wrap_molecule_atom_no_get(PyObject *SWIGUNUSEDPARM(self),
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  size_t result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -4221,8 +4644,8 @@ SWIGINTERN PyObject *_wrap_molecule_atom_no_get(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_atom_no_get" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  result = (unsigned short) ((arg1)->atom_no);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result =  ((arg1)->atom_no);
+  resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
 fail:
   return NULL;
@@ -4336,10 +4759,10 @@ fail:
 SWIGINTERN PyObject *_wrap_molecule_bond_max_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  size_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -4349,11 +4772,11 @@ SWIGINTERN PyObject *_wrap_molecule_bond_max_set(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_bond_max_set" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_bond_max_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_bond_max_set" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (size_t)(val2);
   if (arg1) (arg1)->bond_max = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -4368,7 +4791,7 @@ SWIGINTERN PyObject *_wrap_molecule_bond_max_get(PyObject *SWIGUNUSEDPARM(self),
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  size_t result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -4377,8 +4800,8 @@ SWIGINTERN PyObject *_wrap_molecule_bond_max_get(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_bond_max_get" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  result = (unsigned short) ((arg1)->bond_max);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result =  ((arg1)->bond_max);
+  resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
 fail:
   return NULL;
@@ -4388,10 +4811,10 @@ fail:
 SWIGINTERN PyObject *_wrap_molecule_bond_no_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  size_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
@@ -4401,11 +4824,11 @@ SWIGINTERN PyObject *_wrap_molecule_bond_no_set(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_bond_no_set" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_bond_no_set" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_bond_no_set" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (size_t)(val2);
   if (arg1) (arg1)->bond_no = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -4420,7 +4843,7 @@ SWIGINTERN PyObject *_wrap_molecule_bond_no_get(PyObject *SWIGUNUSEDPARM(self),
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned short result;
+  size_t result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -4429,8 +4852,8 @@ SWIGINTERN PyObject *_wrap_molecule_bond_no_get(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_bond_no_get" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  result = (unsigned short) ((arg1)->bond_no);
-  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  result =  ((arg1)->bond_no);
+  resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
 fail:
   return NULL;
@@ -4541,12 +4964,64 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_molecule(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_exports_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_exports_get" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  result =  ((arg1)->exports);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_molecule__SWIG_0(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
+  PyObject *resultobj = 0;
+  struct molecule *result = 0 ;
+  
+  if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
+  result = (struct molecule *)new_molecule__SWIG_0();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_molecule__SWIG_1(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
+  size_t arg1 ;
+  size_t arg2 ;
+  size_t val1 ;
+  int ecode1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
   struct molecule *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "new_molecule", 0, 0, 0)) SWIG_fail;
-  result = (struct molecule *)new_molecule();
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  ecode1 = SWIG_AsVal_size_t(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_molecule" "', argument " "1"" of type '" "size_t""'");
+  } 
+  arg1 = (size_t)(val1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_molecule" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  result = (struct molecule *)new_molecule__SWIG_1(arg1,arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
@@ -4554,6 +5029,43 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_new_molecule(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_molecule", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 0) {
+    return _wrap_new_molecule__SWIG_0(self, argc, argv);
+  }
+  if (argc == 2) {
+    int _v;
+    {
+      int res = SWIG_AsVal_size_t(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      {
+        int res = SWIG_AsVal_size_t(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_new_molecule__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_molecule'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    molecule::molecule()\n"
+    "    molecule::molecule(size_t,size_t)\n");
+  return 0;
+}
+
+
 SWIGINTERN PyObject *_wrap_delete_molecule(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
@@ -4594,6 +5106,7 @@ SWIGINTERN PyObject *_wrap_molecule_append_atom(PyObject *SWIGUNUSEDPARM(self),
   double val5 ;
   int ecode5 = 0 ;
   PyObject *swig_obj[5] ;
+  PyObject *result = 0 ;
   
   if (!SWIG_Python_UnpackTuple(args, "molecule_append_atom", 5, 5, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
@@ -4621,8 +5134,8 @@ SWIGINTERN PyObject *_wrap_molecule_append_atom(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "molecule_append_atom" "', argument " "5"" of type '" "double""'");
   } 
   arg5 = (double)(val5);
-  molecule_append_atom(arg1,arg2,arg3,arg4,arg5);
-  resultobj = SWIG_Py_Void();
+  result = (PyObject *)molecule_append_atom(arg1,arg2,arg3,arg4,arg5);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
@@ -4632,18 +5145,19 @@ fail:
 SWIGINTERN PyObject *_wrap_molecule_append_bond(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
-  unsigned short arg3 ;
+  unsigned int arg2 ;
+  unsigned int arg3 ;
   unsigned char arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  unsigned int val2 ;
   int ecode2 = 0 ;
-  unsigned short val3 ;
+  unsigned int val3 ;
   int ecode3 = 0 ;
   unsigned char val4 ;
   int ecode4 = 0 ;
   PyObject *swig_obj[4] ;
+  PyObject *result = 0 ;
   
   if (!SWIG_Python_UnpackTuple(args, "molecule_append_bond", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
@@ -4651,202 +5165,1381 @@ SWIGINTERN PyObject *_wrap_molecule_append_bond(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_append_bond" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_append_bond" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_append_bond" "', argument " "2"" of type '" "unsigned int""'");
   } 
-  arg2 = (unsigned short)(val2);
-  ecode3 = SWIG_AsVal_unsigned_SS_short(swig_obj[2], &val3);
+  arg2 = (unsigned int)(val2);
+  ecode3 = SWIG_AsVal_unsigned_SS_int(swig_obj[2], &val3);
   if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molecule_append_bond" "', argument " "3"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molecule_append_bond" "', argument " "3"" of type '" "unsigned int""'");
   } 
-  arg3 = (unsigned short)(val3);
+  arg3 = (unsigned int)(val3);
   ecode4 = SWIG_AsVal_unsigned_SS_char(swig_obj[3], &val4);
   if (!SWIG_IsOK(ecode4)) {
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "molecule_append_bond" "', argument " "4"" of type '" "unsigned char""'");
   } 
   arg4 = (unsigned char)(val4);
-  molecule_append_bond(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_Py_Void();
+  result = (PyObject *)molecule_append_bond(arg1,arg2,arg3,arg4);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molecule_get_atom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_reserve(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  size_t arg2 ;
+  size_t arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  atom *result = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molecule_get_atom", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molecule_reserve", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_atom" "', argument " "1"" of type '" "struct molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_reserve" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_atom" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_reserve" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
-  result = (atom *)molecule_get_atom(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom, 0 |  0 );
+  arg2 = (size_t)(val2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molecule_reserve" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  result = (PyObject *)molecule_reserve(arg1,arg2,arg3);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molecule_get_bond(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_load(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *arg4 = (PyObject *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  bond *result = 0 ;
+  PyObject *swig_obj[4] ;
+  PyObject *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molecule_get_bond", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molecule_load", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_bond" "', argument " "1"" of type '" "struct molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_load" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_bond" "', argument " "2"" of type '" "unsigned short""'");
-  } 
-  arg2 = (unsigned short)(val2);
-  result = (bond *)molecule_get_bond(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_bond, 0 |  0 );
+  arg2 = swig_obj[1];
+  arg3 = swig_obj[2];
+  arg4 = swig_obj[3];
+  result = (PyObject *)molecule_load(arg1,arg2,arg3,arg4);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molecule_sort(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_pack(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_sort" "', argument " "1"" of type '" "struct molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_pack" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  molecule_sort(arg1);
-  resultobj = SWIG_Py_Void();
+  result = (PyObject *)molecule_pack(arg1);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *molecule_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_molecule, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
+SWIGINTERN PyObject *_wrap_molecule_codes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_codes" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  result = (PyObject *)molecule_codes(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
 }
 
-SWIGINTERN PyObject *molecule_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
 
-SWIGINTERN PyObject *_wrap_atomset(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule__atoms_view(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  atom *arg1 = (atom *) 0 ;
-  char *arg2 ;
-  double *arg3 = (double *) 0 ;
-  double *arg4 = (double *) 0 ;
-  double *arg5 = (double *) 0 ;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char temp2[3] ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  PyObject *swig_obj[5] ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "atomset", 5, 5, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "molecule__atoms_view", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomset" "', argument " "1"" of type '" "atom *""'"); 
-  }
-  arg1 = (atom *)(argp1);
-  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomset" "', argument " "2"" of type '" "char [3]""'");
-  }
-  arg2 = (char *)(temp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomset" "', argument " "3"" of type '" "double *""'"); 
-  }
-  arg3 = (double *)(argp3);
-  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomset" "', argument " "4"" of type '" "double *""'"); 
-  }
-  arg4 = (double *)(argp4);
-  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomset" "', argument " "5"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule__atoms_view" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
-  arg5 = (double *)(argp5);
-  atomset(arg1,arg2,arg3,arg4,arg5);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct molecule *)(argp1);
+  arg2 = swig_obj[1];
+  result = (PyObject *)molecule__atoms_view(arg1,arg2);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_atomget(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule__bonds_view(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  atom *arg1 = (atom *) 0 ;
-  char *arg2 ;
-  double *arg3 = (double *) 0 ;
-  double *arg4 = (double *) 0 ;
-  double *arg5 = (double *) 0 ;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char temp2[3] ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  PyObject *swig_obj[5] ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "atomget", 5, 5, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "molecule__bonds_view", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomget" "', argument " "1"" of type '" "atom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule__bonds_view" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
-  arg1 = (atom *)(argp1);
-  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
-  if (!SWIG_IsOK(res2)) {
+  arg1 = (struct molecule *)(argp1);
+  arg2 = swig_obj[1];
+  result = (PyObject *)molecule__bonds_view(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule__atom_ptrs_view(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule__atom_ptrs_view", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule__atom_ptrs_view" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  arg2 = swig_obj[1];
+  result = (PyObject *)molecule__atom_ptrs_view(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule__bond_ptrs_view(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule__bond_ptrs_view", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule__bond_ptrs_view" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  arg2 = swig_obj[1];
+  result = (PyObject *)molecule__bond_ptrs_view(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_address(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_address" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  result = (PyObject *)molecule_address(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_perceive_bonds(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  double arg2 = (double) 0.45 ;
+  PyObject *arg3 = (PyObject *) Py_None ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_perceive_bonds", 1, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_perceive_bonds" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  if (swig_obj[1]) {
+    ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+    if (!SWIG_IsOK(ecode2)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_perceive_bonds" "', argument " "2"" of type '" "double""'");
+    } 
+    arg2 = (double)(val2);
+  }
+  if (swig_obj[2]) {
+    arg3 = swig_obj[2];
+  }
+  result = (PyObject *)molecule_perceive_bonds(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_get_atom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  atom *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_get_atom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_atom" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_atom" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  result = (atom *)molecule_get_atom(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_get_bond(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bond *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_get_bond", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_bond" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_bond" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  result = (bond *)molecule_get_bond(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_bond, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_sort(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_sort" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  molecule_sort(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_xform(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  double (*arg2)[3] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_xform", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_xform" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molecule_xform" "', argument " "2"" of type '" "double [3][3]""'"); 
+  } 
+  arg2 = (double (*)[3])(argp2);
+  molecule_xform(arg1,(double (*)[3])arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_rotate(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_rotate", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_rotate" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_rotate" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molecule_rotate" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "molecule_rotate" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  molecule_rotate(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *molecule_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_molecule, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *molecule_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  double (*arg2)[3] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "mx_wrapper_xform_matrix_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "2"" of type '" "double [3][3]""'"); 
+  } 
+  arg2 = (double (*)[3])(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)3; ++ii) {
+        if (arg2[ii]) {
+          size_t jj = 0;
+          for (; jj < (size_t)3; ++jj) arg1->xform_matrix[ii][jj] = arg2[ii][jj];
+        } else {
+          SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
+        }
+      }
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double (*result)[3] = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_get" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  result = (double (*)[3]) ((arg1)->xform_matrix);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_a_3__double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_mx_wrapper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  double arg1 ;
+  double arg2 ;
+  double arg3 ;
+  double val1 ;
+  int ecode1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  struct mx_wrapper *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_mx_wrapper", 3, 3, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_mx_wrapper" "', argument " "1"" of type '" "double""'");
+  } 
+  arg1 = (double)(val1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_mx_wrapper" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_mx_wrapper" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  result = (struct mx_wrapper *)new_mx_wrapper(arg1,arg2,arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_mx_wrapper, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_mx_wrapper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_mx_wrapper" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  delete_mx_wrapper(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *mx_wrapper_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_mx_wrapper, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *mx_wrapper_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_atom_grid_x_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_x_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_x_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_x_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->x = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_x_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_x_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (double) ((arg1)->x);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_y_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_y_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_y_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_y_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->y = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_y_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_y_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (double) ((arg1)->y);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_z_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_z_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_z_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_z_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->z = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_z_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_z_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (double) ((arg1)->z);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_cell_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_cell_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_cell_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_cell_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->cell = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_cell_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_cell_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (double) ((arg1)->cell);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_nx_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_nx_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_nx_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_nx_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->nx = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_nx_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_nx_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result =  ((arg1)->nx);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_ny_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_ny_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_ny_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_ny_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->ny = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_ny_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_ny_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result =  ((arg1)->ny);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_nz_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_nz_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_nz_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_nz_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->nz = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_nz_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_nz_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result =  ((arg1)->nz);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_atom_no_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_atom_no_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_atom_no_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "atom_grid_atom_no_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->atom_no = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_atom_no_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_atom_no_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result =  ((arg1)->atom_no);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_start_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  size_t *arg2 = (size_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_start_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_start_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_size_t, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atom_grid_start_set" "', argument " "2"" of type '" "size_t *""'"); 
+  }
+  arg2 = (size_t *)(argp2);
+  if (arg1) (arg1)->start = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_start_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_start_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (size_t *) ((arg1)->start);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_size_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_atoms_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  unsigned int *arg2 = (unsigned int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_atoms_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_atoms_set" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atom_grid_atoms_set" "', argument " "2"" of type '" "unsigned int *""'"); 
+  }
+  arg2 = (unsigned int *)(argp2);
+  if (arg1) (arg1)->atoms = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_atoms_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_atoms_get" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  result = (unsigned int *) ((arg1)->atoms);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_atom_grid(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  struct atom_grid *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_atom_grid", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_atom_grid" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_atom_grid" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  {
+    result = (struct atom_grid *)new_atom_grid(arg1,arg2);
+    if ( result == NULL )
+    {
+      PyErr_SetString( PyExc_ValueError, "cell must be positive, or there was not enough memory for the grid" );
+      SWIG_fail;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom_grid, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_atom_grid(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_atom_grid" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  delete_atom_grid(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atom_grid_near(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct atom_grid *arg1 = (struct atom_grid *) 0 ;
+  molecule *arg2 = (molecule *) 0 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  PyObject *swig_obj[6] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atom_grid_near", 6, 6, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atom_grid_near" "', argument " "1"" of type '" "struct atom_grid *""'"); 
+  }
+  arg1 = (struct atom_grid *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atom_grid_near" "', argument " "2"" of type '" "molecule *""'"); 
+  }
+  arg2 = (molecule *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "atom_grid_near" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "atom_grid_near" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "atom_grid_near" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  ecode6 = SWIG_AsVal_double(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "atom_grid_near" "', argument " "6"" of type '" "double""'");
+  } 
+  arg6 = (double)(val6);
+  result = (PyObject *)atom_grid_near(arg1,arg2,arg3,arg4,arg5,arg6);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *atom_grid_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_atom_grid, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *atom_grid_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_element_code(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned char result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "element_code" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = (char *)(buf1);
+  result = (unsigned char)element_code((char const *)arg1);
+  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_element_symbol(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned char arg1 ;
+  unsigned char val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  char *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "element_symbol" "', argument " "1"" of type '" "unsigned char""'");
+  } 
+  arg1 = (unsigned char)(val1);
+  result = (char *)element_symbol(arg1);
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atomset(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  atom *arg1 = (atom *) 0 ;
+  char *arg2 ;
+  double *arg3 = (double *) 0 ;
+  double *arg4 = (double *) 0 ;
+  double *arg5 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  char temp2[3] ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atomset", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomset" "', argument " "1"" of type '" "atom *""'"); 
+  }
+  arg1 = (atom *)(argp1);
+  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomset" "', argument " "2"" of type '" "char [3]""'");
+  }
+  arg2 = (char *)(temp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomset" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomset" "', argument " "4"" of type '" "double *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomset" "', argument " "5"" of type '" "double *""'"); 
+  }
+  arg5 = (double *)(argp5);
+  atomset(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atomget(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  atom *arg1 = (atom *) 0 ;
+  char *arg2 ;
+  double *arg3 = (double *) 0 ;
+  double *arg4 = (double *) 0 ;
+  double *arg5 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  char temp2[3] ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atomget", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomget" "', argument " "1"" of type '" "atom *""'"); 
+  }
+  arg1 = (atom *)(argp1);
+  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
+  if (!SWIG_IsOK(res2)) {
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomget" "', argument " "2"" of type '" "char [3]""'");
   }
   arg2 = (char *)(temp2);
@@ -4876,8 +6569,8 @@ fail:
 SWIGINTERN PyObject *_wrap_bondset(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   bond *arg1 = (bond *) 0 ;
-  unsigned short *arg2 = (unsigned short *) 0 ;
-  unsigned short *arg3 = (unsigned short *) 0 ;
+  unsigned int *arg2 = (unsigned int *) 0 ;
+  unsigned int *arg3 = (unsigned int *) 0 ;
   atom **arg4 = (atom **) 0 ;
   unsigned char *arg5 = (unsigned char *) 0 ;
   void *argp1 = 0 ;
@@ -4898,16 +6591,16 @@ SWIGINTERN PyObject *_wrap_bondset(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bondset" "', argument " "1"" of type '" "bond *""'"); 
   }
   arg1 = (bond *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondset" "', argument " "2"" of type '" "unsigned short *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondset" "', argument " "2"" of type '" "unsigned int *""'"); 
   }
-  arg2 = (unsigned short *)(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  arg2 = (unsigned int *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_int, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondset" "', argument " "3"" of type '" "unsigned short *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondset" "', argument " "3"" of type '" "unsigned int *""'"); 
   }
-  arg3 = (unsigned short *)(argp3);
+  arg3 = (unsigned int *)(argp3);
   res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_atom, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "bondset" "', argument " "4"" of type '" "atom **""'"); 
@@ -4929,8 +6622,8 @@ fail:
 SWIGINTERN PyObject *_wrap_bondget(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   bond *arg1 = (bond *) 0 ;
-  unsigned short *arg2 = (unsigned short *) 0 ;
-  unsigned short *arg3 = (unsigned short *) 0 ;
+  unsigned int *arg2 = (unsigned int *) 0 ;
+  unsigned int *arg3 = (unsigned int *) 0 ;
   atom **arg4 = (atom **) 0 ;
   unsigned char *arg5 = (unsigned char *) 0 ;
   void *argp1 = 0 ;
@@ -4951,16 +6644,16 @@ SWIGINTERN PyObject *_wrap_bondget(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bondget" "', argument " "1"" of type '" "bond *""'"); 
   }
   arg1 = (bond *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_int, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondget" "', argument " "2"" of type '" "unsigned short *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondget" "', argument " "2"" of type '" "unsigned int *""'"); 
   }
-  arg2 = (unsigned short *)(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  arg2 = (unsigned int *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_int, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondget" "', argument " "3"" of type '" "unsigned short *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondget" "', argument " "3"" of type '" "unsigned int *""'"); 
   }
-  arg3 = (unsigned short *)(argp3);
+  arg3 = (unsigned int *)(argp3);
   res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_atom, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "bondget" "', argument " "4"" of type '" "atom **""'"); 
@@ -5003,26 +6696,26 @@ fail:
 
 SWIGINTERN PyObject *_wrap_molmalloc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  unsigned short arg1 ;
-  unsigned short arg2 ;
-  unsigned short val1 ;
+  size_t arg1 ;
+  size_t arg2 ;
+  size_t val1 ;
   int ecode1 = 0 ;
-  unsigned short val2 ;
+  size_t val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   molecule *result = 0 ;
   
   if (!SWIG_Python_UnpackTuple(args, "molmalloc", 2, 2, swig_obj)) SWIG_fail;
-  ecode1 = SWIG_AsVal_unsigned_SS_short(swig_obj[0], &val1);
+  ecode1 = SWIG_AsVal_size_t(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "molmalloc" "', argument " "1"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "molmalloc" "', argument " "1"" of type '" "size_t""'");
   } 
-  arg1 = (unsigned short)(val1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  arg1 = (size_t)(val1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molmalloc" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molmalloc" "', argument " "2"" of type '" "size_t""'");
   } 
-  arg2 = (unsigned short)(val2);
+  arg2 = (size_t)(val2);
   result = (molecule *)molmalloc(arg1,arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
   return resultobj;
@@ -5031,73 +6724,296 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molcopy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molcopy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  molecule *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcopy" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  result = (molecule *)molcopy(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molfree(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molfree" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  molfree(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molreserve(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  size_t arg2 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molreserve", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molreserve" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molreserve" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molreserve" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  result = (int)molreserve(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_atom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  atom *arg2 = (atom *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_atom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_atom" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_atom" "', argument " "2"" of type '" "atom *""'"); 
+  }
+  arg2 = (atom *)(argp2);
+  molappend_atom(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_bond(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  bond *arg2 = (bond *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_bond", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_bond" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_bond" "', argument " "2"" of type '" "bond *""'"); 
+  }
+  arg2 = (bond *)(argp2);
+  molappend_bond(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molload(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   molecule *arg1 = (molecule *) 0 ;
+  size_t arg2 ;
+  double *arg3 = (double *) 0 ;
+  char *arg4 = (char *) 0 ;
+  size_t arg5 ;
+  unsigned int *arg6 = (unsigned int *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  molecule *result = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  size_t val5 ;
+  int ecode5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  PyObject *swig_obj[6] ;
+  int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "molload", 6, 6, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcopy" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molload" "', argument " "1"" of type '" "molecule *""'"); 
   }
   arg1 = (molecule *)(argp1);
-  result = (molecule *)molcopy(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molload" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "molload" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_AsCharPtrAndSize(swig_obj[3], &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "molload" "', argument " "4"" of type '" "char *""'");
+  }
+  arg4 = (char *)(buf4);
+  ecode5 = SWIG_AsVal_size_t(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "molload" "', argument " "5"" of type '" "size_t""'");
+  } 
+  arg5 = (size_t)(val5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "molload" "', argument " "6"" of type '" "unsigned int *""'"); 
+  }
+  arg6 = (unsigned int *)(argp6);
+  result = (int)molload(arg1,arg2,arg3,arg4,arg5,arg6);
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return resultobj;
 fail:
+  if (alloc4 == SWIG_NEWOBJ) free((char*)buf4);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molfree(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molload_codes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   molecule *arg1 = (molecule *) 0 ;
+  size_t arg2 ;
+  double *arg3 = (double *) 0 ;
+  unsigned char *arg4 = (unsigned char *) 0 ;
+  size_t arg5 ;
+  unsigned int *arg6 = (unsigned int *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  size_t val5 ;
+  int ecode5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  PyObject *swig_obj[6] ;
+  int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "molload_codes", 6, 6, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molfree" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molload_codes" "', argument " "1"" of type '" "molecule *""'"); 
   }
   arg1 = (molecule *)(argp1);
-  molfree(arg1);
-  resultobj = SWIG_Py_Void();
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molload_codes" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "molload_codes" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_unsigned_char, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "molload_codes" "', argument " "4"" of type '" "unsigned char *""'"); 
+  }
+  arg4 = (unsigned char *)(argp4);
+  ecode5 = SWIG_AsVal_size_t(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "molload_codes" "', argument " "5"" of type '" "size_t""'");
+  } 
+  arg5 = (size_t)(val5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "molload_codes" "', argument " "6"" of type '" "unsigned int *""'"); 
+  }
+  arg6 = (unsigned int *)(argp6);
+  result = (int)molload_codes(arg1,arg2,arg3,arg4,arg5,arg6);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molappend_atom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molcodes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   molecule *arg1 = (molecule *) 0 ;
-  atom *arg2 = (atom *) 0 ;
+  unsigned char *arg2 = (unsigned char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molappend_atom", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molcodes", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_atom" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcodes" "', argument " "1"" of type '" "molecule *""'"); 
   }
   arg1 = (molecule *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_char, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_atom" "', argument " "2"" of type '" "atom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molcodes" "', argument " "2"" of type '" "unsigned char *""'"); 
   }
-  arg2 = (atom *)(argp2);
-  molappend_atom(arg1,arg2);
+  arg2 = (unsigned char *)(argp2);
+  molcodes(arg1,arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5105,31 +7021,50 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molappend_bond(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_molpack(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   molecule *arg1 = (molecule *) 0 ;
-  bond *arg2 = (bond *) 0 ;
+  double *arg2 = (double *) 0 ;
+  char *arg3 = (char *) 0 ;
+  unsigned int *arg4 = (unsigned int *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molappend_bond", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molpack", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_bond" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molpack" "', argument " "1"" of type '" "molecule *""'"); 
   }
   arg1 = (molecule *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond, 0 |  0 );
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_bond" "', argument " "2"" of type '" "bond *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molpack" "', argument " "2"" of type '" "double *""'"); 
   }
-  arg2 = (bond *)(argp2);
-  molappend_bond(arg1,arg2);
+  arg2 = (double *)(argp2);
+  res3 = SWIG_AsCharPtrAndSize(swig_obj[2], &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "molpack" "', argument " "3"" of type '" "char *""'");
+  }
+  arg3 = (char *)(buf3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "molpack" "', argument " "4"" of type '" "unsigned int *""'"); 
+  }
+  arg4 = (unsigned int *)(argp4);
+  molpack(arg1,arg2,arg3,arg4);
   resultobj = SWIG_Py_Void();
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
   return resultobj;
 fail:
+  if (alloc3 == SWIG_NEWOBJ) free((char*)buf3);
   return NULL;
 }
 
@@ -5295,6 +7230,51 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_xyzrotation(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  double (*arg1)[3] ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "xyzrotation", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "xyzrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
+  } 
+  arg1 = (double (*)[3])(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "xyzrotation" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "xyzrotation" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "xyzrotation" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  xyzrotation((double (*)[3])arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_mol_xform(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   molecule *arg1 = (molecule *) 0 ;
@@ -5324,10 +7304,203 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_covalent_radius(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned char arg1 ;
+  unsigned char val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "covalent_radius" "', argument " "1"" of type '" "unsigned char""'");
+  } 
+  arg1 = (unsigned char)(val1);
+  result = (double)covalent_radius(arg1);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_gridmalloc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  atom_grid *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "gridmalloc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "gridmalloc" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "gridmalloc" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (atom_grid *)gridmalloc(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom_grid, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_gridfree(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  atom_grid *arg1 = (atom_grid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "gridfree" "', argument " "1"" of type '" "atom_grid *""'"); 
+  }
+  arg1 = (atom_grid *)(argp1);
+  gridfree(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_gridnear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  atom_grid *arg1 = (atom_grid *) 0 ;
+  molecule *arg2 = (molecule *) 0 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 ;
+  unsigned int *arg7 = (unsigned int *) 0 ;
+  size_t arg8 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  size_t val8 ;
+  int ecode8 = 0 ;
+  PyObject *swig_obj[8] ;
+  size_t result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "gridnear", 8, 8, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom_grid, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "gridnear" "', argument " "1"" of type '" "atom_grid *""'"); 
+  }
+  arg1 = (atom_grid *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "gridnear" "', argument " "2"" of type '" "molecule *""'"); 
+  }
+  arg2 = (molecule *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "gridnear" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "gridnear" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "gridnear" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  ecode6 = SWIG_AsVal_double(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "gridnear" "', argument " "6"" of type '" "double""'");
+  } 
+  arg6 = (double)(val6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_unsigned_int, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "gridnear" "', argument " "7"" of type '" "unsigned int *""'"); 
+  }
+  arg7 = (unsigned int *)(argp7);
+  ecode8 = SWIG_AsVal_size_t(swig_obj[7], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "gridnear" "', argument " "8"" of type '" "size_t""'");
+  } 
+  arg8 = (size_t)(val8);
+  result = gridnear(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molperceive(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  double *arg2 = (double *) 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molperceive", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molperceive" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molperceive" "', argument " "2"" of type '" "double const *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molperceive" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  result = (int)molperceive(arg1,(double const *)arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 static PyMethodDef SwigMethods[] = {
 	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
 	 { "atom_element_set", _wrap_atom_element_set, METH_VARARGS, NULL},
 	 { "atom_element_get", _wrap_atom_element_get, METH_O, NULL},
+	 { "atom_code_set", _wrap_atom_code_set, METH_VARARGS, NULL},
+	 { "atom_code_get", _wrap_atom_code_get, METH_O, NULL},
 	 { "atom_x_set", _wrap_atom_x_set, METH_VARARGS, NULL},
 	 { "atom_x_get", _wrap_atom_x_get, METH_O, NULL},
 	 { "atom_y_set", _wrap_atom_y_set, METH_VARARGS, NULL},
@@ -5382,15 +7555,61 @@ static PyMethodDef SwigMethods[] = {
 	 { "molecule_bonds_get", _wrap_molecule_bonds_get, METH_O, NULL},
 	 { "molecule_bond_ptrs_set", _wrap_molecule_bond_ptrs_set, METH_VARARGS, NULL},
 	 { "molecule_bond_ptrs_get", _wrap_molecule_bond_ptrs_get, METH_O, NULL},
-	 { "new_molecule", _wrap_new_molecule, METH_NOARGS, NULL},
+	 { "molecule_exports_get", _wrap_molecule_exports_get, METH_O, NULL},
+	 { "new_molecule", _wrap_new_molecule, METH_VARARGS, NULL},
 	 { "delete_molecule", _wrap_delete_molecule, METH_O, NULL},
 	 { "molecule_append_atom", _wrap_molecule_append_atom, METH_VARARGS, NULL},
 	 { "molecule_append_bond", _wrap_molecule_append_bond, METH_VARARGS, NULL},
+	 { "molecule_reserve", _wrap_molecule_reserve, METH_VARARGS, NULL},
+	 { "molecule_load", _wrap_molecule_load, METH_VARARGS, NULL},
+	 { "molecule_pack", _wrap_molecule_pack, METH_O, NULL},
+	 { "molecule_codes", _wrap_molecule_codes, METH_O, NULL},
+	 { "molecule__atoms_view", _wrap_molecule__atoms_view, METH_VARARGS, NULL},
+	 { "molecule__bonds_view", _wrap_molecule__bonds_view, METH_VARARGS, NULL},
+	 { "molecule__atom_ptrs_view", _wrap_molecule__atom_ptrs_view, METH_VARARGS, NULL},
+	 { "molecule__bond_ptrs_view", _wrap_molecule__bond_ptrs_view, METH_VARARGS, NULL},
+	 { "molecule_address", _wrap_molecule_address, METH_O, NULL},
+	 { "molecule_perceive_bonds", _wrap_molecule_perceive_bonds, METH_VARARGS, NULL},
 	 { "molecule_get_atom", _wrap_molecule_get_atom, METH_VARARGS, NULL},
 	 { "molecule_get_bond", _wrap_molecule_get_bond, METH_VARARGS, NULL},
 	 { "molecule_sort", _wrap_molecule_sort, METH_O, NULL},
+	 { "molecule_xform", _wrap_molecule_xform, METH_VARARGS, NULL},
+	 { "molecule_rotate", _wrap_molecule_rotate, METH_VARARGS, NULL},
 	 { "molecule_swigregister", molecule_swigregister, METH_O, NULL},
 	 { "molecule_swiginit", molecule_swiginit, METH_VARARGS, NULL},
+	 { "mx_wrapper_xform_matrix_set", _wrap_mx_wrapper_xform_matrix_set, METH_VARARGS, NULL},
+	 { "mx_wrapper_xform_matrix_get", _wrap_mx_wrapper_xform_matrix_get, METH_O, NULL},
+	 { "new_mx_wrapper", _wrap_new_mx_wrapper, METH_VARARGS, NULL},
+	 { "delete_mx_wrapper", _wrap_delete_mx_wrapper, METH_O, NULL},
+	 { "mx_wrapper_swigregister", mx_wrapper_swigregister, METH_O, NULL},
+	 { "mx_wrapper_swiginit", mx_wrapper_swiginit, METH_VARARGS, NULL},
+	 { "atom_grid_x_set", _wrap_atom_grid_x_set, METH_VARARGS, NULL},
+	 { "atom_grid_x_get", _wrap_atom_grid_x_get, METH_O, NULL},
+	 { "atom_grid_y_set", _wrap_atom_grid_y_set, METH_VARARGS, NULL},
+	 { "atom_grid_y_get", _wrap_atom_grid_y_get, METH_O, NULL},
+	 { "atom_grid_z_set", _wrap_atom_grid_z_set, METH_VARARGS, NULL},
+	 { "atom_grid_z_get", _wrap_atom_grid_z_get, METH_O, NULL},
+	 { "atom_grid_cell_set", _wrap_atom_grid_cell_set, METH_VARARGS, NULL},
+	 { "atom_grid_cell_get", _wrap_atom_grid_cell_get, METH_O, NULL},
+	 { "atom_grid_nx_set", _wrap_atom_grid_nx_set, METH_VARARGS, NULL},
+	 { "atom_grid_nx_get", _wrap_atom_grid_nx_get, METH_O, NULL},
+	 { "atom_grid_ny_set", _wrap_atom_grid_ny_set, METH_VARARGS, NULL},
+	 { "atom_grid_ny_get", _wrap_atom_grid_ny_get, METH_O, NULL},
+	 { "atom_grid_nz_set", _wrap_atom_grid_nz_set, METH_VARARGS, NULL},
+	 { "atom_grid_nz_get", _wrap_atom_grid_nz_get, METH_O, NULL},
+	 { "atom_grid_atom_no_set", _wrap_atom_grid_atom_no_set, METH_VARARGS, NULL},
+	 { "atom_grid_atom_no_get", _wrap_atom_grid_atom_no_get, METH_O, NULL},
+	 { "atom_grid_start_set", _wrap_atom_grid_start_set, METH_VARARGS, NULL},
+	 { "atom_grid_start_get", _wrap_atom_grid_start_get, METH_O, NULL},
+	 { "atom_grid_atoms_set", _wrap_atom_grid_atoms_set, METH_VARARGS, NULL},
+	 { "atom_grid_atoms_get", _wrap_atom_grid_atoms_get, METH_O, NULL},
+	 { "new_atom_grid", _wrap_new_atom_grid, METH_VARARGS, NULL},
+	 { "delete_atom_grid", _wrap_delete_atom_grid, METH_O, NULL},
+	 { "atom_grid_near", _wrap_atom_grid_near, METH_VARARGS, NULL},
+	 { "atom_grid_swigregister", atom_grid_swigregister, METH_O, NULL},
+	 { "atom_grid_swiginit", atom_grid_swiginit, METH_VARARGS, NULL},
+	 { "element_code", _wrap_element_code, METH_O, NULL},
+	 { "element_symbol", _wrap_element_symbol, METH_O, NULL},
 	 { "atomset", _wrap_atomset, METH_VARARGS, NULL},
 	 { "atomget", _wrap_atomget, METH_VARARGS, NULL},
 	 { "bondset", _wrap_bondset, METH_VARARGS, NULL},
@@ -5399,15 +7618,26 @@ static PyMethodDef SwigMethods[] = {
 	 { "molmalloc", _wrap_molmalloc, METH_VARARGS, NULL},
 	 { "molcopy", _wrap_molcopy, METH_O, NULL},
 	 { "molfree", _wrap_molfree, METH_O, NULL},
+	 { "molreserve", _wrap_molreserve, METH_VARARGS, NULL},
 	 { "molappend_atom", _wrap_molappend_atom, METH_VARARGS, NULL},
 	 { "molappend_bond", _wrap_molappend_bond, METH_VARARGS, NULL},
+	 { "molload", _wrap_molload, METH_VARARGS, NULL},
+	 { "molload_codes", _wrap_molload_codes, METH_VARARGS, NULL},
+	 { "molcodes", _wrap_molcodes, METH_VARARGS, NULL},
+	 { "molpack", _wrap_molpack, METH_VARARGS, NULL},
 	 { "atomCompare", _wrap_atomCompare, METH_VARARGS, NULL},
 	 { "bond_comp", _wrap_bond_comp, METH_VARARGS, NULL},
 	 { "molsort", _wrap_molsort, METH_O, NULL},
 	 { "xrotation", _wrap_xrotation, METH_VARARGS, NULL},
 	 { "yrotation", _wrap_yrotation, METH_VARARGS, NULL},
 	 { "zrotation", _wrap_zrotation, METH_VARARGS, NULL},
+	 { "xyzrotation", _wrap_xyzrotation, METH_VARARGS, NULL},
 	 { "mol_xform", _wrap_mol_xform, METH_VARARGS, NULL},
+	 { "covalent_radius", _wrap_covalent_radius, METH_O, NULL},
+	 { "gridmalloc", _wrap_gridmalloc, METH_VARARGS, NULL},
+	 { "gridfree", _wrap_gridfree, METH_O, NULL},
+	 { "gridnear", _wrap_gridnear, METH_VARARGS, NULL},
+	 { "molperceive", _wrap_molperceive, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -5421,53 +7651,65 @@ static PyMethodDef SwigMethods_proxydocs[] = {
 static swig_type_info _swigt__p_a_3__a_3__double = {"_p_a_3__a_3__double", "xform_matrix *|double (*)[3][3]", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_a_3__double = {"_p_a_3__double", "double (*)[3]", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_atom = {"_p_atom", "struct atom *|atom *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_atom_grid = {"_p_atom_grid", "struct atom_grid *|atom_grid *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_bond = {"_p_bond", "struct bond *|bond *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_double = {"_p_double", "double *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_molecule = {"_p_molecule", "struct molecule *|molecule *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_mx_wrapper = {"_p_mx_wrapper", "struct mx_wrapper *|mx_wrapper *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_atom = {"_p_p_atom", "struct atom **|atom **", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_bond = {"_p_p_bond", "struct bond **|bond **", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_size_t = {"_p_size_t", "size_t *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_unsigned_char = {"_p_unsigned_char", "unsigned char *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_unsigned_short = {"_p_unsigned_short", "unsigned short *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_unsigned_int = {"_p_unsigned_int", "unsigned int *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_a_3__a_3__double,
   &_swigt__p_a_3__double,
   &_swigt__p_atom,
+  &_swigt__p_atom_grid,
   &_swigt__p_bond,
   &_swigt__p_char,
   &_swigt__p_double,
   &_swigt__p_molecule,
+  &_swigt__p_mx_wrapper,
   &_swigt__p_p_atom,
   &_swigt__p_p_bond,
+  &_swigt__p_size_t,
   &_swigt__p_unsigned_char,
-  &_swigt__p_unsigned_short,
+  &_swigt__p_unsigned_int,
 };
 
 static swig_cast_info _swigc__p_a_3__a_3__double[] = {  {&_swigt__p_a_3__a_3__double, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_a_3__double[] = {  {&_swigt__p_a_3__double, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_atom[] = {  {&_swigt__p_atom, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_atom_grid[] = {  {&_swigt__p_atom_grid, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_bond[] = {  {&_swigt__p_bond, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_double[] = {  {&_swigt__p_double, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_molecule[] = {  {&_swigt__p_molecule, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_mx_wrapper[] = {  {&_swigt__p_mx_wrapper, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_atom[] = {  {&_swigt__p_p_atom, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_bond[] = {  {&_swigt__p_p_bond, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_size_t[] = {  {&_swigt__p_size_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_unsigned_char[] = {  {&_swigt__p_unsigned_char, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_unsigned_short[] = {  {&_swigt__p_unsigned_short, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_unsigned_int[] = {  {&_swigt__p_unsigned_int, 0, 0, 0},{0, 0, 0, 0}};
 
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_a_3__a_3__double,
   _swigc__p_a_3__double,
   _swigc__p_atom,
+  _swigc__p_atom_grid,
   _swigc__p_bond,
   _swigc__p_char,
   _swigc__p_double,
   _swigc__p_molecule,
+  _swigc__p_mx_wrapper,
   _swigc__p_p_atom,
   _swigc__p_p_bond,
+  _swigc__p_size_t,
   _swigc__p_unsigned_char,
-  _swigc__p_unsigned_short,
+  _swigc__p_unsigned_int,
 };
 
 
@@ -6203,7 +8445,11 @@ SWIG_init(void) {
   
   SWIG_InstallConstants(d,swig_const_table);
   
+  SWIG_Python_SetConstant(d, "MOLSORT_MINRUN",SWIG_From_int((int)(32)));
+  SWIG_Python_SetConstant(d, "ELEMENT_CODES",SWIG_From_int((int)(119)));
   SWIG_Python_SetConstant(d, "M_PI",SWIG_From_double((double)(3.14159265358979323846)));
+  SWIG_Python_SetConstant(d, "ATOM_SIZE",SWIG_From_size_t((size_t)(sizeof(atom))));
+  SWIG_Python_SetConstant(d, "BOND_SIZE",SWIG_From_size_t((size_t)(sizeof(bond))));
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
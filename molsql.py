@@ -1,17 +1,69 @@
+import json
 import os
+import sys
 import sqlite3
+import threading
+import time
+from array import array
 import MolDisplay
+import metrics
+
+#the queries on the hot paths are kept as constants so sqlite's per-connection statement cache prepares each one once
+#a molecule uploaded again under another name is stored once, its alias rows point at it with ALIAS_OF and have no atoms or bonds of their own
+LOAD_ATOMS = """SELECT Atoms.ELEMENT_CODE, Atoms.X, Atoms.Y, Atoms.Z FROM Molecules
+                JOIN MoleculeAtom ON MoleculeAtom.MOLECULE_ID = COALESCE(Molecules.ALIAS_OF, Molecules.MOLECULE_ID)
+                JOIN Atoms ON Atoms.ATOM_ID = MoleculeAtom.ATOM_ID
+                WHERE Molecules.NAME = ? ORDER BY MoleculeAtom.ATOM_ID""" #bonds refer to atoms by their position, so the order matters
+LOAD_BONDS = """SELECT Bonds.A1, Bonds.A2, Bonds.EPAIRS FROM Molecules
+                JOIN MoleculeBond ON MoleculeBond.MOLECULE_ID = COALESCE(Molecules.ALIAS_OF, Molecules.MOLECULE_ID)
+                JOIN Bonds ON Bonds.BOND_ID = MoleculeBond.BOND_ID
+                WHERE Molecules.NAME = ? ORDER BY MoleculeBond.BOND_ID"""
+LOAD_DATA = """SELECT MoleculeData.VERSION, MoleculeData.ATOM_NO, MoleculeData.BOND_NO, MoleculeData.COORDS, MoleculeData.ELEMENTS, MoleculeData.BONDS
+               FROM Molecules JOIN MoleculeData ON MoleculeData.MOLECULE_ID = COALESCE(Molecules.ALIAS_OF, Molecules.MOLECULE_ID)
+               WHERE Molecules.NAME = ?"""
+NUM_ATOMS = "SELECT ATOM_NO FROM Molecules WHERE NAME = ?"
+NUM_BONDS = "SELECT BOND_NO FROM Molecules WHERE NAME = ?"
+MOLECULE_TABLE = "SELECT NAME, ATOM_NO, BOND_NO FROM Molecules ORDER BY MOLECULE_ID LIMIT ? OFFSET ?"
+FIND_HASH = "SELECT MOLECULE_ID FROM Molecules WHERE HASH = ? AND ALIAS_OF IS NULL AND ATOM_NO = ? AND BOND_NO = ?"
+MOLECULE_INFO = """SELECT NAME, ATOM_NO, BOND_NO, HASH, MIN_X, MIN_Y, MIN_Z, MAX_X, MAX_Y, MAX_Z, ELEMENT_COUNTS
+                   FROM Molecules WHERE NAME = ?"""
+
+#ranged loads of the atoms from :start up to :stop, and the bonds between them
+#the columnar blobs are cut with substr so only the requested atoms leave sqlite, the elements are 3 bytes per atom in version 1 and 1 in version 2
+LOAD_DATA_RANGE = """SELECT MoleculeData.VERSION,
+                     substr(MoleculeData.COORDS, :start * 24 + 1, MAX(MIN(:stop, MoleculeData.ATOM_NO) - :start, 0) * 24),
+                     substr(MoleculeData.ELEMENTS, :start * (CASE MoleculeData.VERSION WHEN 1 THEN 3 ELSE 1 END) + 1,
+                            MAX(MIN(:stop, MoleculeData.ATOM_NO) - :start, 0) * (CASE MoleculeData.VERSION WHEN 1 THEN 3 ELSE 1 END)),
+                     MoleculeData.BONDS
+                     FROM Molecules JOIN MoleculeData ON MoleculeData.MOLECULE_ID = COALESCE(Molecules.ALIAS_OF, Molecules.MOLECULE_ID)
+                     WHERE Molecules.NAME = :name"""
+LOAD_ATOMS_RANGE = LOAD_ATOMS.replace("NAME = ?", "NAME = :name") + " LIMIT :stop - :start OFFSET :start" #the join rows are walked in ATOM_ID order along their primary key
+LOAD_BONDS_RANGE = LOAD_BONDS.replace("NAME = ?", "NAME = :name").replace("ORDER BY", """AND Bonds.A1 >= :start AND Bonds.A1 < :stop
+                AND Bonds.A2 >= :start AND Bonds.A2 < :stop ORDER BY""")
+
+STORAGE_VERSION = 2 #version of the packed MoleculeData format: little-endian float64 x,y,z, one byte element code (atomic number) per atom, uint32 a1,a2,epairs
+#version 1 rows store 3 byte null padded elements instead of codes, they are still read and are written for elements outside the periodic table
 
 class Database():
-    def __init__(self, reset=False):
+    def __init__(self, reset=False, storage="normalized", readonly=False):
         #if reset is set to True, the molecules.db will be deleted
+        #storage is "normalized" to store a row per atom and bond, or "columnar" to store each molecule as one MoleculeData row
+        #readonly opens molecules.db so it can only be read, e.g. by export workers
+        if storage not in ("normalized", "columnar"):
+            raise ValueError(f"unknown storage mode '{storage}'")
+        self.storage = storage
+
         if reset:
-            try: #remove the database if it exists
-                os.remove('molecules.db')
-            except FileNotFoundError:
-                pass
+            for path in ('molecules.db', 'molecules.db-wal', 'molecules.db-shm'):
+                try: #remove the database and its write-ahead log if they exist
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
 
-        self.conn = sqlite3.connect('molecules.db')
+        if readonly:
+            self.conn = sqlite3.connect('file:molecules.db?mode=ro', uri=True, cached_statements=256)
+        else:
+            self.conn = sqlite3.connect('molecules.db', cached_statements=256)
     
     def create_tables(self): 
         self.conn.execute("""CREATE TABLE IF NOT EXISTS Elements(
@@ -45,7 +97,19 @@ class Database():
         self.conn.execute("""CREATE TABLE IF NOT EXISTS Molecules(
                         MOLECULE_ID INTEGER NOT NULL,
                         NAME TEXT NOT NULL UNIQUE,
-                        PRIMARY KEY (MOLECULE_ID)
+                        ATOM_NO INTEGER NOT NULL DEFAULT 0,
+                        BOND_NO INTEGER NOT NULL DEFAULT 0,
+                        HASH TEXT,
+                        ALIAS_OF INTEGER,
+                        MIN_X REAL,
+                        MIN_Y REAL,
+                        MIN_Z REAL,
+                        MAX_X REAL,
+                        MAX_Y REAL,
+                        MAX_Z REAL,
+                        ELEMENT_COUNTS TEXT,
+                        PRIMARY KEY (MOLECULE_ID),
+                        FOREIGN KEY (ALIAS_OF) REFERENCES Molecules
                         );""")
 
         self.conn.execute("""CREATE TABLE IF NOT EXISTS MoleculeAtom(
@@ -63,14 +127,50 @@ class Database():
                         FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules,
                         FOREIGN KEY (BOND_ID) REFERENCES Bonds
                         );""")
+
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS MoleculeData(
+                        MOLECULE_ID INTEGER NOT NULL,
+                        VERSION INTEGER NOT NULL,
+                        ATOM_NO INTEGER NOT NULL,
+                        BOND_NO INTEGER NOT NULL,
+                        COORDS BLOB NOT NULL,
+                        ELEMENTS BLOB NOT NULL,
+                        BONDS BLOB NOT NULL,
+                        PRIMARY KEY (MOLECULE_ID),
+                        FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules
+                        );""")
+
+        #Molecules.NAME is UNIQUE so it already has an index, these cover looking up the molecule of an atom or bond
+        self.conn.execute("CREATE INDEX IF NOT EXISTS MoleculeAtomAtom ON MoleculeAtom (ATOM_ID)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS MoleculeBondBond ON MoleculeBond (BOND_ID)")
+
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(Molecules)")]
+        if "ATOM_NO" not in columns: #databases made before the counts were kept on Molecules
+            self.conn.execute("ALTER TABLE Molecules ADD COLUMN ATOM_NO INTEGER NOT NULL DEFAULT 0")
+            self.conn.execute("ALTER TABLE Molecules ADD COLUMN BOND_NO INTEGER NOT NULL DEFAULT 0")
+            self.conn.execute("""UPDATE Molecules SET
+                ATOM_NO = COALESCE((SELECT ATOM_NO FROM MoleculeData WHERE MOLECULE_ID = Molecules.MOLECULE_ID),
+                                   (SELECT COUNT(ATOM_ID) FROM MoleculeAtom WHERE MOLECULE_ID = Molecules.MOLECULE_ID)),
+                BOND_NO = COALESCE((SELECT BOND_NO FROM MoleculeData WHERE MOLECULE_ID = Molecules.MOLECULE_ID),
+                                   (SELECT COUNT(BOND_ID) FROM MoleculeBond WHERE MOLECULE_ID = Molecules.MOLECULE_ID))""")
+        if "HASH" not in columns: #databases made before duplicates were found by hash, their molecules keep a NULL hash and are never matched
+            self.conn.execute("ALTER TABLE Molecules ADD COLUMN HASH TEXT")
+            self.conn.execute("ALTER TABLE Molecules ADD COLUMN ALIAS_OF INTEGER REFERENCES Molecules")
+        if "ELEMENT_COUNTS" not in columns: #databases made before the metadata was kept, fill_metadata computes it for their molecules
+            for column in ("MIN_X", "MIN_Y", "MIN_Z", "MAX_X", "MAX_Y", "MAX_Z"):
+                self.conn.execute(f"ALTER TABLE Molecules ADD COLUMN {column} REAL")
+            self.conn.execute("ALTER TABLE Molecules ADD COLUMN ELEMENT_COUNTS TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS MoleculeHash ON Molecules (HASH)")
         self.conn.commit() #commits the changes to the database
         
+    @metrics.timed("db_seconds", op="insert")
     def __setitem__( self, table, values ): #inserts a row into the table passed in
         cursor = self.conn.cursor()
         inputRow = f"INSERT INTO {table} VALUES ({','.join(['?']*len(values))})"
         cursor.execute(inputRow, values)
         self.conn.commit()
     
+    @metrics.timed("db_seconds", op="delete")
     def __removeitem__(self, table, values):
         cursor = self.conn.cursor()
         inputRow = f"DELETE FROM {table} WHERE ELEMENT_CODE = '{values}'"
@@ -85,17 +185,26 @@ class Database():
     
     def getNumAtoms(self, molname):
         cursor = self.conn.cursor()
-        action = f"SELECT COUNT(ATOM_ID) FROM MoleculeAtom WHERE MOLECULE_ID = (SELECT MOLECULE_ID FROM Molecules WHERE NAME = '{molname}')"
-        cursor.execute(action)
-        return cursor.fetchone()[0]
+        cursor.execute(NUM_ATOMS, (molname,)) #the count is kept on Molecules when the molecule is added
+        row = cursor.fetchone()
+        return row[0] if row else 0
     
     def getNumBonds(self, molname):
         cursor = self.conn.cursor()
-        action = f"SELECT COUNT(BOND_ID) FROM MoleculeBond WHERE MOLECULE_ID = (SELECT MOLECULE_ID FROM Molecules WHERE NAME = '{molname}')"
-        cursor.execute(action)
-        return cursor.fetchone()[0]
+        cursor.execute(NUM_BONDS, (molname,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+    @metrics.timed("db_seconds", op="molecule_table")
+    def molecule_table(self, limit=-1, offset=0):
+        #returns (name, number of atoms, number of bonds) for every molecule, or one page of them, in one query
+        cursor = self.conn.cursor()
+        cursor.execute(MOLECULE_TABLE, (limit, offset))
+        return cursor.fetchall()
+
+    def count_molecules(self):
+        return self.conn.execute("SELECT COUNT(*) FROM Molecules").fetchone()[0]
         
-    
     def add_atom( self, molname, atom ):
         cursor = self.conn.cursor()
         inputAtom = """INSERT INTO Atoms (ELEMENT_CODE, X, Y, Z)
@@ -119,43 +228,270 @@ class Database():
         
         self.conn.commit()
         
+    @metrics.timed("db_seconds", op="add_molecule")
     def add_molecule( self, name, fp ):
+        mol = MolDisplay.Molecule() #creates a new molecule
+        mol.parse(fp) #parses the molecule from the file, raises MolDisplay.ParseError with the line number if the file is invalid
+
+        self._begin()
         try:
-            mol = MolDisplay.Molecule() #creates a new molecule
-            mol.parse(fp) #parses the molecule from the file
+            self._insert_molecule(self.conn.cursor(), name, mol)
+        except:
+            self.conn.rollback() #nothing from a failed molecule is left in the database
+            raise
+        self.conn.commit() #one commit for the whole molecule
 
-            cursor = self.conn.cursor()
-            cursor.execute("INSERT INTO Molecules (NAME) VALUES (?)", (name,))
+    @metrics.timed("db_seconds", op="add_molecules")
+    def add_molecules( self, molecules, batch_size=100 ):
+        #adds many molecules, e.g. MolDisplay.read_sdf(fp), committing once every batch_size molecules
+        #molecules holds MolDisplay.Molecule objects with a name attribute or (name, molecule) pairs
+        #returns the number of molecules added, a failing molecule rolls back the batch it is in
+        count = 0
+        cursor = self.conn.cursor()
+        try:
+            for item in molecules:
+                name, mol = item if isinstance(item, tuple) else (item.name, item)
+                if count % batch_size == 0:
+                    self._begin()
+                self._insert_molecule(cursor, name, mol)
+                count += 1
+                if count % batch_size == 0:
+                    self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return count
+
+    def _begin(self):
+        #takes the write lock up front so the ids read in _insert_molecule can't be taken by another connection
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+
+    def _insert_molecule(self, cursor, name, mol):
+        #inserts a molecule and all of its atoms and bonds without committing
+        #a molecule with the same structure_hash as one already stored is inserted as an alias of it, with no atoms or bonds
+        #its metadata is kept on the Molecules row so MoleculeHandle never has to read the atoms
+        structure = mol.structure_hash()
+        row = cursor.execute(FIND_HASH, (structure, mol.atom_no, mol.bond_no)).fetchone()
+        cursor.execute("""INSERT INTO Molecules (NAME, ATOM_NO, BOND_NO, HASH, ALIAS_OF, MIN_X, MIN_Y, MIN_Z, MAX_X, MAX_Y, MAX_Z, ELEMENT_COUNTS)
+                          VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                       (name, mol.atom_no, mol.bond_no, structure, row[0] if row else None) + self._metadata(mol))
+        molID = cursor.lastrowid #the molecule id is resolved once
+        if row is not None:
+            metrics.count("molecules_deduplicated_total")
+            return molID
+
+        if self.storage == "columnar":
+            self._insert_data(cursor, molID, mol)
+            return molID
+
+        atomID = cursor.execute("SELECT COALESCE(MAX(ATOM_ID), 0) FROM Atoms").fetchone()[0] + 1
+        bondID = cursor.execute("SELECT COALESCE(MAX(BOND_ID), 0) FROM Bonds").fetchone()[0] + 1
+        atoms = [mol.get_atom(i) for i in range(mol.atom_no)]
+        bonds = [mol.get_bond(i) for i in range(mol.bond_no)]
+
+        cursor.executemany("INSERT INTO Atoms (ATOM_ID, ELEMENT_CODE, X, Y, Z) VALUES (?, ?, ?, ?, ?)",
+                           ((atomID + i, atom.element, atom.x, atom.y, atom.z) for i, atom in enumerate(atoms)))
+        cursor.executemany("INSERT INTO MoleculeAtom (MOLECULE_ID, ATOM_ID) VALUES (?, ?)",
+                           ((molID, atomID + i) for i in range(len(atoms))))
+        cursor.executemany("INSERT INTO Bonds (BOND_ID, A1, A2, EPAIRS) VALUES (?, ?, ?, ?)",
+                           ((bondID + i, bond.a1, bond.a2, bond.epairs) for i, bond in enumerate(bonds)))
+        cursor.executemany("INSERT INTO MoleculeBond (MOLECULE_ID, BOND_ID) VALUES (?, ?)",
+                           ((molID, bondID + i) for i in range(len(bonds))))
+        return molID
         
-            for atom in range(mol.atom_no): #adds the atoms to the database
-                self.add_atom(name, mol.get_atom(atom))
+    def _metadata(self, mol):
+        #the bounds and element histogram of a molecule as the values of the Molecules columns that hold them
+        bounds = mol.bounds() or (None,) * 6
+        return tuple(bounds) + (json.dumps(mol.element_counts(), sort_keys=True),)
 
-            for bond in range(mol.bond_no):
-                self.add_bond(name, mol.get_bond(bond))
+    def fill_metadata(self):
+        #computes the bounds and element histogram of molecules stored before they were kept, returns the number filled in
+        names = [row[0] for row in self.conn.execute("SELECT NAME FROM Molecules WHERE ELEMENT_COUNTS IS NULL")]
+        self._begin()
+        try:
+            for name in names:
+                self.conn.execute("""UPDATE Molecules SET MIN_X = ?, MIN_Y = ?, MIN_Z = ?, MAX_X = ?, MAX_Y = ?, MAX_Z = ?, ELEMENT_COUNTS = ?
+                                     WHERE NAME = ?""", self._metadata(self.load_mol(name)) + (name,))
         except:
-            print("Invalid file.")
-            pass
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return len(names)
+
+    def _insert_data(self, cursor, molID, mol):
+        #stores the molecule packed into a single MoleculeData row
+        coords, elements, bonds = mol.pack()
+        codes = mol.codes()
+        version = 1 if b"\0" in codes else STORAGE_VERSION #code 0 is an element outside the periodic table, which needs its name stored
+        if version == STORAGE_VERSION:
+            elements = codes
+        if sys.byteorder == "big": #the stored format is always little-endian
+            coords, bonds = array('d', coords), array('I', bonds)
+            coords.byteswap()
+            bonds.byteswap()
+        cursor.execute("INSERT INTO MoleculeData (MOLECULE_ID, VERSION, ATOM_NO, BOND_NO, COORDS, ELEMENTS, BONDS) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (molID, version, mol.atom_no, mol.bond_no, coords, elements, bonds))
+
+    def _load_data(self, name):
+        #loads a molecule stored in MoleculeData with one primary key lookup, None if it is stored normalized
+        row = self.conn.execute(LOAD_DATA, (name,)).fetchone()
+        if row is None:
+            return None
+        version, atom_no, bond_no, coords, elements, bonds = row
+        if version not in (1, STORAGE_VERSION):
+            raise ValueError(f"molecule '{name}' is stored in unsupported format version {version}")
+        if sys.byteorder == "big":
+            coords, bonds = array('d', coords), array('I', bonds)
+            coords.byteswap()
+            bonds.byteswap()
 
+        mol = MolDisplay.Molecule(atom_no, bond_no)
+        mol.load(coords, elements, bonds) #the blobs are handed straight to the C struct, load takes either element names or codes
+        return mol
+
+    def migrate_to_columnar(self):
+        #moves every normalized molecule into MoleculeData and deletes its Atoms, Bonds and join rows
+        #returns the number of molecules migrated
+        names = [row[0] for row in self.conn.execute("""SELECT NAME FROM Molecules
+                                                        WHERE ALIAS_OF IS NULL AND MOLECULE_ID NOT IN (SELECT MOLECULE_ID FROM MoleculeData)""")]
+        self._begin()
+        try:
+            cursor = self.conn.cursor()
+            for name in names:
+                mol = self.load_mol(name)
+                molID = cursor.execute("SELECT MOLECULE_ID FROM Molecules WHERE NAME = ?", (name,)).fetchone()[0]
+                self._insert_data(cursor, molID, mol)
+                cursor.execute("DELETE FROM Atoms WHERE ATOM_ID IN (SELECT ATOM_ID FROM MoleculeAtom WHERE MOLECULE_ID = ?)", (molID,))
+                cursor.execute("DELETE FROM Bonds WHERE BOND_ID IN (SELECT BOND_ID FROM MoleculeBond WHERE MOLECULE_ID = ?)", (molID,))
+                cursor.execute("DELETE FROM MoleculeAtom WHERE MOLECULE_ID = ?", (molID,))
+                cursor.execute("DELETE FROM MoleculeBond WHERE MOLECULE_ID = ?", (molID,))
+        except:
+            self.conn.rollback()
+            raise
         self.conn.commit()
-        
+        return len(names)
+
+    @metrics.timed("db_seconds", op="load_mol")
     def load_mol( self, name ):
-        mol = MolDisplay.Molecule()
+        mol = self._load_data(name)
+        if mol is not None:
+            return mol
 
         cursor = self.conn.cursor()
-        cursor.execute("SELECT DISTINCT Atoms.ATOM_ID, ELEMENT_CODE, X, Y, Z FROM Atoms NATURAL JOIN MoleculeAtom NATURAL JOIN Molecules WHERE NAME = ?", (name,))
+        cursor.execute(LOAD_ATOMS, (name,))
         atoms = cursor.fetchall() #gets all the atoms in the molecule from the database
 
-        for atom in atoms: #adds the atoms to the molecule
-            mol.append_atom(atom[1], atom[2], atom[3], atom[4])
-            
-        cursor.execute("SELECT DISTINCT Bonds.BOND_ID, A1, A2, EPAIRS FROM Bonds NATURAL JOIN MoleculeBond NATURAL JOIN Molecules WHERE NAME = ?", (name,))
-        bonds = cursor.fetchall() 
-        
-        for bond in bonds:
-            mol.append_bond(bond[1], bond[2], bond[3])
+        coords = array('d')
+        elements = bytearray()
+        for atom in atoms: #packs the atoms for the molecule
+            coords.extend((atom[1], atom[2], atom[3]))
+            elements += atom[0].encode().ljust(3, b"\0")
             
+        cursor.execute(LOAD_BONDS, (name,))
+        bonds = array('I')
+        for bond in cursor.fetchall():
+            bonds.extend(bond)
+
+        mol = MolDisplay.Molecule(len(atoms), len(bonds) // 3) #allocates the molecule once and fills it in one C call
+        mol.load(coords, elements, bonds)
         return mol #returns the molecule object with the atoms and bonds appended
         
+    @metrics.timed("db_seconds", op="molecule")
+    def molecule(self, name):
+        #the MoleculeHandle of a stored molecule, from its Molecules row alone, raises KeyError if there is no such molecule
+        row = self.conn.execute(MOLECULE_INFO, (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        name, atom_no, bond_no, structure = row[:4]
+        bounds = None if row[4] is None else row[4:10]
+        elements = None if row[10] is None else json.loads(row[10])
+        return MoleculeHandle(self, name, atom_no, bond_no, structure, bounds, elements)
+
+    def molecule_hash(self, name):
+        #the structure_hash the molecule was stored with, None for molecules stored before hashes were kept
+        return self.molecule(name).hash
+
+    @metrics.timed("db_seconds", op="load_atoms")
+    def load_atoms(self, name, start=0, stop=None, box=None):
+        #loads the atoms from index start up to stop, and the bonds between them, as a molecule of their own
+        #box is ((min x, min y, min z), (max x, max y, max z)) to keep only the atoms of the range inside it
+        #atoms keep their order and bonds are renumbered to match, nothing outside the range is read from the atom rows
+        params = {"name": name, "start": max(start, 0), "stop": sys.maxsize if stop is None else max(stop, start, 0)}
+        row = self.conn.execute(LOAD_DATA_RANGE, params).fetchone()
+        if row is not None:
+            version, coordBlob, elements, bondBlob = row
+            if version not in (1, STORAGE_VERSION):
+                raise ValueError(f"molecule '{name}' is stored in unsupported format version {version}")
+            coords, bonds = array('d'), array('I')
+            coords.frombytes(coordBlob)
+            bonds.frombytes(bondBlob)
+            if sys.byteorder == "big":
+                coords.byteswap()
+                bonds.byteswap()
+            width = 3 if version == 1 else 1
+        else:
+            coords, elements, bonds, width = array('d'), bytearray(), array('I'), 3
+            for atom in self.conn.execute(LOAD_ATOMS_RANGE, params):
+                coords.extend(atom[1:])
+                elements += atom[0].encode().ljust(3, b"\0")
+            for bond in self.conn.execute(LOAD_BONDS_RANGE, params):
+                bonds.extend(bond)
+
+        count = len(coords) // 3
+        keep = range(count)
+        if box is not None:
+            (x1, y1, z1), (x2, y2, z2) = box
+            keep = [i for i in range(count) if x1 <= coords[i*3] <= x2 and y1 <= coords[i*3+1] <= y2 and z1 <= coords[i*3+2] <= z2]
+            coords = array('d', (value for i in keep for value in coords[i*3:i*3+3]))
+            elements = b"".join(elements[i*width:i*width+width] for i in keep)
+        index = [-1] * count #the new index of each atom of the range, -1 for those outside the box
+        for new, i in enumerate(keep):
+            index[i] = new
+
+        start = params["start"]
+        subset = array('I')
+        for i in range(0, len(bonds), 3):
+            a1, a2 = bonds[i] - start, bonds[i+1] - start
+            if 0 <= a1 < count and 0 <= a2 < count and index[a1] >= 0 and index[a2] >= 0:
+                subset.extend((index[a1], index[a2], bonds[i+2]))
+
+        mol = MolDisplay.Molecule(len(keep), len(subset) // 3)
+        mol.load(coords, elements, subset)
+        return mol
+
+    def explain(self, name=None):
+        #returns the query plan of each hot query as {label: [plan lines]}, name is the molecule to plan for
+        if name is None:
+            row = self.conn.execute("SELECT NAME FROM Molecules LIMIT 1").fetchone()
+            name = row[0] if row else ""
+        queries = [("load_mol atoms", LOAD_ATOMS, (name,)), ("load_mol bonds", LOAD_BONDS, (name,)),
+                   ("load_mol columnar", LOAD_DATA, (name,)), ("getNumAtoms", NUM_ATOMS, (name,)),
+                   ("getNumBonds", NUM_BONDS, (name,)), ("molecule_table", MOLECULE_TABLE, (100, 0)),
+                   ("find_hash", FIND_HASH, ("", 0, 0)), ("molecule", MOLECULE_INFO, (name,)),
+                   ("load_atoms columnar", LOAD_DATA_RANGE, {"name": name, "start": 0, "stop": 100}),
+                   ("load_atoms atoms", LOAD_ATOMS_RANGE, {"name": name, "start": 0, "stop": 100}),
+                   ("load_atoms bonds", LOAD_BONDS_RANGE, {"name": name, "start": 0, "stop": 100})]
+        plans = {}
+        for label, query, params in queries:
+            plans[label] = [row[3] for row in self.conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+        return plans
+
+    def benchmark(self, repeat=100):
+        #times the hot queries against the molecules already in the database, returns {label: average seconds}
+        names = [row[0] for row in self.conn.execute("SELECT NAME FROM Molecules ORDER BY RANDOM() LIMIT ?", (repeat,))]
+        if not names:
+            return {}
+        timings = {}
+        for label, call in (("load_mol", self.load_mol), ("getNumAtoms", self.getNumAtoms),
+                            ("molecule_table", lambda name: self.molecule_table(100, 0))):
+            start = time.perf_counter()
+            for name in names:
+                call(name)
+            timings[label] = (time.perf_counter() - start) / len(names)
+        return timings
+
     def radius ( self ):
         cursor = self.conn.cursor()
         cursor.execute("SELECT ELEMENT_CODE, RADIUS FROM Elements")
@@ -183,14 +519,59 @@ class Database():
 
         return ''.join(finalSVGs) #returns the radial gradients concatenated as a string
 
+    @metrics.timed("db_seconds", op="element_styles")
+    def element_styles( self, version=0 ):
+        #reads the Elements table once into the registry MolDisplay renders with
+        return MolDisplay.ElementStyles(self.radius(), self.element_name(), self.radial_gradients(), version)
+
+class MoleculeHandle():
+    #a stored molecule as the metadata kept on its Molecules row, the atoms and bonds are only read by load and load_atoms
+    #bounds is (min x, min y, min z, max x, max y, max z) and elements is {element: number of atoms}
+    #both are None for molecules stored before the metadata was kept, until Database.fill_metadata is run
+    def __init__(self, db, name, atom_no, bond_no, structure, bounds, elements):
+        self.db = db
+        self.name = name
+        self.atom_no = atom_no
+        self.bond_no = bond_no
+        self.hash = structure
+        self.bounds = bounds
+        self.elements = elements
+
+    def load(self): #the whole molecule, a new MolDisplay.Molecule every call
+        return self.db.load_mol(self.name)
+
+    def load_atoms(self, start=0, stop=None, box=None): #see Database.load_atoms
+        return self.db.load_atoms(self.name, start, stop, box)
+
+class DatabasePool():
+    #gives every thread its own connection to molecules.db, opened in WAL mode so readers run in parallel with a writer
+    #writes must be made inside "with pool.write_lock:" so only one thread writes at a time
+    def __init__(self, reset=False, storage="normalized", timeout=30):
+        self.storage = storage
+        self.timeout = timeout #seconds a connection waits on a lock held by another process
+        self.write_lock = threading.Lock()
+        self.local = threading.local()
+
+        db = Database(reset=reset, storage=storage) #creates the tables once, up front
+        db.conn.execute("PRAGMA journal_mode=WAL") #persistent, every later connection opens in WAL mode
+        db.create_tables()
+        db.conn.close()
+
+    def get(self): #returns the calling thread's Database, connecting on first use
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = Database(storage=self.storage)
+            db.conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+            db.conn.execute("PRAGMA synchronous = NORMAL") #safe in WAL mode, commits don't wait on an fsync
+            self.local.db = db
+        return db
+
 if __name__ == "__main__":
     db = Database(reset=False); # or use default
-    MolDisplay.radius = db.radius();
-    MolDisplay.element_name = db.element_name();
-    MolDisplay.header += db.radial_gradients();
+    styles = db.element_styles();
     for molecule in [ 'Water', 'Caffeine', 'Isopentanol' ]:
         mol = db.load_mol( molecule );
         mol.sort();
         fp = open( molecule + ".svg", "w" );
-        fp.write( mol.svg() );
+        fp.write( mol.svg( styles ) );
         fp.close();
\ No newline at end of file
@@ -1,5 +1,5 @@
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import MolDisplay
 import io
 
@@ -62,5 +62,5 @@ home_page = """
 </html>
 """
 
-httpd = HTTPServer( ( 'localhost', int(sys.argv[1]) ), MyHandler ) #create a server
+httpd = ThreadingHTTPServer( ( 'localhost', int(sys.argv[1]) ), MyHandler ) #create a server, each request is handled on its own thread
 httpd.serve_forever() #run the server
@@ -0,0 +1,38 @@
+import unittest
+from array import array
+
+import MolDisplay
+
+# run with "python3 -m unittest test_perceive" after make, from the directory that holds _molecule.so
+
+SDF = "caffeine-3D-structure-CT1001987571(1).sdf"
+
+def load(coords, elements):
+    mol = MolDisplay.Molecule()
+    mol.load(array('d', coords), b"".join(e.encode().ljust(3, b"\0") for e in elements), array('I'))
+    return mol
+
+class TestPerceiveBonds(unittest.TestCase):
+    def test_caffeine(self):
+        with open(SDF) as fp:
+            mol = MolDisplay.Molecule().parse(fp, perceive=False)
+        bond_no = mol.bond_no
+        coords, elements, bonds = mol.pack()
+        mol = MolDisplay.Molecule()
+        mol.load(coords, elements, array('I'))
+        self.assertEqual(mol.perceive_bonds(), bond_no)
+
+    def test_negative_cutoff_is_not_a_bond(self):
+        #the cutoff of the H-H pair is 0.31 + 0.31 - 2 < 0, the Fe keeps the largest cutoff above 0
+        mol = load([0, 0, 0, 1, 0, 0, 10, 0, 0], ["H", "H", "Fe"])
+        self.assertEqual(mol.perceive_bonds(-2.0), 0)
+        self.assertEqual(mol.bond_no, 0)
+
+    def test_bad_tolerance(self):
+        mol = load([0, 0, 0, 1, 0, 0], ["H", "H"])
+        for tolerance in (float("nan"), float("inf"), -10.0):
+            with self.assertRaises(ValueError):
+                mol.perceive_bonds(tolerance)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import random
+import tempfile
+import unittest
+from array import array
+
+import MolDisplay
+import molsql
+
+# run with "python3 -m unittest test_svg" after make, from the directory that holds _molecule.so
+
+SDF = "caffeine-3D-structure-CT1001987571(1).sdf"
+
+def caffeine():
+    with open(SDF) as fp:
+        mol = MolDisplay.Molecule().parse(fp)
+    mol.sort()
+    return mol
+
+class TestRenderSize(unittest.TestCase):
+    #the server used to append db.radial_gradients() to the svg header on every POST, so each svg was bigger than the last
+    #so the styles here come from the Elements table the way ajaxserver builds them
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.workdir = tempfile.TemporaryDirectory()
+        os.chdir(self.workdir.name) #Database keeps molecules.db in the current directory
+        self.db = molsql.Database(reset=True)
+        self.db.create_tables()
+        for row in ((6, "C", "Carbon", "808080", "010101", "000000", 40), (7, "N", "Nitrogen", "0000ff", "000005", "000002", 40),
+                    (8, "O", "Oxygen", "ff0000", "050000", "020000", 40), (1, "H", "Hydrogen", "ffffff", "050505", "020202", 25)):
+            self.db["Elements"] = row
+        with open(os.path.join(self.cwd, SDF)) as fp:
+            self.db.add_molecule("Caffeine", fp)
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.workdir.cleanup()
+
+    def test_size_constant_across_renders(self):
+        styles = self.db.element_styles()
+        header = styles.header
+        mol = self.db.load_mol("Caffeine")
+        mol.sort()
+        sizes = set()
+        for i in range(20):
+            sizes.add(len(mol.svg(styles)))
+            self.assertEqual(styles.header, header)
+            if i % 5 == 4: #rebuilt the way the server's elements_changed does after /add or /remove
+                styles = self.db.element_styles(styles.version + 1)
+                self.assertEqual(styles.header, header)
+        self.assertEqual(len(sizes), 1)
+        mol = self.db.load_mol("Caffeine") #a fresh molecule renders to the same size too
+        mol.sort()
+        self.assertEqual(len(mol.svg(styles)), sizes.pop())
+
+class TestRenderIsPure(unittest.TestCase):
+    #rendering used to write the screen coordinates back into the C structs, so a second render gave garbage
+    def setUp(self):
+        self.styles = MolDisplay.ElementStyles({"C": 40, "N": 35}, {"C": "Carbon", "N": "Nitrogen"}, "", 1)
+
+    def test_render_twice(self):
+        mol = caffeine()
+        self.assertEqual(mol.svg(self.styles), mol.svg(self.styles))
+
+    def test_rotate_and_back(self):
+        mol = caffeine()
+        first = mol.svg(self.styles)
+        mol.rotate(0, 90, 0)
+        mol.sort()
+        self.assertNotEqual(mol.svg(self.styles), first)
+        mol.rotate(0, -90, 0)
+        mol.sort()
+        self.assertEqual(mol.svg(self.styles), first)
+
+@unittest.skipIf(MolDisplay.np is None, "the numpy engine needs numpy")
+class TestNumpyEngine(unittest.TestCase):
+    #the numpy engine promises the same svg as the python engine, byte for byte
+    def setUp(self):
+        self.styles = MolDisplay.ElementStyles({"C": 40, "N": 35, "O": 40, "H": 25}, {"C": "Carbon", "N": "Nitrogen", "O": "Oxygen", "H": "Hydrogen"}, "", 1)
+
+    def test_caffeine(self):
+        mol = caffeine()
+        self.assertEqual(mol.svg(self.styles, "numpy"), mol.svg(self.styles))
+
+    def test_unsorted_with_tied_z(self):
+        #never sorted, and z only takes three values, so the merge of atoms and bonds has to break ties the same way
+        rng = random.Random(7)
+        atom_no, bond_no = 300, 400
+        coords = array('d')
+        for i in range(atom_no):
+            coords.extend((rng.uniform(-5, 5), rng.uniform(-5, 5), rng.choice((-1.0, 0.0, 1.0))))
+        elements = b"".join(rng.choice((b"C\0\0", b"N\0\0", b"O\0\0", b"H\0\0", b"Xx\0")) for i in range(atom_no))
+        bonds = array('I')
+        for i in range(bond_no):
+            bonds.extend((rng.randrange(atom_no), rng.randrange(atom_no), rng.randint(1, 3)))
+        mol = MolDisplay.Molecule()
+        mol.load(coords, elements, bonds)
+        self.assertEqual(mol.svg(self.styles, "numpy"), mol.svg(self.styles))
+
+if __name__ == "__main__":
+    unittest.main()